@@ -8,10 +8,12 @@ collecting user feedback, and comparing results.
 import time
 import uuid
 import click
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich import print as rprint
@@ -28,6 +30,11 @@ from config.settings import settings
 
 console = Console()
 
+_SEP = "=" * 80
+
+# Variant descriptions are static; memoize lookups made on every table row
+_desc = lru_cache(maxsize=32)(get_variant_description)
+
 
 @click.group(name="ab-test")
 def ab_test():
@@ -89,13 +96,15 @@ def run(variant: str, questions_file: Optional[str], count: int, session_id: Opt
 
     # Show variant description
     console.print(f"\n[bold cyan]Variant Description:[/bold cyan]")
-    console.print(f"  {get_variant_description(variant)}\n")
+    console.print(f"  {_desc(variant)}\n")
 
     # Get questions
     if questions_file:
         console.print(f"[dim]Loading questions from: {questions_file}[/dim]\n")
         with open(questions_file) as f:
-            questions = [line.strip() for line in f if line.strip()][:count]
+            # Stop reading as soon as `count` non-empty lines are collected
+            stripped = (line.strip() for line in f)
+            questions = list(islice((q for q in stripped if q), count))
     else:
         questions = []
         console.print("[bold]Interactive Mode[/bold]\n")
@@ -109,96 +118,108 @@ def run(variant: str, questions_file: Optional[str], count: int, session_id: Opt
         console.print("[yellow]No questions to process. Exiting.[/yellow]")
         return
 
+    # The variant is fixed for the session, so build the workflow once
+    try:
+        workflow = AgenticRAGWorkflow(prompt_variant=variant)
+    except Exception as e:
+        console.print(f"\n[red]Error initializing workflow: {e}[/red]")
+        return
+
+    # Results are buffered and flushed in a single transaction at the end
+    pending_rows = []
+
     # Process each question
-    for i, question in enumerate(questions, 1):
-        console.print(f"\n{'=' * 80}")
-        console.print(f"[bold]Question {i}/{len(question)}:[/bold] {question}")
-        console.print('=' * 80)
-
-        try:
-            # Create workflow with variant
-            workflow = AgenticRAGWorkflow(prompt_variant=variant)
-
-            # Run and time it
-            start = time.time()
-            result = workflow.run(question)
-            exec_time = int((time.time() - start) * 1000)
-
-            answer = result.get("generation", "")
-
-            # Display answer
-            console.print(f"\n[green]Answer:[/green]")
-            console.print(Panel(answer, title="Generated Answer", border_style="green"))
-
-            # Display metadata
-            console.print(f"\n[dim]Metadata:[/dim]")
-            console.print(f"  Documents retrieved: {len(result.get('documents', []))}")
-            console.print(f"  Relevant documents: {sum(1 for s in result.get('relevance_scores', []) if s == 'yes')}")
-            console.print(f"  Execution time: {exec_time}ms")
-            console.print(f"  Web search used: {result.get('web_search')}")
-            console.print(f"  Query retries: {result.get('retry_count', 0)}")
-
-            # Collect user feedback
-            console.print(f"\n[bold yellow]Please rate this answer:[/bold yellow]")
-            rating_input = console.input(
-                "  Rating (1-5, or 0 to skip): "
-            )
+    try:
+        for i, question in enumerate(questions, 1):
+            console.print(f"\n{_SEP}")
+            console.print(f"[bold]Question {i}/{len(questions)}:[/bold] {question}")
+            console.print(_SEP)
+
             try:
-                rating = int(rating_input) if rating_input else None
-                if rating and not 1 <= rating <= 5:
-                    console.print("[dim]Invalid rating. Skipping feedback.[/dim]")
-                    rating = None
-            except ValueError:
-                console.print("[dim]Invalid input. Skipping feedback.[/dim]")
-                rating = None
-
-            feedback = None
-            if rating:
-                feedback_input = console.input(
-                    "  Additional feedback (optional, press Enter to skip): "
+                # Run and time it
+                start = time.time()
+                result = workflow.run(question)
+                exec_time = int((time.time() - start) * 1000)
+
+                answer = result.get("generation", "")
+                documents_retrieved = len(result.get("documents") or [])
+                relevant_documents = sum(1 for s in result.get("relevance_scores") or [] if s == "yes")
+                web_search = result.get("web_search_needed", "No")
+                query_retries = result.get("retry_count", 0)
+
+                # Display answer
+                console.print(f"\n[green]Answer:[/green]")
+                console.print(Panel(answer, title="Generated Answer", border_style="green"))
+
+                # Display metadata
+                console.print(f"\n[dim]Metadata:[/dim]")
+                console.print(f"  Documents retrieved: {documents_retrieved}")
+                console.print(f"  Relevant documents: {relevant_documents}")
+                console.print(f"  Execution time: {exec_time}ms")
+                console.print(f"  Web search used: {web_search}")
+                console.print(f"  Query retries: {query_retries}")
+
+                # Collect user feedback
+                console.print(f"\n[bold yellow]Please rate this answer:[/bold yellow]")
+                rating_input = console.input(
+                    "  Rating (1-5, or 0 to skip): "
                 )
-                feedback = feedback_input or None
-
-            # Save to database
-            db.save_test_run({
-                "prompt_variant": variant,
-                "question": question,
-                "answer": answer,
-                "user_rating": rating,
-                "user_feedback": feedback,
-                "documents_retrieved": len(result.get("documents", [])),
-                "relevant_documents": sum(1 for s in result.get("relevance_scores", []) if s == "yes"),
-                "web_search_used": result.get("web_search_needed") == "Yes",
-                "query_retries": result.get("retry_count", 0),
-                "hallucination_check": result.get("hallucination_check"),
-                "usefulness_check": result.get("usefulness_check"),
-                "execution_time_ms": exec_time,
-                "session_id": session_id
-            })
-
-            console.print(f"\n[dim]✓ Saved to database[/dim]")
-
-        except Exception as e:
-            console.print(f"\n[red]Error processing question: {e}[/red]")
-            continue
+                try:
+                    rating = int(rating_input) if rating_input else None
+                    if rating and not 1 <= rating <= 5:
+                        console.print("[dim]Invalid rating. Skipping feedback.[/dim]")
+                        rating = None
+                except ValueError:
+                    console.print("[dim]Invalid input. Skipping feedback.[/dim]")
+                    rating = None
+
+                feedback = None
+                if rating:
+                    feedback_input = console.input(
+                        "  Additional feedback (optional, press Enter to skip): "
+                    )
+                    feedback = feedback_input or None
+
+                # Queue for saving (written in one transaction after the loop)
+                pending_rows.append({
+                    "prompt_variant": variant,
+                    "question": question,
+                    "answer": answer,
+                    "user_rating": rating,
+                    "user_feedback": feedback,
+                    "documents_retrieved": documents_retrieved,
+                    "relevant_documents": relevant_documents,
+                    "web_search_used": web_search == "Yes",
+                    "query_retries": query_retries,
+                    "hallucination_check": result.get("hallucination_check"),
+                    "usefulness_check": result.get("usefulness_check"),
+                    "execution_time_ms": exec_time,
+                    "session_id": session_id
+                })
+
+            except Exception as e:
+                console.print(f"\n[red]Error processing question: {e}[/red]")
+                continue
+    finally:
+        if pending_rows:
+            db.save_test_runs_batch(pending_rows)
+            console.print(f"\n[dim]✓ Saved {len(pending_rows)} run(s) to database[/dim]")
 
     # Display summary
-    console.print(f"\n{'=' * 80}")
+    console.print(f"\n{_SEP}")
     console.print(f"[bold green]Test session complete![/bold green]")
-    console.print(f"{'=' * 80}")
+    console.print(_SEP)
     console.print(f"Session ID: [bold]{session_id}[/bold]")
     console.print(f"Variant: [bold]{variant}[/bold]")
     console.print(f"Processed: [bold]{len(questions)}[/bold] questions\n")
 
     # Show stats for this session
-    session_runs = db.get_session_runs(session_id)
-    rated_runs = [r for r in session_runs if r.get("user_rating")]
-    if rated_runs:
-        avg_rating = sum(r["user_rating"] for r in rated_runs) / len(rated_runs)
+    summary = db.get_session_summary(session_id)
+    if summary["rated_runs"]:
         console.print(f"[cyan]Session Statistics:[/cyan]")
-        console.print(f"  Total runs: {len(session_runs)}")
-        console.print(f"  Rated runs: {len(rated_runs)}")
-        console.print(f"  Average rating: {avg_rating:.2f}/5\n")
+        console.print(f"  Total runs: {summary['total_runs']}")
+        console.print(f"  Rated runs: {summary['rated_runs']}")
+        console.print(f"  Average rating: {summary['avg_rating']:.2f}/5\n")
 
 
 @ab_test.command()
@@ -217,10 +238,10 @@ def compare(variant1: str, variant2: str):
     """
     db = ABTestDatabase(settings.AB_TEST_RESULTS_DB)
 
-    console.print(Panel.fit(
+    header = Panel.fit(
         f"[bold]Comparing variants:[/bold] {variant1} vs {variant2}",
         title="Variant Comparison"
-    ))
+    )
 
     comparison = db.compare_variants(variant1, variant2)
 
@@ -264,12 +285,15 @@ def compare(variant1: str, variant2: str):
         "-"
     )
 
-    console.print("\n", table)
-
-    # Show variant descriptions
-    console.print(f"\n[bold cyan]Variant Descriptions:[/bold cyan]")
-    console.print(f"  {variant1}: {get_variant_description(variant1)}")
-    console.print(f"  {variant2}: {get_variant_description(variant2)}\n")
+    # Render header, table and variant descriptions in a single write
+    console.print(Group(
+        header,
+        "",
+        table,
+        "\n[bold cyan]Variant Descriptions:[/bold cyan]",
+        f"  {variant1}: {_desc(variant1)}",
+        f"  {variant2}: {_desc(variant2)}\n"
+    ))
 
 
 @ab_test.command()
@@ -287,10 +311,10 @@ def stats():
 
     all_stats = db.get_all_variant_stats()
 
-    console.print(Panel.fit(
+    header = Panel.fit(
         "[bold]A/B Test Statistics for All Variants[/bold]",
         title="Statistics"
-    ))
+    )
 
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Variant", style="cyan")
@@ -301,16 +325,18 @@ def stats():
     table.add_column("Description", style="dim")
 
     for variant, stats in all_stats.items():
+        avg_rating = stats["avg_rating"]
+        avg_time = stats["avg_time_ms"]
         table.add_row(
             variant,
             str(stats["total_runs"]),
             str(stats["rated_runs"]),
-            f"{stats['avg_rating']:.2f}" if stats['avg_rating'] else "N/A",
-            f"{stats['avg_time_ms']:.0f}" if stats['avg_time_ms'] else "N/A",
-            get_variant_description(variant)
+            f"{avg_rating:.2f}" if avg_rating else "N/A",
+            f"{avg_time:.0f}" if avg_time else "N/A",
+            _desc(variant)
         )
 
-    console.print("\n", table)
+    console.print(Group(header, "", table))
 
 
 @ab_test.command()
@@ -348,10 +374,10 @@ def recent(limit: int, variant: Optional[str]):
     if variant:
         title += f" ({variant})"
 
-    console.print(Panel.fit(
+    header = Panel.fit(
         f"[bold]{title}[/bold]",
         title="Recent Runs"
-    ))
+    )
 
     table = Table(show_header=True, header_style="bold magenta", show_lines=True)
     table.add_column("ID", style="cyan", width=6)
@@ -362,9 +388,12 @@ def recent(limit: int, variant: Optional[str]):
     table.add_column("Session", style="dim", width=10)
 
     for run in runs:
-        question_preview = run["question"][:37] + "..." if len(run["question"]) > 40 else run["question"]
-        rating = str(run["user_rating"]) if run["user_rating"] else "-"
-        exec_time = str(run["execution_time_ms"]) if run["execution_time_ms"] else "N/A"
+        question = run["question"]
+        question_preview = question[:37] + "..." if len(question) > 40 else question
+        user_rating = run["user_rating"]
+        execution_time_ms = run["execution_time_ms"]
+        rating = str(user_rating) if user_rating else "-"
+        exec_time = str(execution_time_ms) if execution_time_ms else "N/A"
 
         table.add_row(
             str(run["id"]),
@@ -375,7 +404,7 @@ def recent(limit: int, variant: Optional[str]):
             run["session_id"] or "-"
         )
 
-    console.print("\n", table)
+    console.print(Group(header, "", table))
 
 
 @ab_test.command()
@@ -386,10 +415,10 @@ def variants():
     Example:
         rag-cli ab-test variants
     """
-    console.print(Panel.fit(
+    header = Panel.fit(
         "[bold]Available Prompt Variants[/bold]",
         title="Variants"
-    ))
+    )
 
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Variant", style="cyan", width=15)
@@ -398,10 +427,10 @@ def variants():
     for variant_name in list_prompt_variants():
         table.add_row(
             variant_name,
-            get_variant_description(variant_name)
+            _desc(variant_name)
         )
 
-    console.print("\n", table)
+    console.print(Group(header, "", table))
 
 
 if __name__ == "__main__":
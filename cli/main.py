@@ -5,10 +5,14 @@ This module provides a user-friendly CLI for interacting with the
 Agentic RAG system using Click and Rich for beautiful terminal output.
 """
 
+import importlib
 import logging
 import sys
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 from rich.console import Console
@@ -23,13 +27,13 @@ from rich.text import Text
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.graph.workflow import AgenticRAGWorkflow
-from src.loaders.document_loader import DocumentLoader
-from src.vectorstore.chroma_store import get_vector_store, add_documents
 from config.settings import settings
 
-# Import A/B test commands
-from cli.ab_test_commands import ab_test
+# Workflow, loader and vector store modules pull in LangChain, Chroma and the
+# Ollama clients, so they are imported inside the commands that need them to
+# keep --help and status fast
+if TYPE_CHECKING:
+    from src.graph.workflow import AgenticRAGWorkflow
 
 
 # Initialize Rich console
@@ -42,6 +46,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Canned questions used by the test command
+_SAMPLE_QUESTIONS = (
+    "What is Agentic RAG?",
+    "How does document grading work?",
+    "What are the main components?",
+)
+
+# Interactive mode commands that end the session
+_EXIT_COMMANDS = frozenset({"/exit", "/quit", "/q"})
+
+# Icons shown next to each node while streaming
+_NODE_ICONS = {
+    "retrieve": "📚",
+    "grade_documents": "✅",
+    "generate": "💡",
+    "transform_query": "🔄",
+    "check_hallucination": "🔍",
+    "check_usefulness": "🎯",
+}
+_DEFAULT_ICON = "⚙️"
+
+# Ollama health probe results are reused for this many seconds
+_PROBE_TTL_SECONDS = 2
+_http_session = None
+
+
+def _get_http_session():
+    """Return a shared requests session so repeated probes reuse connections."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+    return _http_session
+
+
+@lru_cache(maxsize=1)
+def _probe_ollama(base_url: str, time_bucket: int) -> Optional[bool]:
+    """
+    Check whether the Ollama server responds.
+
+    Results are cached per (base_url, time_bucket); callers pass the current
+    time divided by _PROBE_TTL_SECONDS so the cache expires on its own.
+
+    Returns:
+        True if /api/tags returned 200, False on any other status,
+        None if the server could not be reached
+    """
+    try:
+        response = _get_http_session().get(f"{base_url}/api/tags", timeout=2)
+    except Exception:
+        return None
+    return response.status_code == 200
+
+
+class LazyGroup(click.Group):
+    """
+    Command group whose subcommands are imported on first use.
+
+    The real group is resolved from an "module:attribute" path only when
+    its subcommands are listed or invoked, so the top-level help does not
+    pay for importing it.
+    """
+
+    def __init__(self, name: str, import_path: str, **kwargs):
+        super().__init__(name=name, **kwargs)
+        self._import_path = import_path
+        self._group: Optional[click.Group] = None
+
+    def _load(self) -> click.Group:
+        """Import and cache the real command group."""
+        if self._group is None:
+            module_name, attr = self._import_path.split(":")
+            self._group = getattr(importlib.import_module(module_name), attr)
+        return self._group
+
+    def list_commands(self, ctx: click.Context):
+        return self._load().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        return self._load().get_command(ctx, cmd_name)
+
 
 @click.group()
 @click.version_option(version="1.0.0")
@@ -54,8 +139,12 @@ def cli():
     pass
 
 
-# Add A/B test command group
-cli.add_command(ab_test)
+# Add A/B test command group (loaded on first ab-test invocation)
+cli.add_command(LazyGroup(
+    "ab-test",
+    "cli.ab_test_commands:ab_test",
+    help="A/B testing commands for prompt variant comparison."
+))
 
 
 @cli.command()
@@ -85,8 +174,14 @@ def interactive_mode(verbose: bool = False, stream: bool = False):
         border_style="cyan"
     ))
 
+    from src.graph.workflow import AgenticRAGWorkflow
+    from src.agents.graders import warmup
+
     rag = None
     try:
+        # Load the grading model while the user types the first question
+        threading.Thread(target=warmup, name="grader-warmup", daemon=True).start()
+
         # Initialize workflow once
         with console.status("[bold cyan]Initializing Agentic RAG System...[/bold cyan]"):
             rag = AgenticRAGWorkflow()
@@ -102,20 +197,21 @@ def interactive_mode(verbose: bool = False, stream: bool = False):
                     continue
 
                 # Handle commands
-                if question.lower() in ['/exit', '/quit', '/q']:
+                command = question.lower()
+                if command in _EXIT_COMMANDS:
                     console.print("[cyan]Goodbye! 👋[/cyan]")
                     break
 
-                if question.lower() == '/clear':
+                if command == '/clear':
                     console.clear()
                     continue
 
-                if question.lower() == '/verbose':
+                if command == '/verbose':
                     verbose = not verbose
                     console.print(f"[cyan]Verbose mode: {'enabled' if verbose else 'disabled'}[/cyan]")
                     continue
 
-                if question.lower() == '/stream':
+                if command == '/stream':
                     stream = not stream
                     console.print(f"[cyan]Stream mode: {'enabled' if stream else 'disabled'}[/cyan]")
                     continue
@@ -135,7 +231,7 @@ def interactive_mode(verbose: bool = False, stream: bool = False):
         sys.exit(1)
 
 
-def ask_question(question: str, verbose: bool = False, stream: bool = False, rag: Optional[AgenticRAGWorkflow] = None):
+def ask_question(question: str, verbose: bool = False, stream: bool = False, rag: Optional["AgenticRAGWorkflow"] = None):
     """
     Process a single question through the RAG system.
 
@@ -155,6 +251,8 @@ def ask_question(question: str, verbose: bool = False, stream: bool = False, rag
     try:
         # Initialize workflow if not provided
         if rag is None:
+            from src.graph.workflow import AgenticRAGWorkflow
+
             with console.status("[bold cyan]Initializing system...[/bold cyan]"):
                 rag = AgenticRAGWorkflow()
 
@@ -162,12 +260,26 @@ def ask_question(question: str, verbose: bool = False, stream: bool = False, rag
             # Stream execution
             console.print("\n[bold]Executing workflow:[/bold]\n")
 
-            for event in rag.stream(question):
+            last_state = {}
+            streaming_tokens = False
+            for kind, event in rag.stream_answer(question):
+                # Print answer tokens as the generate node produces them
+                if kind == "token":
+                    if not streaming_tokens:
+                        console.print("[dim]  └─ [/dim]", end="")
+                        streaming_tokens = True
+                    console.print(event, end="", markup=False, highlight=False)
+                    continue
+
+                if streaming_tokens:
+                    console.print("\n")
+                    streaming_tokens = False
+
                 for node_name, state in event.items():
+                    last_state = state
+
                     # Show node execution
-                    icon = {"retrieve": "📚", "grade_documents": "✅",
-                           "generate": "💡", "transform_query": "🔄",
-                           "check_hallucination": "🔍", "check_usefulness": "🎯"}.get(node_name, "⚙️")
+                    icon = _NODE_ICONS.get(node_name, _DEFAULT_ICON)
 
                     console.print(f"{icon} [bold cyan]{node_name}[/bold cyan]")
 
@@ -187,18 +299,18 @@ def ask_question(question: str, verbose: bool = False, stream: bool = False, rag
 
                         if 'hallucination_check' in state and state['hallucination_check']:
                             grounded = state['hallucination_check']
-                            icon = "✓" if grounded == "grounded" else "✗"
-                            console.print(f"  └─ Grounded: {icon} {grounded}")
+                            mark = "✓" if grounded == "grounded" else "✗"
+                            console.print(f"  └─ Grounded: {mark} {grounded}")
 
                         if 'usefulness_check' in state and state['usefulness_check']:
                             useful = state['usefulness_check']
-                            icon = "✓" if useful == "useful" else "✗"
-                            console.print(f"  └─ Useful: {icon} {useful}")
+                            mark = "✓" if useful == "useful" else "✗"
+                            console.print(f"  └─ Useful: {mark} {useful}")
 
                     console.print()
 
-            # Get final result
-            result = event[list(event.keys())[-1]]  # Last state in stream
+            # Get final result (empty if the stream yielded no events)
+            result = last_state
         else:
             # Run without streaming (show progress)
             with Progress(
@@ -251,23 +363,26 @@ def display_result(result: dict, verbose: bool = False):
         table.add_column("Field", style="cyan")
         table.add_column("Value", style="yellow")
 
-        table.add_row("Documents Retrieved", str(len(result.get('documents', []))))
-        table.add_row("Relevant Documents",
-                      str(sum(1 for s in result.get('relevance_scores', []) if s == 'yes')) + "/" + str(len(result.get('relevance_scores', []))))
+        documents = result.get('documents') or []
+        relevance_scores = result.get('relevance_scores') or []
+        relevant = sum(1 for s in relevance_scores if s == 'yes')
+
+        table.add_row("Documents Retrieved", str(len(documents)))
+        table.add_row("Relevant Documents", f"{relevant}/{len(relevance_scores)}")
         table.add_row("Query Retries", str(result.get('retry_count', 0)))
-        table.add_row("Web Search Used", result.get('web_search', 'No'))
+        table.add_row("Web Search Used", result.get('web_search_needed', 'No'))
         table.add_row("Hallucination Check", result.get('hallucination_check', 'N/A'))
         table.add_row("Usefulness Check", result.get('usefulness_check', 'N/A'))
 
         console.print(table)
 
         # Show sources if available
-        documents = result.get('documents', [])
-        if documents and len(documents) > 0:
+        if documents:
             console.print("\n[bold]Sources:[/bold]")
             for i, doc in enumerate(documents[:3], 1):  # Show top 3
-                source = doc.metadata.get('source', 'Unknown')
-                title = doc.metadata.get('title', source)
+                metadata = doc.metadata
+                source = metadata.get('source', 'Unknown')
+                title = metadata.get('title', source)
                 console.print(f"  {i}. [link]{title}[/link]")
                 console.print(f"     Source: {source}")
 
@@ -283,6 +398,9 @@ def load(path: str, chunk_size: int, chunk_overlap: int):
     PATH can be a file or directory containing documents.
     Supported formats: PDF, Markdown, Plain Text
     """
+    from src.loaders.document_loader import DocumentLoader
+    from src.vectorstore.ingest import ingest_documents
+
     console.print(f"[cyan]Loading documents from:[/cyan] {path}\n")
 
     try:
@@ -312,15 +430,28 @@ def load(path: str, chunk_size: int, chunk_overlap: int):
             documents = loader.chunk_documents(raw_documents)
 
             progress.update(task1, completed=True)
-            task2 = progress.add_task("Indexing documents...", total=None)
-
-            # Initialize vectorstore and add documents
-            vectorstore = get_vector_store()
-
-            # Add documents to vectorstore
-            add_documents(documents)
-
-            progress.update(task2, completed=True)
+            total = len(documents)
+            task2 = progress.add_task(f"Indexing documents... 0/{total}", total=total)
+
+            # Index in bounded batches (see ingest_documents); progress is
+            # redrawn only about once per 1% of the total
+            indexed = 0
+            pending = 0
+            update_every = max(1, total // 100)
+
+            def advance(n: int):
+                nonlocal indexed, pending
+                indexed += n
+                pending += n
+                if pending >= update_every or indexed == total:
+                    progress.update(
+                        task2,
+                        advance=pending,
+                        description=f"Indexing documents... {indexed}/{total}"
+                    )
+                    pending = 0
+
+            ingest_documents(documents, on_progress=advance)
 
         console.print(f"[green]✓[/green] Successfully loaded [bold green]{len(documents)}[/bold green] document chunks")
         console.print(f"[green]✓[/green] Vector store updated: [bold]{settings.CHROMA_PERSIST_DIR}[/bold]")
@@ -345,14 +476,16 @@ def status():
         table.add_column("Details", style="yellow")
 
         # Ollama status
-        try:
-            import requests
-            response = requests.get(f"{settings.OLLAMA_BASE_URL}/api/tags", timeout=2)
-            ollama_status = "✅ Running" if response.status_code == 200 else "❌ Error"
-            ollama_details = f"{settings.OLLAMA_BASE_URL}"
-        except:
+        ollama_ok = _probe_ollama(
+            settings.OLLAMA_BASE_URL,
+            int(time.time()) // _PROBE_TTL_SECONDS
+        )
+        if ollama_ok is None:
             ollama_status = "❌ Not Running"
             ollama_details = "Start with: ollama serve"
+        else:
+            ollama_status = "✅ Running" if ollama_ok else "❌ Error"
+            ollama_details = f"{settings.OLLAMA_BASE_URL}"
 
         table.add_row("Ollama", ollama_status, ollama_details)
 
@@ -420,8 +553,8 @@ def status():
 
         # Workflow info
         console.print("\n[bold]Workflow Graph:[/bold]")
-        rag = AgenticRAGWorkflow()
-        info = rag.get_graph_info()
+        from src.graph.workflow import AgenticRAGWorkflow
+        info = AgenticRAGWorkflow.describe_graph()
 
         console.print(f"  Nodes: {len(info['nodes'])}")
         for node in info['nodes']:
@@ -469,13 +602,7 @@ def test(count: int):
     """
     Run sample questions to test the system.
     """
-    sample_questions = [
-        "What is Agentic RAG?",
-        "How does document grading work?",
-        "What are the main components?",
-    ]
-
-    questions = sample_questions[:count]
+    questions = _SAMPLE_QUESTIONS[:count]
 
     console.print(Panel(
         f"[bold cyan]Running {len(questions)} test questions...[/bold cyan]",
@@ -483,6 +610,8 @@ def test(count: int):
         border_style="cyan"
     ))
 
+    from src.graph.workflow import AgenticRAGWorkflow
+
     rag = None
     try:
         with console.status("[bold cyan]Initializing system...[/bold cyan]"):
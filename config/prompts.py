@@ -7,13 +7,11 @@ Each prompt has a specific purpose in the agentic workflow.
 
 # ==================== Document Relevance Grading ====================
 
+# The fixed instructions and the question come before the document, so every
+# document graded for a question shares the same prompt prefix and Ollama can
+# reuse its cached KV state instead of prefilling the whole prompt again.
 RELEVANCE_GRADER_PROMPT = """You are a grader assessing relevance of a retrieved document to a user question.
 
-Retrieved document:
-{document}
-
-User question: {question}
-
 If the document contains keyword(s) or semantic meaning related to the question, grade it as relevant.
 Give a binary score 'yes' or 'no' to indicate whether the document is relevant to the question.
 
@@ -23,6 +21,30 @@ Example output format:
 {{"score": "yes"}}
 or
 {{"score": "no"}}
+
+User question: {question}
+
+Retrieved document:
+{document}
+"""
+
+
+# Grades several documents in one request; {documents} holds the documents
+# numbered [1]..[K]
+RELEVANCE_GRADER_BATCH_PROMPT = """You are a grader assessing relevance of retrieved documents to a user question.
+
+If a document contains keyword(s) or semantic meaning related to the question, grade it as relevant.
+Give each document a binary score 'yes' or 'no' to indicate whether it is relevant to the question.
+
+Provide the scores as a JSON with a single key 'scores' holding one score per document, in document order, and no preamble or explanation.
+
+Example output format for three documents:
+{{"scores": ["yes", "no", "yes"]}}
+
+User question: {question}
+
+Retrieved documents:
+{documents}
 """
 
 
@@ -116,6 +138,7 @@ Provide only the search query with no preamble or explanation.
 
 PROMPT_DESCRIPTIONS = {
     "RELEVANCE_GRADER_PROMPT": "Evaluates if a retrieved document is relevant to the user's question (binary yes/no)",
+    "RELEVANCE_GRADER_BATCH_PROMPT": "Grades several numbered documents for relevance in a single request",
     "HALLUCINATION_GRADER_PROMPT": "Checks if the generated answer is grounded in the source documents",
     "ANSWER_GRADER_PROMPT": "Assesses if the answer addresses the user's question",
     "QUERY_REWRITER_PROMPT": "Rewrites vague queries to improve retrieval quality",
@@ -148,6 +171,7 @@ if __name__ == "__main__":
 
     prompts = {
         "Relevance Grader": RELEVANCE_GRADER_PROMPT,
+        "Relevance Grader (Batch)": RELEVANCE_GRADER_BATCH_PROMPT,
         "Hallucination Grader": HALLUCINATION_GRADER_PROMPT,
         "Answer Grader": ANSWER_GRADER_PROMPT,
         "Query Rewriter": QUERY_REWRITER_PROMPT,
@@ -74,6 +74,10 @@ class Settings(BaseSettings):
         default_factory=get_ollama_base_url,
         description="Base URL for Ollama API (auto-detects DevContainer)"
     )
+    OLLAMA_KEEP_ALIVE: str = Field(
+        default="30m",
+        description="How long Ollama keeps grading models (and their prompt cache) loaded"
+    )
     EMBEDDING_MODEL: str = Field(
         default="nomic-embed-text",
         description="Ollama model for embeddings (1024 dimensions)"
@@ -82,10 +86,22 @@ class Settings(BaseSettings):
         default="qwen3:30b",
         description="Ollama model for text generation"
     )
+    GENERATION_MODEL_LIGHT: str = Field(
+        default="",
+        description="Smaller Ollama model for answer regenerations (empty uses GENERATION_MODEL)"
+    )
     GRADING_MODEL: str = Field(
         default="qwen3:30b",
         description="Ollama model for grading tasks (can use smaller model)"
     )
+    GRADING_MODEL_SMALL: str = Field(
+        default="",
+        description="Small quantized Ollama model for yes/no grading (empty uses GRADING_MODEL)"
+    )
+    REWRITER_MODEL: str = Field(
+        default="",
+        description="Ollama model for query rewriting (empty uses GRADING_MODEL)"
+    )
 
     # ChromaDB Configuration
     CHROMA_PERSIST_DIR: str = Field(
@@ -96,6 +112,14 @@ class Settings(BaseSettings):
         default="agentic_rag",
         description="ChromaDB collection name"
     )
+    EMBEDDING_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache document embeddings on disk so unchanged chunks are not re-embedded"
+    )
+    EMBEDDING_CACHE_DIR: str = Field(
+        default="./data/embedding_cache",
+        description="Directory for the document embedding cache"
+    )
 
     # Retrieval Settings
     RETRIEVAL_K: int = Field(
@@ -116,12 +140,48 @@ class Settings(BaseSettings):
         le=1000,
         description="Character overlap between chunks"
     )
+    MIN_CHUNK_CHARS: int = Field(
+        default=32,
+        ge=0,
+        le=1000,
+        description="Chunks shorter than this after stripping whitespace are not embedded"
+    )
+    LOAD_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for parsing document files (0 = CPU count)"
+    )
+    EMBED_BATCH_SIZE: int = Field(
+        default=0,
+        ge=0,
+        le=5000,
+        description="Number of chunk texts sent per embedding request (0 = derive from the embedding dimension)"
+    )
+    UPSERT_BATCH_SIZE: int = Field(
+        default=512,
+        ge=1,
+        le=5000,
+        description="Number of chunks written to the vector store per batch"
+    )
+    EMBED_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Concurrent embedding requests during document ingestion"
+    )
     MAX_RETRIES: int = Field(
         default=3,
         ge=1,
         le=10,
         description="Maximum query rewrite attempts"
     )
+    REWRITER_MIN_SPECIFIC_WORDS: int = Field(
+        default=12,
+        ge=0,
+        le=100,
+        description="Questions with at least this many words and no vague pronoun subject skip the rewrite LLM call (0 always rewrites)"
+    )
     MAX_REGENERATIONS: int = Field(
         default=3,
         ge=1,
@@ -146,6 +206,42 @@ class Settings(BaseSettings):
         le=10,
         description="Maximum web search results to retrieve"
     )
+    WEB_SEARCH_PREFETCH: bool = Field(
+        default=False,
+        description="Start a web search alongside retrieval so it is ready if grading falls back to it"
+    )
+    FAST_QUERY_OPT: bool = Field(
+        default=True,
+        description="Turn short questions into web search queries by dropping stopwords instead of calling the LLM"
+    )
+    WEB_QUERY_OPT_ADAPTIVE: bool = Field(
+        default=True,
+        description="Stop calling the query LLM while its queries rarely differ from the questions' keywords"
+    )
+    WEB_QUERY_CACHE: bool = Field(
+        default=True,
+        description="Reuse optimized web search queries for near-identical questions"
+    )
+    WEB_QUERY_CACHE_SIMILARITY: float = Field(
+        default=0.95,
+        ge=0.5,
+        le=1.0,
+        description="Minimum cosine similarity between questions for a cached search query to be reused"
+    )
+    WEB_QUERY_CACHE_PERSIST: bool = Field(
+        default=False,
+        description="Also keep optimized search queries in a ChromaDB collection so they survive restarts (needs WEB_QUERY_CACHE)"
+    )
+    WEB_QUERY_CACHE_PERSIST_TTL_SECONDS: float = Field(
+        default=604800.0,
+        gt=0.0,
+        description="How long a persisted search query stays valid (default: 7 days)"
+    )
+    WEB_RESULT_CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        ge=0.0,
+        description="How long results of a search query are reused (0 disables the result cache)"
+    )
 
     # A/B Testing Configuration
     AB_TEST_ENABLED: bool = Field(
@@ -192,6 +288,75 @@ class Settings(BaseSettings):
         le=1.0,
         description="Temperature for grading model"
     )
+    GRADING_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Concurrent grading requests (match Ollama's OLLAMA_NUM_PARALLEL)"
+    )
+    GRADER_BATCH_SIZE: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Documents graded per request by grade_batch_single_call"
+    )
+    GRADER_MAX_DOC_CHARS: int = Field(
+        default=4000,
+        ge=0,
+        le=100000,
+        description="Characters of each document sent to the relevance and hallucination graders (0 disables truncation)"
+    )
+    HALLUCINATION_MAX_CHARS: int = Field(
+        default=16000,
+        ge=0,
+        le=400000,
+        description="Total characters of context sent to the hallucination grader (0 disables the limit)"
+    )
+    GRADER_STREAM_EARLY_EXIT: bool = Field(
+        default=False,
+        description="Stream grader responses and disconnect once the yes/no score is decoded"
+    )
+    GRADE_CACHE_SIZE: int = Field(
+        default=4096,
+        ge=0,
+        description="Grader and rewriter results cached for identical requests (0 disables)"
+    )
+    GRADE_SEMANTIC_CACHE: bool = Field(
+        default=False,
+        description="Reuse relevance grades for near-duplicate question/document pairs"
+    )
+    GRADE_CACHE_SIMILARITY: float = Field(
+        default=0.95,
+        ge=0.5,
+        le=1.0,
+        description="Minimum cosine similarity for a cached relevance grade to be reused"
+    )
+    GRADE_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds a cached relevance grade stays valid"
+    )
+    ANSWER_CACHE_SIZE: int = Field(
+        default=128,
+        ge=0,
+        le=10000,
+        description="Generated answers kept for identical question/context pairs (0 = disabled)"
+    )
+    GENERATION_BUDGET_SUMMARY: bool = Field(
+        default=False,
+        description="Answer the last allowed regeneration with excerpts of the leading documents instead of the LLM"
+    )
+    MAX_CONTEXT_CHARS: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum characters of document context sent to the generator (0 = unlimited)"
+    )
+    MAX_CONCURRENT_LLM: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Concurrent generation requests issued by agenerate_many"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -208,6 +373,14 @@ class Settings(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    def get_embedding_cache_path(self) -> Path:
+        """Get absolute path for the embedding cache directory."""
+        path = Path(self.EMBEDDING_CACHE_DIR)
+        if not path.is_absolute():
+            path = self.PROJECT_ROOT / path
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
     def get_data_path(self, subdir: str = "") -> Path:
         """Get path within data directory."""
         path = self.DATA_DIR / subdir if subdir else self.DATA_DIR
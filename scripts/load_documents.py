@@ -8,12 +8,12 @@ and stores them in the ChromaDB vector store for retrieval.
 
 import sys
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
 # Add parent directory to path for imports
@@ -21,18 +21,50 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import settings
 from src.loaders.document_loader import DocumentLoader
-from src.vectorstore.chroma_store import add_documents, clear_collection, get_collection_count
+from src.vectorstore.chroma_store import clear_collection, get_collection_count
+from src.vectorstore.ingest import ingest_documents
 
 console = Console()
 
 
-def print_statistics(documents: List, chunks: List, verbose: bool = False):
+class ChunkStats:
+    """
+    Running chunk statistics collected while chunks stream past.
+
+    Keeps count, total/min/max size and the first few chunks as samples,
+    so statistics can be reported without holding every chunk in memory.
+    """
+
+    def __init__(self, sample_size: int = 3):
+        self.count = 0
+        self.total_size = 0
+        self.min_size: Optional[int] = None
+        self.max_size: Optional[int] = None
+        self.samples: List = []
+        self._sample_size = sample_size
+
+    def track(self, chunks: Iterable) -> Iterator:
+        """Yield chunks unchanged while updating the statistics."""
+        for chunk in chunks:
+            size = len(chunk.page_content)
+            self.count += 1
+            self.total_size += size
+            if self.min_size is None or size < self.min_size:
+                self.min_size = size
+            if self.max_size is None or size > self.max_size:
+                self.max_size = size
+            if len(self.samples) < self._sample_size:
+                self.samples.append(chunk)
+            yield chunk
+
+
+def print_statistics(documents: List, chunk_stats: ChunkStats, verbose: bool = False):
     """
     Print loading statistics in a formatted table.
 
     Args:
         documents: List of original documents
-        chunks: List of chunked documents
+        chunk_stats: Statistics gathered while chunks were indexed
         verbose: Whether to show detailed information
     """
     console.print("\n[bold cyan]Loading Statistics[/bold cyan]")
@@ -45,16 +77,14 @@ def print_statistics(documents: List, chunks: List, verbose: bool = False):
     table.add_row("Original Documents", str(len(documents)))
 
     # Chunk statistics
-    table.add_row("Chunks Created", str(len(chunks)))
+    table.add_row("Chunks Created", str(chunk_stats.count))
 
-    if chunks:
-        # Calculate chunk sizes
-        chunk_sizes = [len(chunk.page_content) for chunk in chunks]
-        avg_size = sum(chunk_sizes) / len(chunk_sizes)
+    if chunk_stats.count:
+        avg_size = chunk_stats.total_size / chunk_stats.count
 
         table.add_row("Average Chunk Size", f"{avg_size:.1f} characters")
-        table.add_row("Min Chunk Size", f"{min(chunk_sizes)} characters")
-        table.add_row("Max Chunk Size", f"{max(chunk_sizes)} characters")
+        table.add_row("Min Chunk Size", f"{chunk_stats.min_size} characters")
+        table.add_row("Max Chunk Size", f"{chunk_stats.max_size} characters")
 
     # Vector store statistics
     total_docs = get_collection_count()
@@ -62,10 +92,11 @@ def print_statistics(documents: List, chunks: List, verbose: bool = False):
 
     console.print(table)
 
-    if verbose and chunks:
+    samples = chunk_stats.samples
+    if verbose and samples:
         console.print("\n[bold cyan]Sample Chunks[/bold cyan]")
 
-        for i, chunk in enumerate(chunks[:3], 1):
+        for i, chunk in enumerate(samples, 1):
             console.print(
                 Panel(
                     chunk.page_content[:300] + "..."
@@ -76,7 +107,7 @@ def print_statistics(documents: List, chunks: List, verbose: bool = False):
                 )
             )
 
-            if i < len(chunks) and i < 3:
+            if i < len(samples):
                 console.print()
 
 
@@ -90,7 +121,13 @@ def print_statistics(documents: List, chunks: List, verbose: bool = False):
 @click.option(
     "--verbose", "-v", is_flag=True, help="Show detailed chunk information"
 )
-def main(path: str, replace: bool, verbose: bool):
+@click.option(
+    "--workers",
+    type=click.IntRange(1, 32),
+    default=None,
+    help="Concurrent embedding requests to Ollama (default: EMBED_WORKERS setting)",
+)
+def main(path: str, replace: bool, verbose: bool, workers: Optional[int]):
     """
     Load documents into the vector store.
 
@@ -109,6 +146,9 @@ def main(path: str, replace: bool, verbose: bool):
 
         # Show verbose output
         python scripts/load_documents.py data/raw/ --verbose
+
+        # Tune embedding concurrency for your Ollama server
+        python scripts/load_documents.py data/raw/ --workers 8
     """
     console.print(
         Panel(
@@ -150,42 +190,52 @@ def main(path: str, replace: bool, verbose: bool):
 
         console.print(f"✅ [green]Loaded {len(documents)} document(s)[/green]")
 
-        # Step 3: Chunk documents
-        console.print("\n[bold blue]Chunking documents...[/bold blue]")
+        # Steps 3-4: Chunk documents and add them to the vector store.
+        # Chunks are produced lazily and streamed through the ingest
+        # pipeline, so only a few batches are held in memory at a time
+        console.print("\n[bold blue]Chunking and adding to vector store...[/bold blue]")
 
-        chunks = loader.chunk_documents(documents)
-
-        if not chunks:
-            console.print("\n❌ [red]Failed to chunk documents.[/red]")
-            sys.exit(1)
-
-        console.print(f"✅ [green]Created {len(chunks)} chunk(s)[/green]")
-
-        # Step 4: Add to vector store with progress bar
-        console.print("\n[bold blue]Adding chunks to vector store...[/bold blue]")
+        chunk_stats = ChunkStats()
 
         with Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
+            TextColumn("{task.completed} chunks"),
+            TimeElapsedColumn(),
             console=console,
         ) as progress:
-            task = progress.add_task(
-                "Embedding and storing...", total=len(chunks)
+            task = progress.add_task("Embedding and storing...", total=None)
+
+            # The chunk total is unknown while streaming, so estimate it from
+            # the text size and only advance the bar about once per 1%
+            estimated_chunks = sum(len(doc.page_content) for doc in documents) // settings.CHUNK_SIZE
+            update_every = max(1, estimated_chunks // 100)
+            pending = 0
+
+            def advance(n: int):
+                nonlocal pending
+                pending += n
+                if pending >= update_every:
+                    progress.update(task, advance=pending)
+                    pending = 0
+
+            # Embed and store in a pipeline: later batches are embedded
+            # while earlier ones are written to ChromaDB
+            ingest_documents(
+                chunk_stats.track(loader.iter_chunks(documents)),
+                max_workers=workers,
+                on_progress=advance,
             )
+            progress.update(task, completed=chunk_stats.count)
 
-            # Add documents in batches for better progress tracking
-            batch_size = 10
-            for i in range(0, len(chunks), batch_size):
-                batch = chunks[i : i + batch_size]
-                add_documents(batch)
-                progress.update(task, advance=len(batch))
+        if not chunk_stats.count:
+            console.print("\n❌ [red]Failed to chunk documents.[/red]")
+            sys.exit(1)
 
-        console.print("✅ [green]All chunks added to vector store[/green]")
+        console.print(f"✅ [green]Added {chunk_stats.count} chunk(s) to vector store[/green]")
 
         # Step 5: Print statistics
-        print_statistics(documents, chunks, verbose=verbose)
+        print_statistics(documents, chunk_stats, verbose=verbose)
 
         # Success message
         console.print(
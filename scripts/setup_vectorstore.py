@@ -6,10 +6,16 @@ This script creates the necessary directories, initializes ChromaDB,
 and verifies that Ollama and the embedding model are properly configured.
 """
 
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Dict
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -19,60 +25,99 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import settings
 from src.vectorstore.chroma_store import get_embeddings, get_vector_store
+from src.vectorstore.ingest import default_embed_batch_size, save_embedding_dim
 
 console = Console()
 
 
-def verify_ollama() -> bool:
+def create_http_session() -> requests.Session:
+    """
+    Create a pooled HTTP session for Ollama API calls.
+
+    Connections are kept alive and reused across requests, and transient
+    connection failures or 502-504 responses are retried with backoff.
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=settings.EMBED_WORKERS,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across all Ollama HTTP calls made by this script
+http_session = create_http_session()
+
+
+def verify_ollama(out: Console = console) -> bool:
     """
     Verify that Ollama is running and accessible.
 
+    Args:
+        out: Console to write progress messages to
+
     Returns:
         True if Ollama is accessible, False otherwise
     """
-    console.print("\n[bold blue]Verifying Ollama connection...[/bold blue]")
+    out.print("\n[bold blue]Verifying Ollama connection...[/bold blue]")
 
     try:
-        response = requests.get(f"{settings.OLLAMA_BASE_URL}/api/tags", timeout=5)
+        response = http_session.get(f"{settings.OLLAMA_BASE_URL}/api/tags", timeout=5)
 
         if response.status_code == 200:
-            console.print("✅ [green]Ollama is running[/green]")
+            out.print("✅ [green]Ollama is running[/green]")
 
             # Check if embedding model is available
-            data = response.json()
+            data = orjson.loads(response.content)
             models = [model["name"] for model in data.get("models", [])]
 
-            console.print(f"   Available models: {', '.join(models)}")
+            out.print(f"   Available models: {', '.join(models)}")
 
-            # Check for embedding model (match with or without tag)
-            model_found = any(
-                settings.EMBEDDING_MODEL in model or model in settings.EMBEDDING_MODEL
-                for model in models
-            )
+            # Check for embedding model: an explicit tag must match exactly,
+            # an untagged name matches any tag of that model
+            wanted = settings.EMBEDDING_MODEL
+            if ":" in wanted:
+                model_found = wanted in set(models)
+            else:
+                model_found = wanted in {model.split(":", 1)[0] for model in models}
 
             if model_found:
-                console.print(
+                out.print(
                     f"✅ [green]Embedding model '{settings.EMBEDDING_MODEL}' is available[/green]"
                 )
                 return True
             else:
-                console.print(
+                out.print(
                     f"❌ [red]Embedding model '{settings.EMBEDDING_MODEL}' not found[/red]"
                 )
-                console.print(
+                out.print(
                     f"\n[yellow]To pull the model, run:[/yellow]\n"
                     f"   ollama pull {settings.EMBEDDING_MODEL}"
                 )
                 return False
 
         else:
-            console.print(
+            out.print(
                 f"❌ [red]Ollama returned status {response.status_code}[/red]"
             )
             return False
 
     except requests.exceptions.ConnectionError:
-        console.print(
+        out.print(
             "❌ [red]Cannot connect to Ollama[/red]\n"
             "\n[yellow]Please make sure Ollama is running:[/yellow]\n"
             "   ollama serve"
@@ -80,59 +125,69 @@ def verify_ollama() -> bool:
         return False
 
     except Exception as e:
-        console.print(f"❌ [red]Error connecting to Ollama: {e}[/red]")
+        out.print(f"❌ [red]Error connecting to Ollama: {e}[/red]")
         return False
 
 
-def verify_embeddings() -> bool:
+def verify_embeddings(out: Console = console) -> bool:
     """
     Verify that embeddings can be generated.
 
+    Args:
+        out: Console to write progress messages to
+
     Returns:
         True if embeddings work, False otherwise
     """
-    console.print("\n[bold blue]Testing embedding generation...[/bold blue]")
+    out.print("\n[bold blue]Testing embedding generation...[/bold blue]")
 
     try:
         embeddings = get_embeddings()
         test_text = "This is a test document for embedding generation."
 
-        console.print(f"   Generating embedding for: '{test_text}'")
+        out.print(f"   Generating embedding for: '{test_text}'")
         vector = embeddings.embed_query(test_text)
 
-        console.print(
+        out.print(
             f"✅ [green]Embedding generated successfully[/green]\n"
             f"   Embedding dimension: {len(vector)}"
         )
 
         # Verify embedding dimension (nomic-embed-text should be 1024)
         if len(vector) == 1024:
-            console.print("   ✅ [green]Embedding dimension is correct (1024)[/green]")
+            out.print("   ✅ [green]Embedding dimension is correct (1024)[/green]")
         else:
-            console.print(
+            out.print(
                 f"   ⚠️  [yellow]Warning: Expected dimension 1024, got {len(vector)}[/yellow]"
             )
 
+        # Record the dimension so ingestion can size its embedding requests
+        save_embedding_dim(len(vector))
+        out.print(f"   Embedding batch size for ingestion: {default_embed_batch_size()}")
+
         return True
 
     except Exception as e:
-        console.print(f"❌ [red]Failed to generate embeddings: {e}[/red]")
+        out.print(f"❌ [red]Failed to generate embeddings: {e}[/red]")
         return False
 
 
-def verify_chromadb() -> bool:
+def verify_chromadb(out: Console = console) -> bool:
     """
     Verify that ChromaDB can be initialized.
 
+    Args:
+        out: Console to write progress messages to
+
     Returns:
         True if ChromaDB works, False otherwise
     """
-    console.print("\n[bold blue]Verifying ChromaDB initialization...[/bold blue]")
+    out.print("\n[bold blue]Verifying ChromaDB initialization...[/bold blue]")
 
     try:
         vector_store = get_vector_store()
 
-        console.print(
+        out.print(
             f"✅ [green]ChromaDB initialized successfully[/green]\n"
             f"   Collection name: {settings.CHROMA_COLLECTION}\n"
             f"   Persist directory: {settings.get_chroma_persist_path()}"
@@ -140,15 +195,50 @@ def verify_chromadb() -> bool:
 
         # Get collection count
         count = vector_store._collection.count()
-        console.print(f"   Documents in collection: {count}")
+        out.print(f"   Documents in collection: {count}")
 
         return True
 
     except Exception as e:
-        console.print(f"❌ [red]Failed to initialize ChromaDB: {e}[/red]")
+        out.print(f"❌ [red]Failed to initialize ChromaDB: {e}[/red]")
         return False
 
 
+def run_checks(checks: Dict[str, Callable[[Console], bool]]) -> Dict[str, bool]:
+    """
+    Run independent verification checks concurrently.
+
+    Each check writes to its own buffered console; the buffers are printed
+    in the order given once all checks finish, so output never interleaves.
+
+    Args:
+        checks: Mapping of component name to check function
+
+    Returns:
+        Mapping of component name to check result, in the same order
+    """
+    buffers = {name: io.StringIO() for name in checks}
+
+    def run(name: str) -> bool:
+        out = Console(
+            file=buffers[name],
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+            width=console.width,
+        )
+        return checks[name](out)
+
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(run, name) for name in checks}
+        results = {name: future.result() for name, future in futures.items()}
+
+    for name in checks:
+        console.file.write(buffers[name].getvalue())
+    console.file.flush()
+
+    return results
+
+
 def display_configuration():
     """Display the current configuration."""
     console.print("\n[bold blue]Current Configuration[/bold blue]")
@@ -186,12 +276,12 @@ def main():
     # Display configuration
     display_configuration()
 
-    # Run verifications
-    results = {
-        "Ollama Connection": verify_ollama(),
-        "Embedding Generation": verify_embeddings(),
-        "ChromaDB Initialization": verify_chromadb(),
-    }
+    # Run verifications (independent network checks, run concurrently)
+    results = run_checks({
+        "Ollama Connection": verify_ollama,
+        "Embedding Generation": verify_embeddings,
+        "ChromaDB Initialization": verify_chromadb,
+    })
 
     # Display summary
     console.print("\n[bold blue]Setup Summary[/bold blue]")
@@ -22,7 +22,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def test_workflow_initialization():
+def test_workflow_initialization(rag=None):
     """Test that the workflow can be initialized."""
     print("=" * 80)
     print("Testing Workflow Initialization")
@@ -33,7 +33,8 @@ def test_workflow_initialization():
 
         print("\n1. Initializing workflow...")
         print("-" * 80)
-        rag = AgenticRAGWorkflow()
+        if rag is None:
+            rag = AgenticRAGWorkflow()
         print("✅ Workflow initialized successfully")
 
         print("\n2. Getting graph info...")
@@ -58,7 +59,7 @@ def test_workflow_initialization():
         return False
 
 
-def test_simple_query():
+def test_simple_query(rag=None):
     """Test workflow with a simple query."""
     print("\n" + "=" * 80)
     print("Testing Simple Query")
@@ -72,7 +73,8 @@ def test_simple_query():
         print(f"\nQuestion: {question}")
         print("-" * 80)
 
-        rag = AgenticRAGWorkflow()
+        if rag is None:
+            rag = AgenticRAGWorkflow()
         print("\nRunning workflow...")
         result = rag.run(question)
 
@@ -97,7 +99,7 @@ def test_simple_query():
         return False
 
 
-def test_workflow_streaming():
+def test_workflow_streaming(rag=None):
     """Test workflow streaming."""
     print("\n" + "=" * 80)
     print("Testing Workflow Streaming")
@@ -111,7 +113,8 @@ def test_workflow_streaming():
         print(f"\nQuestion: {question}")
         print("-" * 80)
 
-        rag = AgenticRAGWorkflow()
+        if rag is None:
+            rag = AgenticRAGWorkflow()
         print("\nStreaming workflow execution...\n")
 
         for event in rag.stream(question):
@@ -147,10 +150,19 @@ def main():
     print("Phase 8: Complete Graph Integration - Test Suite")
     print("=" * 80)
 
+    # Build the workflow once and share it across tests
+    from src.graph.workflow import AgenticRAGWorkflow
+
+    try:
+        rag = AgenticRAGWorkflow()
+    except Exception as e:
+        print(f"\n❌ Failed to initialize workflow: {e}")
+        sys.exit(1)
+
     results = {
-        "Workflow Initialization": test_workflow_initialization(),
-        "Simple Query": test_simple_query(),
-        "Workflow Streaming": test_workflow_streaming(),
+        "Workflow Initialization": test_workflow_initialization(rag),
+        "Simple Query": test_simple_query(rag),
+        "Workflow Streaming": test_workflow_streaming(rag),
     }
 
     # Print summary
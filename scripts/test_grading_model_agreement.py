@@ -0,0 +1,159 @@
+"""
+Agreement check between the grading model and a smaller candidate.
+
+Grades a fixed set of relevance, grounding and usefulness samples with
+GRADING_MODEL and with GRADING_MODEL_SMALL (or a model given on the command
+line) and reports how often the yes/no scores agree. Run it before pointing
+GRADING_MODEL_SMALL at a quantized model in production.
+
+Needs a running Ollama server with both models pulled, so under pytest it
+only runs when RUN_GRADER_EVAL is set:
+
+    RUN_GRADER_EVAL=1 pytest scripts/test_grading_model_agreement.py
+    python scripts/test_grading_model_agreement.py qwen2.5:1.5b-instruct-q4_K_M
+"""
+
+import os
+import sys
+import logging
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+
+from config.settings import settings
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+# Minimum share of samples on which the candidate must match the grading model
+MIN_AGREEMENT = 0.9
+
+_LANGGRAPH = Document(
+    page_content=(
+        "LangGraph is a library for building stateful, multi-actor applications "
+        "with LLMs. Workflows are graphs of nodes that read and update a shared state."
+    ),
+    metadata={"source": "eval"},
+)
+_CHROMA = Document(
+    page_content="ChromaDB stores embeddings on disk and answers nearest-neighbour queries.",
+    metadata={"source": "eval"},
+)
+_BAKING = Document(
+    page_content="Sourdough needs a starter that is fed with flour and water every day.",
+    metadata={"source": "eval"},
+)
+
+RELEVANCE_SAMPLES: List[Tuple[str, Document]] = [
+    ("What is LangGraph?", _LANGGRAPH),
+    ("How are LangGraph workflows structured?", _LANGGRAPH),
+    ("Where does ChromaDB keep embeddings?", _CHROMA),
+    ("What is LangGraph?", _BAKING),
+    ("How do I bake sourdough?", _CHROMA),
+    ("How do I bake sourdough?", _BAKING),
+]
+
+GROUNDING_SAMPLES: List[Tuple[str, List[Document]]] = [
+    ("LangGraph builds stateful multi-actor LLM applications.", [_LANGGRAPH]),
+    ("LangGraph was written in Rust by the ChromaDB team in 2010.", [_LANGGRAPH]),
+    ("ChromaDB persists embeddings to disk.", [_CHROMA]),
+    ("ChromaDB is a sourdough starter.", [_CHROMA, _BAKING]),
+]
+
+USEFULNESS_SAMPLES: List[Tuple[str, str]] = [
+    ("What is LangGraph?", "LangGraph is a library for stateful, multi-actor LLM applications."),
+    ("What is LangGraph?", "Sourdough needs a daily-fed starter."),
+    ("Where does ChromaDB keep embeddings?", "On disk, in its persist directory."),
+    ("Where does ChromaDB keep embeddings?", "I am not sure."),
+]
+
+
+def grade_samples(model: str) -> List[str]:
+    """
+    Grade every sample with the given model.
+
+    Args:
+        model: Ollama model to use for all three graders
+
+    Returns:
+        Scores for the relevance, grounding and usefulness samples, in order
+    """
+    from src.agents.graders import AnswerGrader, DocumentGrader, HallucinationGrader
+
+    previous = settings.GRADING_MODEL_SMALL
+    settings.GRADING_MODEL_SMALL = model
+    try:
+        doc_grader = DocumentGrader()
+        hallucination_grader = HallucinationGrader()
+        answer_grader = AnswerGrader()
+    finally:
+        settings.GRADING_MODEL_SMALL = previous
+
+    scores = [doc_grader.grade(q, doc) for q, doc in RELEVANCE_SAMPLES]
+    scores += [hallucination_grader.grade(gen, docs) for gen, docs in GROUNDING_SAMPLES]
+    scores += [answer_grader.grade(q, gen) for q, gen in USEFULNESS_SAMPLES]
+    return scores
+
+
+def agreement(baseline: List[str], candidate: List[str]) -> float:
+    """Share of samples on which two score lists agree."""
+    return sum(a == b for a, b in zip(baseline, candidate)) / len(baseline)
+
+
+def evaluate(candidate_model: str) -> float:
+    """
+    Compare a candidate model's grades against GRADING_MODEL.
+
+    Args:
+        candidate_model: Ollama model to evaluate
+
+    Returns:
+        Agreement rate between 0 and 1
+    """
+    baseline = grade_samples(settings.GRADING_MODEL)
+    candidate = grade_samples(candidate_model)
+    rate = agreement(baseline, candidate)
+
+    print(f"Baseline:  {settings.GRADING_MODEL} -> {baseline}")
+    print(f"Candidate: {candidate_model} -> {candidate}")
+    print(f"Agreement: {rate:.0%} (minimum {MIN_AGREEMENT:.0%})")
+    return rate
+
+
+@pytest.mark.skipif(
+    not os.getenv("RUN_GRADER_EVAL"),
+    reason="needs a running Ollama server; set RUN_GRADER_EVAL=1",
+)
+def test_small_model_agreement():
+    """Test GRADING_MODEL_SMALL agrees with GRADING_MODEL on the samples."""
+    if not settings.GRADING_MODEL_SMALL:
+        pytest.skip("GRADING_MODEL_SMALL is not set")
+
+    assert evaluate(settings.GRADING_MODEL_SMALL) >= MIN_AGREEMENT
+
+
+def main():
+    """Evaluate the model given on the command line, or GRADING_MODEL_SMALL."""
+    candidate = sys.argv[1] if len(sys.argv) > 1 else settings.GRADING_MODEL_SMALL
+    if not candidate:
+        print("Usage: python scripts/test_grading_model_agreement.py <model>")
+        sys.exit(2)
+
+    rate = evaluate(candidate)
+    sys.exit(0 if rate >= MIN_AGREEMENT else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,18 @@ This script tests the graceful error recovery implementation by simulating
 scenarios that would previously cause crashes.
 """
 
+import io
 import sys
 import logging
+from contextlib import redirect_stdout
+from functools import wraps
+from pathlib import Path
+from typing import Final
 from unittest.mock import Mock, patch
 from langchain_core.documents import Document
 
 # Add project root to path
-sys.path.insert(0, "/Volumes/Samsung970EVOPlus/Agentic-RAG")
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.graph.workflow import AgenticRAGWorkflow
 from src.graph.nodes import generate
@@ -27,7 +32,70 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-
+# Scenario inputs, built once at import. Nodes and routers return partial
+# updates without mutating their input, so scenarios share these directly
+# and copy only when they change a field.
+_SAMPLE_DOC: Final = Document(page_content="Test content", metadata={"source": "test"})
+
+_STATE_REGEN_LIMIT: Final = {
+    "hallucination_check": "not_grounded",
+    "usefulness_check": "useful",
+    "retry_count": 0,
+    "regeneration_count": settings.MAX_REGENERATIONS  # At limit
+}
+
+_STATE_RETRY_LIMIT: Final = {
+    "hallucination_check": "grounded",
+    "usefulness_check": "not_useful",
+    "retry_count": settings.MAX_RETRIES,  # At limit
+    "regeneration_count": 0
+}
+
+_STATE_HALLUCINATED: Final = {
+    "question": "What is LangGraph?",
+    "documents": [_SAMPLE_DOC],
+    "regeneration_count": 0,
+    "hallucination_check": "not_grounded",
+    "prompt_variant": "baseline"
+}
+
+_STATE_AFTER_REWRITE: Final = {
+    "question": "What is LangGraph?",
+    "documents": [_SAMPLE_DOC],
+    "regeneration_count": 2,  # Previous regenerations
+    "hallucination_check": "",  # Empty indicates fresh start
+    "prompt_variant": "baseline"
+}
+
+_STATE_BOTH_LIMITS: Final = {
+    "hallucination_check": "not_grounded",
+    "usefulness_check": "not_useful",
+    "retry_count": settings.MAX_RETRIES,
+    "regeneration_count": settings.MAX_REGENERATIONS
+}
+
+
+def buffered_output(scenario):
+    """
+    Collect a scenario's printed output and write it in a single call.
+
+    Output is flushed even when the scenario fails, so the failing
+    scenario's progress is still shown.
+    """
+    @wraps(scenario)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return scenario(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    return wrapper
+
+
+@buffered_output
 def test_scenario_1_regeneration_limit():
     """Test that regeneration stops at MAX_REGENERATIONS."""
     print("\n" + "="*80)
@@ -39,12 +107,7 @@ def test_scenario_1_regeneration_limit():
     print(f"  MAX_RETRIES = {settings.MAX_RETRIES}")
 
     # Simulate state at regeneration limit
-    state = {
-        "hallucination_check": "not_grounded",
-        "usefulness_check": "useful",
-        "retry_count": 0,
-        "regeneration_count": settings.MAX_REGENERATIONS  # At limit
-    }
+    state = _STATE_REGEN_LIMIT
 
     print(f"\nState:")
     print(f"  Hallucination Check: {state['hallucination_check']}")
@@ -58,6 +121,7 @@ def test_scenario_1_regeneration_limit():
     print("✓ PASS: Router correctly stops regeneration at limit")
 
 
+@buffered_output
 def test_scenario_2_retry_limit():
     """Test that query rewriting stops at MAX_RETRIES."""
     print("\n" + "="*80)
@@ -65,12 +129,7 @@ def test_scenario_2_retry_limit():
     print("="*80)
 
     # Simulate state at retry limit
-    state = {
-        "hallucination_check": "grounded",
-        "usefulness_check": "not_useful",
-        "retry_count": settings.MAX_RETRIES,  # At limit
-        "regeneration_count": 0
-    }
+    state = _STATE_RETRY_LIMIT
 
     print(f"\nState:")
     print(f"  Hallucination Check: {state['hallucination_check']}")
@@ -84,6 +143,7 @@ def test_scenario_2_retry_limit():
     print("✓ PASS: Router correctly stops query rewriting at limit")
 
 
+@buffered_output
 def test_scenario_3_regeneration_counter_tracking():
     """Test that regeneration counter increments correctly."""
     print("\n" + "="*80)
@@ -91,13 +151,7 @@ def test_scenario_3_regeneration_counter_tracking():
     print("="*80)
 
     # First generation (hallucinated)
-    state1 = {
-        "question": "What is LangGraph?",
-        "documents": [Document(page_content="Test content", metadata={"source": "test"})],
-        "regeneration_count": 0,
-        "hallucination_check": "not_grounded",
-        "prompt_variant": "baseline"
-    }
+    state1 = _STATE_HALLUCINATED
 
     result1 = generate(state1)
     print(f"\nFirst generation (after hallucination):")
@@ -106,7 +160,8 @@ def test_scenario_3_regeneration_counter_tracking():
     assert result1['regeneration_count'] == 1, "Should increment to 1"
 
     # Second generation (still hallucinated)
-    state2 = {**state1, "regeneration_count": result1['regeneration_count']}
+    state2 = dict(state1)
+    state2["regeneration_count"] = result1['regeneration_count']
     result2 = generate(state2)
     print(f"\nSecond generation (still hallucinated):")
     print(f"  Input regeneration_count: {state2['regeneration_count']}")
@@ -116,6 +171,7 @@ def test_scenario_3_regeneration_counter_tracking():
     print("\n✓ PASS: Regeneration counter increments correctly")
 
 
+@buffered_output
 def test_scenario_4_reset_after_query_rewrite():
     """Test that regeneration counter resets after query rewrite."""
     print("\n" + "="*80)
@@ -123,13 +179,7 @@ def test_scenario_4_reset_after_query_rewrite():
     print("="*80)
 
     # After query rewrite (fresh start)
-    state = {
-        "question": "What is LangGraph?",
-        "documents": [Document(page_content="Test content", metadata={"source": "test"})],
-        "regeneration_count": 2,  # Previous regenerations
-        "hallucination_check": "",  # Empty indicates fresh start
-        "prompt_variant": "baseline"
-    }
+    state = _STATE_AFTER_REWRITE
 
     result = generate(state)
     print(f"\nAfter query rewrite (fresh start):")
@@ -140,13 +190,14 @@ def test_scenario_4_reset_after_query_rewrite():
     print("\n✓ PASS: Regeneration counter resets after query rewrite")
 
 
+@buffered_output
 def test_scenario_5_recursion_limit_error_recovery():
     """Test graceful error recovery for recursion limit errors."""
     print("\n" + "="*80)
     print("SCENARIO 5: Recursion Limit Error Recovery")
     print("="*80)
 
-    with patch('src.graph.workflow.AgenticRAGWorkflow._build_workflow') as mock_build:
+    with patch.object(AgenticRAGWorkflow, '_build_workflow') as mock_build:
         # Create mock workflow that simulates recursion limit error
         mock_workflow = Mock()
         mock_workflow.invoke.side_effect = Exception("Recursion limit of 50 reached")
@@ -178,18 +229,14 @@ def test_scenario_5_recursion_limit_error_recovery():
     print("\n✓ PASS: Recursion limit error handled gracefully")
 
 
+@buffered_output
 def test_scenario_6_both_limits_exceeded():
     """Test behavior when both regeneration and retry limits are exceeded."""
     print("\n" + "="*80)
     print("SCENARIO 6: Both Limits Exceeded")
     print("="*80)
 
-    state = {
-        "hallucination_check": "not_grounded",
-        "usefulness_check": "not_useful",
-        "retry_count": settings.MAX_RETRIES,
-        "regeneration_count": settings.MAX_REGENERATIONS
-    }
+    state = _STATE_BOTH_LIMITS
 
     print(f"\nState:")
     print(f"  Hallucination Check: {state['hallucination_check']}")
@@ -4,9 +4,13 @@ Test script for web search functionality.
 This script tests the web searcher with DuckDuckGo (no API key required).
 """
 
+import io
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -21,53 +25,53 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def test_duckduckgo_import():
+def test_duckduckgo_import(out: Callable[..., None] = print):
     """Test DuckDuckGo import."""
-    print("=" * 80)
-    print("Testing DuckDuckGo Import")
-    print("=" * 80)
+    out("=" * 80)
+    out("Testing DuckDuckGo Import")
+    out("=" * 80)
 
     try:
         from duckduckgo_search import DDGS
-        print("✅ DuckDuckGo imported successfully")
+        out("✅ DuckDuckGo imported successfully")
         return True
     except ImportError as e:
-        print(f"❌ Failed to import DuckDuckGo: {e}")
-        print("To install: pip install duckduckgo-search")
+        out(f"❌ Failed to import DuckDuckGo: {e}")
+        out("To install: pip install duckduckgo-search")
         return False
 
 
-def test_tavily_import():
+def test_tavily_import(out: Callable[..., None] = print):
     """Test Tavily import."""
-    print("\n" + "=" * 80)
-    print("Testing Tavily Import")
-    print("=" * 80)
+    out("\n" + "=" * 80)
+    out("Testing Tavily Import")
+    out("=" * 80)
 
     try:
         from tavily import TavilyClient
-        print("✅ Tavily imported successfully")
+        out("✅ Tavily imported successfully")
 
         # Check for API key
         import os
         api_key = os.getenv("TAVILY_API_KEY")
         if api_key:
-            print(f"✅ Tavily API key is set")
+            out(f"✅ Tavily API key is set")
             return True
         else:
-            print("⚠️  Tavily API key not set")
-            print("To use Tavily, set TAVILY_API_KEY environment variable")
+            out("⚠️  Tavily API key not set")
+            out("To use Tavily, set TAVILY_API_KEY environment variable")
             return False
     except ImportError as e:
-        print(f"❌ Failed to import Tavily: {e}")
-        print("To install: pip install tavily-python")
+        out(f"❌ Failed to import Tavily: {e}")
+        out("To install: pip install tavily-python")
         return False
 
 
-def test_web_searcher():
+def test_web_searcher(out: Callable[..., None] = print):
     """Test WebSearcher class."""
-    print("\n" + "=" * 80)
-    print("Testing WebSearcher")
-    print("=" * 80)
+    out("\n" + "=" * 80)
+    out("Testing WebSearcher")
+    out("=" * 80)
 
     try:
         from src.agents.web_searcher import WebSearcher
@@ -77,39 +81,39 @@ def test_web_searcher():
 
         # Check availability
         if searcher.is_available():
-            print("✅ WebSearcher initialized successfully")
+            out("✅ WebSearcher initialized successfully")
 
             # Test search
             question = "What is LangGraph?"
-            print(f"\n🔍 Searching for: {question}")
-            print("-" * 80)
+            out(f"\n🔍 Searching for: {question}")
+            out("-" * 80)
 
             try:
                 documents = searcher.search(question, max_results=3)
 
-                print(f"\n✅ Found {len(documents)} results:\n")
+                out(f"\n✅ Found {len(documents)} results:\n")
 
                 for i, doc in enumerate(documents, 1):
-                    print(f"{i}. {doc.metadata.get('title', 'No title')}")
-                    print(f"   Source: {doc.metadata.get('source', 'Unknown')}")
-                    print(f"   Engine: {doc.metadata.get('search_engine', 'Unknown')}")
-                    print(f"   Content: {doc.page_content[:200]}...")
-                    print()
+                    out(f"{i}. {doc.metadata.get('title', 'No title')}")
+                    out(f"   Source: {doc.metadata.get('source', 'Unknown')}")
+                    out(f"   Engine: {doc.metadata.get('search_engine', 'Unknown')}")
+                    out(f"   Content: {doc.page_content[:200]}...")
+                    out()
 
                 return True
 
             except Exception as e:
-                print(f"❌ Search failed: {e}")
+                out(f"❌ Search failed: {e}")
                 return False
 
         else:
-            print("⚠️  WebSearcher not available - no search engines configured")
+            out("⚠️  WebSearcher not available - no search engines configured")
             return False
 
     except Exception as e:
-        print(f"❌ Failed to initialize WebSearcher: {e}")
+        out(f"❌ Failed to initialize WebSearcher: {e}")
         import traceback
-        traceback.print_exc()
+        out(traceback.format_exc())
         return False
 
 
@@ -119,12 +123,26 @@ def main():
     print("Web Search Test Suite")
     print("=" * 80)
 
-    results = {
-        "DuckDuckGo Import": test_duckduckgo_import(),
-        "Tavily Import": test_tavily_import(),
-        "WebSearcher": test_web_searcher(),
+    tests = {
+        "DuckDuckGo Import": test_duckduckgo_import,
+        "Tavily Import": test_tavily_import,
+        "WebSearcher": test_web_searcher,
     }
 
+    # The tests are independent, so run them concurrently to hide the
+    # network search behind the imports. Each test writes to its own
+    # buffer, printed in order once all have finished.
+    buffers = {name: io.StringIO() for name in tests}
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            name: executor.submit(test, partial(print, file=buffers[name]))
+            for name, test in tests.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+
+    for name in tests:
+        sys.stdout.write(buffers[name].getvalue())
+
     # Print summary
     print("\n" + "=" * 80)
     print("Test Summary")
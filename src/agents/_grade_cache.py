@@ -0,0 +1,248 @@
+"""
+Caches for grader and rewriter results.
+
+ExactCache is an LRU keyed on content fingerprints, for requests that are
+byte-identical to earlier ones; with a TTL it also holds short-lived web
+search results. SemanticGradeCache serves relevance grades
+for near-identical requests; it is also used for web search queries,
+keyed on the question embedding alone.
+
+Relevance grading runs at temperature 0 and returns a single yes/no, so a
+relevance grade can be reused for a (question, document) pair that is nearly
+identical to one graded before: a paraphrased question, or the same chunk
+retrieved again. Pairs are represented by the concatenation of their unit
+question and document embeddings, so the cosine similarity of two pair
+vectors is the mean of the question and document similarities.
+
+Candidates are found with random-hyperplane LSH: each of several tables
+hashes a vector to the sign bits of a few random projections, and only
+entries sharing a bucket in at least one table are compared exactly.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+def fingerprint(text: str) -> bytes:
+    """16-byte BLAKE2b digest of a text, used in exact cache keys."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ExactCache:
+    """
+    Thread-safe LRU of results keyed by exact request content.
+
+    Keys should hold fingerprint() digests rather than the texts, so large
+    documents are not kept alive by the cache. With ttl_seconds, entries
+    expire that long after they were stored.
+
+    Example:
+        >>> cache = ExactCache(max_entries=4096)
+        >>> cache.put(("relevance", fingerprint(q), fingerprint(d)), "yes")
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float = float("inf")):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Look up a live result, marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Any) -> None:
+        """Store a result, evicting the least recently used beyond max_entries."""
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+def pair_vector(question_vector, document_vector) -> np.ndarray:
+    """
+    Combine question and document embeddings into one unit vector.
+
+    Args:
+        question_vector: Embedding of the question
+        document_vector: Embedding of the document
+
+    Returns:
+        float32 unit vector of twice the embedding dimension
+    """
+    q = np.asarray(question_vector, dtype=np.float32)
+    d = np.asarray(document_vector, dtype=np.float32)
+    q = q / (np.linalg.norm(q) or 1.0)
+    d = d / (np.linalg.norm(d) or 1.0)
+    return np.concatenate([q, d]) / np.float32(np.sqrt(2.0))
+
+
+class SemanticGradeCache:
+    """
+    LSH index mapping (question, document) pair vectors to grades.
+
+    Thread-safe, since grade_batch grades documents from a thread pool.
+
+    Attributes:
+        threshold: Minimum cosine similarity for a cached grade to be reused
+        ttl_seconds: How long a grade stays valid
+        max_entries: Entries kept before the oldest are evicted
+
+    Example:
+        >>> cache = SemanticGradeCache(threshold=0.95)
+        >>> cache.add(pair_vector(q_emb, d_emb), "yes")
+        >>> cache.lookup(pair_vector(q_emb2, d_emb))
+        "yes"
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 4096,
+        num_tables: int = 4,
+        bits_per_table: int = 8,
+        seed: int = 0,
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._num_tables = num_tables
+        self._bits_per_table = bits_per_table
+        self._rng = np.random.default_rng(seed)
+
+        # Projections are drawn once the embedding dimension is known
+        self._planes: Optional[np.ndarray] = None
+        self._bit_weights = 1 << np.arange(bits_per_table, dtype=np.int64)
+
+        # entry id -> (vector, score, expiry time, bucket keys)
+        self._entries: "OrderedDict[int, Tuple[np.ndarray, str, float, Tuple[int, ...]]]" = OrderedDict()
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in range(num_tables)]
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _bucket_keys(self, vector: np.ndarray) -> Tuple[int, ...]:
+        """Hash a vector to one bucket key per table."""
+        if self._planes is None:
+            self._planes = self._rng.standard_normal(
+                (self._num_tables, self._bits_per_table, vector.shape[0])
+            ).astype(np.float32)
+        bits = (self._planes @ vector) > 0
+        return tuple(int(key) for key in bits @ self._bit_weights)
+
+    def _remove(self, entry_id: int) -> None:
+        """Drop an entry and its bucket memberships."""
+        _, _, _, keys = self._entries.pop(entry_id)
+        for table, key in zip(self._buckets, keys):
+            bucket = table.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[key]
+
+    def lookup(self, vector: np.ndarray) -> Optional[str]:
+        """
+        Find the grade of the most similar cached pair.
+
+        Args:
+            vector: Pair vector from pair_vector()
+
+        Returns:
+            The cached grade, or None if no live entry reaches the threshold
+        """
+        now = time.monotonic()
+        with self._lock:
+            best_score = None
+            best_similarity = self.threshold
+            expired = []
+
+            keys = self._bucket_keys(vector)
+            candidates = set().union(*(table.get(key, ()) for table, key in zip(self._buckets, keys)))
+            for entry_id in candidates:
+                cached_vector, score, expires_at, _ = self._entries[entry_id]
+                if expires_at <= now:
+                    expired.append(entry_id)
+                    continue
+                similarity = float(cached_vector @ vector)
+                if similarity >= best_similarity:
+                    best_similarity = similarity
+                    best_score = score
+
+            for entry_id in expired:
+                self._remove(entry_id)
+
+            if best_score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return best_score
+
+    def add(self, vector: np.ndarray, score: str) -> None:
+        """
+        Cache the grade of a pair, evicting the oldest entries beyond max_entries.
+
+        Args:
+            vector: Pair vector from pair_vector()
+            score: The grade to cache
+        """
+        with self._lock:
+            keys = self._bucket_keys(vector)
+            entry_id = self._next_id
+            self._next_id += 1
+
+            self._entries[entry_id] = (vector, score, time.monotonic() + self.ttl_seconds, keys)
+            for table, key in zip(self._buckets, keys):
+                table.setdefault(key, set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def stats(self) -> dict:
+        """
+        Report cache size and hit rate.
+
+        Returns:
+            Dictionary with entries, hits, misses and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached grades and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            for table in self._buckets:
+                table.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,120 @@
+"""
+Shared ChatOllama clients for the agents.
+
+Each ChatOllama owns its own httpx connection pools, so building one per
+agent instance opens a fresh connection for every grader, rewriter and
+generator. get_chat_ollama returns one client per model configuration,
+shared by every agent, so HTTP keep-alive connections are reused across
+them.
+
+A ChatOllama's async client is bound to the event loop that first uses it,
+so async requests through a shared client always run on one long-lived
+background loop (run_on_llm_loop) rather than on the caller's loop, which
+may be a short-lived asyncio.run loop.
+"""
+
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from typing import Awaitable, Optional, TypeVar
+
+import httpx
+from langchain_ollama import ChatOllama
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Connection pool of each shared client; Ollama queues requests beyond
+# OLLAMA_NUM_PARALLEL server-side, so the limits only need to cover the
+# grading and ingestion concurrency
+_MAX_CONNECTIONS = 64
+_MAX_KEEPALIVE_CONNECTIONS = 32
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=16)
+def _create(
+    model: str,
+    base_url: str,
+    temperature: float,
+    keep_alive: Optional[str],
+) -> ChatOllama:
+    """Build a ChatOllama with an explicit connection pool."""
+    logger.debug(f"Creating shared ChatOllama client for {model} at {base_url}")
+    return ChatOllama(
+        model=model,
+        temperature=temperature,
+        base_url=base_url,
+        keep_alive=keep_alive,
+        client_kwargs={
+            "limits": httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        },
+    )
+
+
+def get_chat_ollama(
+    model: str,
+    temperature: float = 0,
+    keep_alive: Optional[str] = None,
+) -> ChatOllama:
+    """
+    Get the shared ChatOllama client for a model configuration.
+
+    Clients are created once per (model, base URL, temperature, keep_alive)
+    and reused by every caller. Callers must not mutate the returned client.
+
+    Args:
+        model: Ollama model name
+        temperature: Sampling temperature
+        keep_alive: How long Ollama keeps the model loaded (default: server setting)
+
+    Returns:
+        Shared ChatOllama instance
+
+    Example:
+        >>> llm = get_chat_ollama(settings.GRADING_MODEL, keep_alive=settings.OLLAMA_KEEP_ALIVE)
+    """
+    return _create(model, settings.OLLAMA_BASE_URL, temperature, keep_alive)
+
+
+@lru_cache(maxsize=1)
+def get_llm_loop() -> asyncio.AbstractEventLoop:
+    """
+    Start the event loop that owns the shared clients' async connections.
+
+    Returns:
+        Event loop running forever on a daemon thread
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-loop", daemon=True).start()
+    return loop
+
+
+async def run_on_llm_loop(coro: Awaitable[T]) -> T:
+    """
+    Await an async LLM request on the shared LLM loop.
+
+    The shared clients' async connection pools would otherwise be reused
+    from whichever loop first opened them, failing with "Event loop is
+    closed" once that loop is gone. Called from the LLM loop itself, the
+    request is awaited directly.
+
+    Args:
+        coro: Coroutine making requests through a shared client
+
+    Returns:
+        The coroutine's result
+
+    Example:
+        >>> response = await run_on_llm_loop(llm.ainvoke(prompt))
+    """
+    loop = get_llm_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
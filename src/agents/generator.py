@@ -5,21 +5,110 @@ This module implements the answer generation component that uses
 retrieved documents to generate answers to user questions.
 """
 
+import asyncio
 import logging
-from typing import List
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, List, Optional, Tuple
 
 from langchain_core.documents import Document
-from langchain_ollama import ChatOllama
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 from config.settings import settings
 from config.prompts_ab import get_prompt_variant
+from src.agents._grade_cache import ExactCache, fingerprint
+from src.agents._llm_pool import get_chat_ollama, run_on_llm_loop
 
 
 logger = logging.getLogger(__name__)
 
+# C-level accessor for Document.page_content
+_page_content = attrgetter("page_content")
+
+# System instruction for the last regeneration the budget allows
+_OVER_BUDGET_INSTRUCTION = (
+    "You are over budget; produce a final concise answer using only the "
+    "provided context; do not request more information."
+)
+
+# Documents and characters per document in the out-of-budget summary
+_SUMMARY_DOCUMENTS = 3
+_SUMMARY_CHARS = 200
+
+
+def _light_model() -> str:
+    """Model used for regenerations, falling back to the generation model."""
+    return settings.GENERATION_MODEL_LIGHT or settings.GENERATION_MODEL
+
+
+@lru_cache(maxsize=8)
+def _get_prompt(prompt_variant: str) -> Callable[..., str]:
+    """
+    Get the prompt formatter for a RAG prompt variant.
+
+    Returns the template string's bound format method. It fills
+    {question} and {context} in a single C-level pass, without the
+    message-template machinery of ChatPromptTemplate, and never
+    re-substitutes placeholders that appear inside the filled-in values.
+    """
+    return get_prompt_variant(prompt_variant).format
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Get the tiktoken encoding used for token counts.
+
+    Loaded on first use. Returns None when tiktoken or its encoding file is
+    unavailable (e.g. offline), in which case counts fall back to a
+    character-based estimate.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Token encoding unavailable, estimating from characters: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_answer_cache() -> ExactCache:
+    """Get the LRU of generated answers shared by all generators."""
+    return ExactCache(max_entries=settings.ANSWER_CACHE_SIZE)
+
+
+def _build_context(contents: Iterable[str], max_chars: int) -> str:
+    """
+    Join document contents with blank lines for the prompt.
+
+    Repeated contents (e.g. the same page from the vector store and from
+    web search) are kept only once, in first-seen order. If max_chars is
+    set, the context is cut off once it reaches that many characters.
+    """
+    unique = list(dict.fromkeys(contents))
+    if not max_chars:
+        return "\n\n".join(unique)
+
+    parts = []
+    length = 0
+    for text in unique:
+        if parts:
+            length += 2
+        room = max_chars - length
+        if len(text) >= room:
+            if room > 0:
+                parts.append(text[:room])
+            break
+        parts.append(text)
+        length += len(text)
+    return "\n\n".join(parts)
+
+
+@lru_cache(maxsize=32)
+def _join_contents(contents: Tuple[str, ...], max_chars: int) -> str:
+    """Build the context, memoized per content tuple and limit."""
+    return _build_context(contents, max_chars)
+
 
 class AnswerGenerator:
     """
@@ -29,10 +118,14 @@ class AnswerGenerator:
     based on retrieved context documents. It implements the RAG pattern
     (Retrieval-Augmented Generation).
 
+    Answers are cached process-wide by model, prompt variant, question and
+    document content fingerprints, so an unchanged regeneration request does not call
+    the LLM again.
+
     Attributes:
         llm: The Ollama LLM for generation
-        rag_prompt: The prompt template for RAG
-        chain: The complete RAG chain
+        llm_light: The Ollama LLM for regenerations (settings.GENERATION_MODEL_LIGHT)
+        rag_prompt: Formats the RAG prompt from a question and context
         prompt_variant: The name of the prompt variant being used
 
     Example:
@@ -51,43 +144,33 @@ class AnswerGenerator:
         Args:
             prompt_variant: Which RAG prompt variant to use (baseline, detailed, bullets, reasoning)
 
-        Loads the generation model from settings and builds the RAG chain
-        with the specified prompt variant.
+        Loads the generation model from settings and the prompt template
+        for the specified variant.
         """
         logger.info(f"Initializing AnswerGenerator with model: {settings.GENERATION_MODEL}")
         logger.info(f"Using prompt variant: {prompt_variant}")
 
-        # Initialize the LLM
-        self.llm = ChatOllama(
-            model=settings.GENERATION_MODEL,
-            temperature=0,  # Use temperature 0 for deterministic output
-            base_url=settings.OLLAMA_BASE_URL,
-        )
+        # Get the shared LLM clients (temperature 0 for deterministic output).
+        # Regenerations use the light model; it is the same client when no
+        # light model is configured.
+        self.llm = get_chat_ollama(settings.GENERATION_MODEL, temperature=0)
+        self.llm_light = get_chat_ollama(_light_model(), temperature=0)
 
-        # Load the specified prompt variant
-        rag_prompt_text = get_prompt_variant(prompt_variant)
-
-        # Create the prompt template
-        self.rag_prompt = ChatPromptTemplate.from_template(rag_prompt_text)
+        # Get the prompt formatter for the specified prompt variant
+        self.rag_prompt = _get_prompt(prompt_variant)
 
         # Store the variant for reference
         self.prompt_variant = prompt_variant
 
-        # Build the RAG chain
-        self.chain = (
-            {"context": self._format_documents, "question": RunnablePassthrough()}
-            | self.rag_prompt
-            | self.llm
-            | StrOutputParser()
-        )
-
         logger.info("AnswerGenerator initialized successfully")
 
     def _format_documents(self, documents: List[Document]) -> str:
         """
         Format documents into a single string for the prompt.
 
-        Joins all document page_contents with double newlines between them.
+        Joins the document page_contents with double newlines between them,
+        skipping duplicate contents and truncating at
+        settings.MAX_CONTEXT_CHARS when set.
 
         Args:
             documents: List of Document objects
@@ -103,15 +186,139 @@ class AnswerGenerator:
 
             Doc 2
         """
-        return "\n\n".join(doc.page_content for doc in documents)
+        return _build_context(map(_page_content, documents), settings.MAX_CONTEXT_CHARS)
 
-    def generate(self, question: str, documents: List[Document]) -> str:
+    def _format_documents_cached(self, documents: List[Document]) -> str:
+        """
+        Format documents like _format_documents, reusing earlier results.
+
+        The cache is keyed on the documents' contents, so regenerations over
+        the same documents build the context only once. String hashes are
+        cached by Python, so building the key does not rescan the text.
+
+        Args:
+            documents: List of Document objects
+
+        Returns:
+            Formatted string with all document contents
+        """
+        return _join_contents(tuple(map(_page_content, documents)), settings.MAX_CONTEXT_CHARS)
+
+    @staticmethod
+    def _validate(question: str, documents: List[Document]) -> None:
+        """
+        Check a generation request before any work is done.
+
+        Raises:
+            ValueError: If question is empty or no documents provided
+        """
+        if not question:
+            raise ValueError("Question cannot be empty")
+
+        if not documents:
+            raise ValueError("At least one document must be provided")
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached answers."""
+        _get_answer_cache.cache_clear()
+
+    def _cache_key(
+        self,
+        question: str,
+        documents: List[Document],
+        over_budget: bool = False,
+        light: bool = False,
+    ) -> tuple:
+        """Build the answer cache key for a request."""
+        return (
+            _light_model() if light else settings.GENERATION_MODEL,
+            self.prompt_variant,
+            over_budget,
+            question,
+            tuple(fingerprint(doc.page_content) for doc in documents),
+        )
+
+    def _build_prompt(
+        self, question: str, documents: List[Document], over_budget: bool = False
+    ) -> List[BaseMessage]:
+        """Build the RAG prompt messages for a question and its context documents."""
+        context = self._format_documents_cached(documents)
+        messages: List[BaseMessage] = [
+            HumanMessage(content=self.rag_prompt(question=question, context=context))
+        ]
+        if over_budget:
+            messages.insert(0, SystemMessage(content=_OVER_BUDGET_INSTRUCTION))
+        return messages
+
+    @staticmethod
+    def _summarize_documents(documents: List[Document]) -> str:
+        """Deterministic answer built from the leading documents, without the LLM."""
+        return "\n".join(
+            doc.page_content[:_SUMMARY_CHARS] for doc in documents[:_SUMMARY_DOCUMENTS]
+        )
+
+    def _prepare_request(
+        self,
+        question: str,
+        documents: List[Document],
+        regeneration_count: int,
+        max_regenerations: Optional[int],
+    ) -> Tuple[Optional[str], tuple, object, bool]:
+        """
+        Apply the regeneration budget and answer cache to a request.
+
+        Returns:
+            (answer, cache key, LLM, over_budget); answer is set when the
+            request is served without calling the LLM
+        """
+        # Regenerations allowed after this one; the workflow ends after the
+        # attempt that leaves none
+        remaining = (max_regenerations or settings.MAX_REGENERATIONS) - regeneration_count
+        summarize = settings.GENERATION_BUDGET_SUMMARY
+        if regeneration_count and summarize and remaining <= 0:
+            logger.warning(
+                f"Regeneration budget exhausted ({regeneration_count} attempts), "
+                "summarizing documents instead of calling the LLM"
+            )
+            return self._summarize_documents(documents), (), None, False
+
+        over_budget = bool(regeneration_count) and remaining <= int(summarize)
+        if over_budget:
+            logger.warning(f"Regeneration budget nearly spent ({regeneration_count} attempts)")
+
+        # Return a cached answer for an identical request
+        light = regeneration_count > 0
+        key = self._cache_key(question, documents, over_budget, light)
+        answer_text = _get_answer_cache().get(key)
+        if answer_text is not None:
+            logger.info("Returning cached answer")
+
+        llm = self.llm_light if light else self.llm
+        return answer_text, key, llm, over_budget
+
+    def generate(
+        self,
+        question: str,
+        documents: List[Document],
+        regeneration_count: int = 0,
+        max_regenerations: Optional[int] = None,
+    ) -> str:
         """
         Generate an answer to a question using retrieved documents.
 
+        Regenerations are answered by the light model and checked against
+        their budget: on the last regeneration max_regenerations allows, the
+        LLM is told to give a final concise answer from the context. With
+        settings.GENERATION_BUDGET_SUMMARY, that instruction moves to the
+        second-to-last regeneration and the last one returns the leading
+        documents without calling the LLM.
+
         Args:
             question: The user's question
             documents: List of retrieved documents for context
+            regeneration_count: Regeneration attempts made so far
+            max_regenerations: Regeneration budget (default: settings.MAX_REGENERATIONS)
 
         Returns:
             Generated answer string
@@ -126,28 +333,31 @@ class AnswerGenerator:
             >>> documents = [doc1, doc2, doc3]
             >>> answer = generator.generate(question, documents)
         """
-        if not question:
-            raise ValueError("Question cannot be empty")
-
-        if not documents:
-            raise ValueError("At least one document must be provided")
+        self._validate(question, documents)
 
         logger.info(f"Generating answer for question: {question[:100]}...")
-        logger.debug(f"Number of context documents: {len(documents)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Number of context documents: {len(documents)}")
 
-        try:
-            # Format the context from documents
-            context = self._format_documents(documents)
+        answer_text, key, llm, over_budget = self._prepare_request(
+            question, documents, regeneration_count, max_regenerations
+        )
+        if answer_text is not None:
+            return answer_text
 
-            # Create the prompt with question and context
-            prompt = self.rag_prompt.invoke({"question": question, "context": context})
+        try:
+            # Create the prompt with question and formatted context
+            prompt = self._build_prompt(question, documents, over_budget)
 
             # Generate the answer
-            answer = self.llm.invoke(prompt)
+            answer = llm.invoke(prompt)
             answer_text = answer.content
+            _get_answer_cache().put(key, answer_text)
 
             logger.info("Answer generated successfully")
-            logger.debug(f"Generated answer: {answer_text[:200]}...")
+            # Skip slicing the answer when debug logging is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Generated answer: {answer_text[:200]}...")
 
             return answer_text
 
@@ -155,16 +365,98 @@ class AnswerGenerator:
             logger.error(f"Failed to generate answer: {e}")
             raise Exception(f"Answer generation failed: {e}")
 
-    def generate_stream(self, question: str, documents: List[Document]):
+    async def agenerate(self, question: str, documents: List[Document]) -> str:
+        """
+        Generate an answer without blocking the event loop.
+
+        Async counterpart of generate(), sharing its validation and answer
+        cache.
+
+        Args:
+            question: The user's question
+            documents: List of retrieved documents for context
+
+        Returns:
+            Generated answer string
+
+        Raises:
+            ValueError: If question is empty or no documents provided
+            Exception: If generation fails
+
+        Example:
+            >>> answer = await generator.agenerate(question, documents)
+        """
+        self._validate(question, documents)
+
+        logger.info(f"Generating answer asynchronously for question: {question[:100]}...")
+
+        key = self._cache_key(question, documents)
+        answer_text = _get_answer_cache().get(key)
+        if answer_text is not None:
+            logger.info("Returning cached answer")
+            return answer_text
+
+        try:
+            prompt = self._build_prompt(question, documents)
+
+            answer = await run_on_llm_loop(self.llm.ainvoke(prompt))
+            answer_text = answer.content
+            _get_answer_cache().put(key, answer_text)
+
+            logger.info("Answer generated successfully")
+            return answer_text
+
+        except Exception as e:
+            logger.error(f"Failed to generate answer: {e}")
+            raise Exception(f"Answer generation failed: {e}")
+
+    async def agenerate_many(
+        self,
+        pairs: List[Tuple[str, List[Document]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate answers for several requests concurrently.
+
+        Args:
+            pairs: (question, documents) tuples
+            max_concurrency: Concurrent LLM requests (default: settings.MAX_CONCURRENT_LLM)
+
+        Returns:
+            Answers in the same order as pairs
+
+        Example:
+            >>> answers = await generator.agenerate_many([(q1, docs), (q2, docs)])
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.MAX_CONCURRENT_LLM)
+
+        async def bounded(question: str, documents: List[Document]) -> str:
+            async with semaphore:
+                return await self.agenerate(question, documents)
+
+        return await asyncio.gather(*(bounded(q, docs) for q, docs in pairs))
+
+    def generate_stream(
+        self,
+        question: str,
+        documents: List[Document],
+        regeneration_count: int = 0,
+        max_regenerations: Optional[int] = None,
+    ):
         """
         Generate an answer with streaming output.
 
         Yields chunks of the generated answer as they are produced.
-        Useful for real-time display in CLI or UI.
+        Useful for real-time display in CLI or UI. Applies the same
+        regeneration budget and answer cache as generate(); an answer that
+        needs no LLM call is yielded as a single chunk, and a streamed answer
+        is cached once the stream completes.
 
         Args:
             question: The user's question
             documents: List of retrieved documents for context
+            regeneration_count: Regeneration attempts made so far
+            max_regenerations: Regeneration budget (default: settings.MAX_REGENERATIONS)
 
         Yields:
             Chunks of the generated answer
@@ -174,18 +466,27 @@ class AnswerGenerator:
             >>> for chunk in generator.generate_stream(question, documents):
             ...     print(chunk, end='', flush=True)
         """
-        if not question:
-            raise ValueError("Question cannot be empty")
-
-        if not documents:
-            raise ValueError("At least one document must be provided")
+        self._validate(question, documents)
 
         logger.info(f"Generating streaming answer for question: {question[:100]}...")
 
+        answer_text, key, llm, over_budget = self._prepare_request(
+            question, documents, regeneration_count, max_regenerations
+        )
+        if answer_text is not None:
+            yield answer_text
+            return
+
         try:
-            # Stream the RAG chain
-            for chunk in self.chain.stream(question):
-                yield chunk
+            # Build the prompt once and stream straight from the LLM
+            prompt = self._build_prompt(question, documents, over_budget)
+
+            chunks = []
+            for chunk in llm.stream(prompt):
+                chunks.append(chunk.content)
+                yield chunk.content
+
+            _get_answer_cache().put(key, "".join(chunks))
 
         except Exception as e:
             logger.error(f"Failed to generate streaming answer: {e}")
@@ -193,9 +494,13 @@ class AnswerGenerator:
 
     def count_tokens(self, question: str, documents: List[Document]) -> dict:
         """
-        Estimate token counts for the generation request.
+        Count tokens for the generation request.
 
-        Useful for monitoring usage and costs.
+        Useful for monitoring usage and costs. The question and each distinct
+        document are encoded in one tiktoken batch without joining the
+        context. The
+        cl100k_base encoding approximates the Ollama model's tokenizer; if
+        it is unavailable, about 4 characters per token is assumed.
 
         Args:
             question: The user's question
@@ -208,10 +513,17 @@ class AnswerGenerator:
             >>> counts = generator.count_tokens(question, documents)
             >>> print(f"Total tokens: {counts['total']}")
         """
-        # Rough estimation: 1 token ≈ 4 characters for English text
-        question_tokens = len(question) // 4
-        context_text = self._format_documents(documents)
-        context_tokens = len(context_text) // 4
+        texts = [question, *dict.fromkeys(map(_page_content, documents))]
+
+        encoding = _get_encoding()
+        if encoding is not None:
+            counts = [len(tokens) for tokens in encoding.encode_batch(texts, disallowed_special=())]
+        else:
+            # Rough estimation: 1 token ≈ 4 characters for English text
+            counts = [len(text) // 4 for text in texts]
+
+        question_tokens = counts[0]
+        context_tokens = sum(counts[1:])
 
         return {
             "question": question_tokens,
@@ -236,8 +548,13 @@ def generate_answer(question: str, documents: List[Document]) -> str:
         >>> from src.agents.generator import generate_answer
         >>> answer = generate_answer(question, documents)
     """
-    generator = AnswerGenerator()
-    return generator.generate(question, documents)
+    return _default_generator().generate(question, documents)
+
+
+@lru_cache(maxsize=1)
+def _default_generator() -> AnswerGenerator:
+    """Get the baseline AnswerGenerator shared by generate_answer."""
+    return AnswerGenerator()
 
 
 if __name__ == "__main__":
@@ -6,17 +6,25 @@ of the RAG system, including document relevance, hallucination detection,
 and answer usefulness.
 """
 
+import asyncio
+import io
 import json
 import logging
-from typing import Dict, Any
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
 
 from config.settings import settings
+from src.agents._llm_pool import get_chat_ollama, get_llm_loop, run_on_llm_loop
+from src.agents._grade_cache import ExactCache, SemanticGradeCache, fingerprint, pair_vector
 from config.prompts import (
     RELEVANCE_GRADER_PROMPT,
+    RELEVANCE_GRADER_BATCH_PROMPT,
     HALLUCINATION_GRADER_PROMPT,
     ANSWER_GRADER_PROMPT
 )
@@ -24,6 +32,266 @@ from config.prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Score field of a grader's JSON response, and a bare yes/no answer
+_SCORE_RE = re.compile(r'"score"\s*:\s*"(yes|no)"', re.IGNORECASE)
+_WORD_RE = re.compile(r"\b(yes|no)\b", re.IGNORECASE)
+
+# JSON schemas passed as Ollama's `format`, so decoding is constrained to the
+# expected object and the model cannot spend tokens on a reasoning preamble
+_SCORE_FORMAT = {
+    "type": "object",
+    "properties": {"score": {"type": "string", "enum": ["yes", "no"]}},
+    "required": ["score"],
+}
+_SCORES_FORMAT = {
+    "type": "object",
+    "properties": {
+        "scores": {"type": "array", "items": {"type": "string", "enum": ["yes", "no"]}},
+    },
+    "required": ["scores"],
+}
+
+
+def _grade_concurrently(
+    grade: Callable[..., str],
+    pairs: Sequence[Tuple[Any, Any]],
+    max_workers: Optional[int] = None,
+) -> list[str]:
+    """
+    Run a grader over many inputs with concurrent LLM requests.
+
+    Each pair is unpacked into `grade`. Scores are returned in input order,
+    and the first failure is re-raised.
+
+    Args:
+        grade: Bound single-sample grade method
+        pairs: Argument tuples, one per sample
+        max_workers: Concurrent requests (default: settings.GRADING_WORKERS)
+
+    Returns:
+        List of "yes"/"no" scores, one per pair
+    """
+    if not pairs:
+        return []
+
+    workers = min(max_workers or settings.GRADING_WORKERS, len(pairs))
+    if workers == 1:
+        return [grade(*pair) for pair in pairs]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grader") as executor:
+        return list(executor.map(lambda pair: grade(*pair), pairs))
+
+
+def _parse_yes_no(response_text: str) -> str:
+    """
+    Extract a "yes"/"no" score from a grader response.
+
+    Expects JSON like {"score": "yes"}, matched with a precompiled regex
+    instead of a full JSON parse. Requests constrain the output to that
+    shape, but Ollama servers without structured output support ignore the
+    schema, so otherwise the first standalone "yes" or "no" in the text is
+    used, so words like "yesterday" do not count.
+    A response with neither is scored "no".
+    """
+    match = _SCORE_RE.search(response_text)
+    if match:
+        return match.group(1).lower()
+
+    logger.warning("No JSON score in response, using text matching")
+    match = _WORD_RE.search(response_text)
+    if match:
+        return match.group(1).lower()
+
+    logger.warning("No score found in response, defaulting to 'no'")
+    return "no"
+
+
+def _truncate(text: str) -> str:
+    """Cut a document to settings.GRADER_MAX_DOC_CHARS for a grading prompt."""
+    limit = settings.GRADER_MAX_DOC_CHARS
+    return text[:limit] if limit else text
+
+
+def _bounded_context(documents: Sequence[Document]) -> str:
+    """
+    Join truncated documents with blank lines, up to settings.HALLUCINATION_MAX_CHARS.
+
+    Writing stops once the budget is spent, so documents past it are never
+    copied into an intermediate joined string.
+    """
+    budget = settings.HALLUCINATION_MAX_CHARS or sys.maxsize
+    buffer = io.StringIO()
+    for i, doc in enumerate(documents):
+        if i:
+            if budget <= 2:
+                break
+            buffer.write("\n\n")
+            budget -= 2
+        chunk = _truncate(doc.page_content)[:budget]
+        buffer.write(chunk)
+        budget -= len(chunk)
+        if budget <= 0:
+            break
+    return buffer.getvalue()
+
+
+def _grader_model() -> str:
+    """Model used by the yes/no graders, falling back to the grading model."""
+    return settings.GRADING_MODEL_SMALL or settings.GRADING_MODEL
+
+
+@lru_cache(maxsize=1)
+def _get_result_cache() -> ExactCache:
+    """Get the process-wide cache of grades for byte-identical requests."""
+    return ExactCache(max_entries=settings.GRADE_CACHE_SIZE)
+
+
+def _result_key(kind: str, *texts: str) -> tuple:
+    """Exact cache key for a grading request of the given kind."""
+    return (kind, _grader_model(), *map(fingerprint, texts))
+
+
+@lru_cache(maxsize=1)
+def _get_semantic_cache() -> SemanticGradeCache:
+    """Get the process-wide semantic cache of relevance grades."""
+    return SemanticGradeCache(
+        threshold=settings.GRADE_CACHE_SIMILARITY,
+        ttl_seconds=settings.GRADE_CACHE_TTL_SECONDS,
+    )
+
+
+def _embed_question(question: str) -> list[float]:
+    """Embed a question, reusing the vector computed during retrieval."""
+    from src.vectorstore.chroma_store import embed_query
+    return embed_query(question)
+
+
+def _grade_pair_vector(question: str, document: Document):
+    """
+    Embed a (question, document) pair for the semantic grade cache.
+
+    Document embeddings go through the vector store's embedder, so chunks
+    indexed earlier are served from the embedding cache.
+
+    Returns:
+        Pair vector, or None if embedding failed
+    """
+    from src.vectorstore.chroma_store import get_vector_store
+
+    try:
+        document_vector = get_vector_store().embeddings.embed_documents([document.page_content])[0]
+        return pair_vector(_embed_question(question), document_vector)
+    except Exception as e:
+        logger.warning(f"Skipping semantic grade cache, embedding failed: {e}")
+        return None
+
+
+def _lookup_relevance(question: str, document: Document) -> Tuple[tuple, Optional[str], Any]:
+    """
+    Look up a relevance grade in the exact and semantic caches.
+
+    A semantic hit, the grade of a near-identical pair graded earlier, is
+    copied into the exact cache.
+
+    Returns:
+        Tuple of (exact cache key, cached score or None, pair vector for
+        _store_relevance or None)
+    """
+    key = _result_key("relevance", question, document.page_content)
+    score = _get_result_cache().get(key)
+    if score is not None:
+        return key, score, None
+
+    vector = None
+    if settings.GRADE_SEMANTIC_CACHE:
+        vector = _grade_pair_vector(question, document)
+        if vector is not None:
+            score = _get_semantic_cache().lookup(vector)
+            if score is not None:
+                logger.debug(f"Document grade served from semantic cache: {score}")
+                _get_result_cache().put(key, score)
+    return key, score, vector
+
+
+def _store_relevance(key: tuple, vector: Any, score: str) -> None:
+    """Cache a fresh relevance grade under the keys from _lookup_relevance."""
+    _get_result_cache().put(key, score)
+    if vector is not None:
+        _get_semantic_cache().add(vector, score)
+
+
+def _stream_first_yes_no(llm, prompt: str) -> str:
+    """
+    Stream a grader response and stop as soon as its score is decoded.
+
+    Closing the stream drops the connection, so Ollama stops decoding the
+    rest of the response. A response that ends without a JSON score is
+    parsed by _parse_yes_no.
+    """
+    buffer = ""
+    stream = llm.stream(prompt, format=_SCORE_FORMAT)
+    try:
+        for chunk in stream:
+            buffer += chunk.content
+            match = _SCORE_RE.search(buffer)
+            if match:
+                return match.group(1).lower()
+    finally:
+        stream.close()
+    return _parse_yes_no(buffer.strip())
+
+
+async def _astream_first_yes_no(llm, prompt: str) -> str:
+    """Async counterpart of _stream_first_yes_no."""
+    buffer = ""
+    stream = llm.astream(prompt, format=_SCORE_FORMAT)
+    try:
+        async for chunk in stream:
+            buffer += chunk.content
+            match = _SCORE_RE.search(buffer)
+            if match:
+                return match.group(1).lower()
+    finally:
+        await stream.aclose()
+    return _parse_yes_no(buffer.strip())
+
+
+def _request_score(llm, prompt: str) -> str:
+    """Send a single-score grading prompt and parse the yes/no answer."""
+    if settings.GRADER_STREAM_EARLY_EXIT:
+        return _stream_first_yes_no(llm, prompt)
+    response = llm.invoke(prompt, format=_SCORE_FORMAT)
+    return _parse_yes_no(response.content.strip())
+
+
+async def _arequest_score(llm, prompt: str) -> str:
+    """Async counterpart of _request_score."""
+    if settings.GRADER_STREAM_EARLY_EXIT:
+        return await run_on_llm_loop(_astream_first_yes_no(llm, prompt))
+    response = await run_on_llm_loop(llm.ainvoke(prompt, format=_SCORE_FORMAT))
+    return _parse_yes_no(response.content.strip())
+
+
+def _parse_scores(response_text: str, expected: int) -> Optional[list[str]]:
+    """
+    Extract per-document scores from a batch grader response.
+
+    Expects JSON like {"scores": ["yes", "no"]}. Returns None unless it
+    holds exactly `expected` valid scores.
+    """
+    try:
+        scores = json.loads(response_text).get("scores")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+    if not isinstance(scores, list) or len(scores) != expected:
+        return None
+
+    scores = [str(score).lower() for score in scores]
+    if any(score not in ("yes", "no") for score in scores):
+        return None
+    return scores
+
 
 class DocumentGrader:
     """
@@ -53,20 +321,40 @@ class DocumentGrader:
 
         Loads the grading model from settings and builds the grading chain.
         """
-        logger.info(f"Initializing DocumentGrader with model: {settings.GRADING_MODEL}")
+        logger.info(f"Initializing DocumentGrader with model: {_grader_model()}")
 
         # Initialize the LLM
-        self.llm = ChatOllama(
-            model=settings.GRADING_MODEL,
+        self.llm = get_chat_ollama(
+            _grader_model(),
             temperature=0,  # Temperature 0 for deterministic grading
-            base_url=settings.OLLAMA_BASE_URL,
+            keep_alive=settings.OLLAMA_KEEP_ALIVE,  # Keep the model and prompt cache resident
         )
 
-        # Create the prompt template
+        # Create the prompt templates. Grading fills the raw template strings
+        # with str.format, skipping ChatPromptTemplate's per-call message
+        # construction and validation; the LLM wraps the string in one
+        # human message, as the template would.
         self.prompt = ChatPromptTemplate.from_template(RELEVANCE_GRADER_PROMPT)
+        self.batch_prompt = ChatPromptTemplate.from_template(RELEVANCE_GRADER_BATCH_PROMPT)
+        self._format_prompt = RELEVANCE_GRADER_PROMPT.format
+        self._format_batch_prompt = RELEVANCE_GRADER_BATCH_PROMPT.format
 
         logger.info("DocumentGrader initialized successfully")
 
+    @staticmethod
+    def _validate(question: str, document: Document) -> None:
+        """
+        Check a grading request before any work is done.
+
+        Raises:
+            ValueError: If question or document is empty
+        """
+        if not question:
+            raise ValueError("Question cannot be empty")
+
+        if not document or not document.page_content:
+            raise ValueError("Document cannot be empty")
+
     def grade(self, question: str, document: Document) -> str:
         """
         Grade a document's relevance to a question.
@@ -90,47 +378,75 @@ class DocumentGrader:
             >>> print(result)
             "yes"
         """
-        if not question:
-            raise ValueError("Question cannot be empty")
+        self._validate(question, document)
 
-        if not document or not document.page_content:
-            raise ValueError("Document cannot be empty")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Grading document for question: {question[:100]}...")
+            logger.debug(f"Document preview: {document.page_content[:100]}...")
 
-        logger.debug(f"Grading document for question: {question[:100]}...")
-        logger.debug(f"Document preview: {document.page_content[:100]}...")
+        key, score, vector = _lookup_relevance(question, document)
+        if score is not None:
+            return score
 
         try:
             # Create the prompt with question and document
-            prompt = self.prompt.invoke({
-                "question": question,
-                "document": document.page_content
-            })
+            prompt = self._format_prompt(
+                question=question,
+                document=_truncate(document.page_content)
+            )
 
             # Generate the grade
-            response = self.llm.invoke(prompt)
-            response_text = response.content.strip()
+            score = _request_score(self.llm, prompt)
+            _store_relevance(key, vector, score)
 
-            # Parse JSON response
-            try:
-                # Try to parse as JSON
-                result = json.loads(response_text)
-                score = result.get("score", "").lower()
-
-                # Validate score
-                if score not in ["yes", "no"]:
-                    logger.warning(f"Invalid score '{score}', defaulting to 'no'")
-                    score = "no"
-
-                logger.debug(f"Document graded as: {score}")
-                return score
-
-            except json.JSONDecodeError:
-                # Fallback: check if response contains "yes"
-                logger.warning(f"Failed to parse JSON, using text matching")
-                if "yes" in response_text.lower():
-                    return "yes"
-                else:
-                    return "no"
+            logger.debug(f"Document graded as: {score}")
+            return score
+
+        except Exception as e:
+            logger.error(f"Failed to grade document: {e}")
+            raise Exception(f"Document grading failed: {e}")
+
+    async def agrade(self, question: str, document: Document) -> str:
+        """
+        Grade a document's relevance without blocking the event loop.
+
+        Async counterpart of grade().
+
+        Args:
+            question: The user's question
+            document: The document to grade
+
+        Returns:
+            "yes" if document is relevant, "no" if not relevant
+
+        Raises:
+            ValueError: If question or document is empty
+            Exception: If grading fails
+
+        Example:
+            >>> result = await grader.agrade(question, document)
+        """
+        self._validate(question, document)
+
+        if settings.GRADE_SEMANTIC_CACHE:
+            # Embedding the pair is a blocking request; keep it off the loop
+            key, score, vector = await asyncio.to_thread(_lookup_relevance, question, document)
+        else:
+            key, score, vector = _lookup_relevance(question, document)
+        if score is not None:
+            return score
+
+        try:
+            prompt = self._format_prompt(
+                question=question,
+                document=_truncate(document.page_content)
+            )
+
+            score = await _arequest_score(self.llm, prompt)
+            _store_relevance(key, vector, score)
+
+            logger.debug(f"Document graded as: {score}")
+            return score
 
         except Exception as e:
             logger.error(f"Failed to grade document: {e}")
@@ -140,6 +456,10 @@ class DocumentGrader:
         """
         Grade multiple documents for relevance to a question.
 
+        Documents are graded with up to settings.GRADING_WORKERS requests
+        in flight, so the Ollama round-trips overlap. Ollama serves them in
+        parallel up to its OLLAMA_NUM_PARALLEL server setting.
+
         Args:
             question: The user's question
             documents: List of documents to grade
@@ -155,11 +475,7 @@ class DocumentGrader:
         """
         logger.info(f"Grading {len(documents)} documents")
 
-        scores = []
-        for i, doc in enumerate(documents):
-            logger.debug(f"Grading document {i+1}/{len(documents)}")
-            score = self.grade(question, doc)
-            scores.append(score)
+        scores = _grade_concurrently(self.grade, [(question, doc) for doc in documents])
 
         # Count relevant documents
         relevant_count = sum(1 for s in scores if s == "yes")
@@ -167,6 +483,104 @@ class DocumentGrader:
 
         return scores
 
+    def grade_batch_single_call(
+        self,
+        question: str,
+        documents: list[Document],
+        batch_size: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Grade documents with one LLM request per group of documents.
+
+        Each group of up to batch_size documents is sent as one numbered
+        prompt, so the instructions and question are processed once per
+        group instead of once per document. A group whose response does not
+        hold one valid score per document is graded document by document.
+
+        Args:
+            question: The user's question
+            documents: List of documents to grade
+            batch_size: Documents per request (default: settings.GRADER_BATCH_SIZE)
+
+        Returns:
+            List of "yes"/"no" scores for each document
+
+        Raises:
+            ValueError: If question or a document is empty
+            Exception: If grading fails
+
+        Example:
+            >>> grader = DocumentGrader()
+            >>> grader.grade_batch_single_call(question, documents)
+            ["yes", "no", "yes"]
+        """
+        for document in documents:
+            self._validate(question, document)
+
+        batch_size = batch_size or settings.GRADER_BATCH_SIZE
+        logger.info(f"Grading {len(documents)} documents, {batch_size} per request")
+
+        scores: list[str] = []
+        for start in range(0, len(documents), batch_size):
+            group = documents[start:start + batch_size]
+            numbered = "\n\n".join(
+                f"[{i}] {_truncate(doc.page_content)}" for i, doc in enumerate(group, 1)
+            )
+
+            try:
+                prompt = self._format_batch_prompt(question=question, documents=numbered)
+                response = self.llm.invoke(prompt, format=_SCORES_FORMAT)
+            except Exception as e:
+                logger.error(f"Failed to grade documents: {e}")
+                raise Exception(f"Document grading failed: {e}")
+
+            group_scores = _parse_scores(response.content.strip(), len(group))
+            if group_scores is None:
+                logger.warning(
+                    f"Batch response did not score {len(group)} documents, grading individually"
+                )
+                group_scores = _grade_concurrently(self.grade, [(question, doc) for doc in group])
+            scores.extend(group_scores)
+
+        relevant_count = sum(1 for s in scores if s == "yes")
+        logger.info(f"Grading complete: {relevant_count}/{len(documents)} relevant")
+
+        return scores
+
+    async def agrade_batch(
+        self,
+        question: str,
+        documents: list[Document],
+        max_concurrency: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Grade multiple documents concurrently on the event loop.
+
+        Args:
+            question: The user's question
+            documents: List of documents to grade
+            max_concurrency: Concurrent requests (default: settings.GRADING_WORKERS)
+
+        Returns:
+            List of "yes"/"no" scores in the same order as documents
+
+        Example:
+            >>> scores = await grader.agrade_batch(question, documents)
+        """
+        logger.info(f"Grading {len(documents)} documents asynchronously")
+        semaphore = asyncio.Semaphore(max_concurrency or settings.GRADING_WORKERS)
+
+        async def bounded(document: Document) -> str:
+            async with semaphore:
+                return await self.agrade(question, document)
+
+        scores = await asyncio.gather(*(bounded(doc) for doc in documents))
+
+        relevant_count = sum(1 for s in scores if s == "yes")
+        logger.info(f"Grading complete: {relevant_count}/{len(documents)} relevant")
+
+        return scores
+
 
 class HallucinationGrader:
     """
@@ -192,20 +606,48 @@ class HallucinationGrader:
         """
         Initialize the HallucinationGrader with Ollama LLM.
         """
-        logger.info(f"Initializing HallucinationGrader with model: {settings.GRADING_MODEL}")
+        logger.info(f"Initializing HallucinationGrader with model: {_grader_model()}")
 
         # Initialize the LLM
-        self.llm = ChatOllama(
-            model=settings.GRADING_MODEL,
+        self.llm = get_chat_ollama(
+            _grader_model(),
             temperature=0,
-            base_url=settings.OLLAMA_BASE_URL,
+            keep_alive=settings.OLLAMA_KEEP_ALIVE,
         )
 
         # Create the prompt template
         self.prompt = ChatPromptTemplate.from_template(HALLUCINATION_GRADER_PROMPT)
+        self._format_prompt = HALLUCINATION_GRADER_PROMPT.format
 
         logger.info("HallucinationGrader initialized successfully")
 
+    @staticmethod
+    def _validate(generation: str, documents: list[Document]) -> None:
+        """
+        Check a grading request before any work is done.
+
+        Raises:
+            ValueError: If generation is empty or no documents provided
+        """
+        if not generation:
+            raise ValueError("Generation cannot be empty")
+
+        if not documents:
+            raise ValueError("At least one document must be provided")
+
+    @staticmethod
+    def _result_key(generation: str, documents: list[Document]) -> tuple:
+        """Exact cache key over the generation and every document."""
+        return _result_key("hallucination", generation, *(doc.page_content for doc in documents))
+
+    @staticmethod
+    def _prompt_inputs(generation: str, documents: list[Document]) -> Dict[str, str]:
+        """Prompt variables with the documents joined into one bounded context."""
+        return {
+            "documents": _bounded_context(documents),
+            "generation": generation
+        }
+
     def grade(self, generation: str, documents: list[Document]) -> str:
         """
         Grade whether a generation is grounded in documents.
@@ -223,51 +665,92 @@ class HallucinationGrader:
             >>> print(result)
             "yes"
         """
-        if not generation:
-            raise ValueError("Generation cannot be empty")
-
-        if not documents:
-            raise ValueError("At least one document must be provided")
+        self._validate(generation, documents)
 
         logger.debug(f"Checking if generation is grounded: {generation[:100]}...")
 
-        try:
-            # Format documents into context
-            context = "\n\n".join(doc.page_content for doc in documents)
+        key = self._result_key(generation, documents)
+        score = _get_result_cache().get(key)
+        if score is not None:
+            return score
 
-            # Create the prompt
-            prompt = self.prompt.invoke({
-                "documents": context,
-                "generation": generation
-            })
+        try:
+            # Create the prompt with formatted documents as context
+            prompt = self._format_prompt(**self._prompt_inputs(generation, documents))
 
             # Generate the grade
-            response = self.llm.invoke(prompt)
-            response_text = response.content.strip()
+            score = _request_score(self.llm, prompt)
+            _get_result_cache().put(key, score)
 
-            # Parse JSON response
-            try:
-                result = json.loads(response_text)
-                score = result.get("score", "").lower()
+            logger.debug(f"Hallucination check: {score}")
+            return score
+
+        except Exception as e:
+            logger.error(f"Failed to grade hallucination: {e}")
+            raise Exception(f"Hallucination grading failed: {e}")
+
+    async def agrade(self, generation: str, documents: list[Document]) -> str:
+        """
+        Grade whether a generation is grounded without blocking the event loop.
+
+        Async counterpart of grade().
+
+        Args:
+            generation: The generated answer
+            documents: The source documents
+
+        Returns:
+            "yes" if grounded, "no" if hallucinated
 
-                if score not in ["yes", "no"]:
-                    logger.warning(f"Invalid score '{score}', defaulting to 'no'")
-                    score = "no"
+        Example:
+            >>> result = await grader.agrade("Agentic RAG uses...", documents)
+        """
+        self._validate(generation, documents)
 
-                logger.debug(f"Hallucination check: {score}")
-                return score
+        key = self._result_key(generation, documents)
+        score = _get_result_cache().get(key)
+        if score is not None:
+            return score
 
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse JSON, using text matching")
-                if "yes" in response_text.lower():
-                    return "yes"
-                else:
-                    return "no"
+        try:
+            prompt = self._format_prompt(**self._prompt_inputs(generation, documents))
+
+            score = await _arequest_score(self.llm, prompt)
+            _get_result_cache().put(key, score)
+
+            logger.debug(f"Hallucination check: {score}")
+            return score
 
         except Exception as e:
             logger.error(f"Failed to grade hallucination: {e}")
             raise Exception(f"Hallucination grading failed: {e}")
 
+    def grade_many(
+        self,
+        pairs: list[tuple[str, list[Document]]],
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Grade several generations concurrently.
+
+        Issues one request per pair, up to max_workers at a time, so the
+        LLM round-trips overlap instead of running back to back.
+
+        Args:
+            pairs: (generation, documents) tuples
+            max_workers: Concurrent requests (default: settings.GRADING_WORKERS)
+
+        Returns:
+            List of "yes"/"no" scores in the same order as pairs
+
+        Example:
+            >>> grader = HallucinationGrader()
+            >>> grader.grade_many([(answer1, documents), (answer2, documents)])
+            ["yes", "no"]
+        """
+        logger.info(f"Checking {len(pairs)} generations for hallucination")
+        return _grade_concurrently(self.grade, pairs, max_workers)
+
 
 class AnswerGrader:
     """
@@ -293,20 +776,35 @@ class AnswerGrader:
         """
         Initialize the AnswerGrader with Ollama LLM.
         """
-        logger.info(f"Initializing AnswerGrader with model: {settings.GRADING_MODEL}")
+        logger.info(f"Initializing AnswerGrader with model: {_grader_model()}")
 
         # Initialize the LLM
-        self.llm = ChatOllama(
-            model=settings.GRADING_MODEL,
+        self.llm = get_chat_ollama(
+            _grader_model(),
             temperature=0,
-            base_url=settings.OLLAMA_BASE_URL,
+            keep_alive=settings.OLLAMA_KEEP_ALIVE,
         )
 
         # Create the prompt template
         self.prompt = ChatPromptTemplate.from_template(ANSWER_GRADER_PROMPT)
+        self._format_prompt = ANSWER_GRADER_PROMPT.format
 
         logger.info("AnswerGrader initialized successfully")
 
+    @staticmethod
+    def _validate(question: str, generation: str) -> None:
+        """
+        Check a grading request before any work is done.
+
+        Raises:
+            ValueError: If question or generation is empty
+        """
+        if not question:
+            raise ValueError("Question cannot be empty")
+
+        if not generation:
+            raise ValueError("Generation cannot be empty")
+
     def grade(self, question: str, generation: str) -> str:
         """
         Grade whether an answer addresses the question.
@@ -324,48 +822,167 @@ class AnswerGrader:
             >>> print(result)
             "yes"
         """
-        if not question:
-            raise ValueError("Question cannot be empty")
-
-        if not generation:
-            raise ValueError("Generation cannot be empty")
+        self._validate(question, generation)
 
         logger.debug(f"Checking if answer addresses question: {question[:100]}...")
 
+        key = _result_key("answer", question, generation)
+        score = _get_result_cache().get(key)
+        if score is not None:
+            return score
+
         try:
             # Create the prompt
-            prompt = self.prompt.invoke({
-                "question": question,
-                "generation": generation
-            })
+            prompt = self._format_prompt(
+                question=question,
+                generation=generation
+            )
 
             # Generate the grade
-            response = self.llm.invoke(prompt)
-            response_text = response.content.strip()
+            score = _request_score(self.llm, prompt)
+            _get_result_cache().put(key, score)
 
-            # Parse JSON response
-            try:
-                result = json.loads(response_text)
-                score = result.get("score", "").lower()
+            logger.debug(f"Answer usefulness check: {score}")
+            return score
+
+        except Exception as e:
+            logger.error(f"Failed to grade answer: {e}")
+            raise Exception(f"Answer grading failed: {e}")
+
+    async def agrade(self, question: str, generation: str) -> str:
+        """
+        Grade whether an answer addresses the question without blocking the event loop.
+
+        Async counterpart of grade().
+
+        Args:
+            question: The user's question
+            generation: The generated answer
+
+        Returns:
+            "yes" if addresses question, "no" if not
+
+        Example:
+            >>> result = await grader.agrade("What is it?", "It's a system...")
+        """
+        self._validate(question, generation)
+
+        key = _result_key("answer", question, generation)
+        score = _get_result_cache().get(key)
+        if score is not None:
+            return score
 
-                if score not in ["yes", "no"]:
-                    logger.warning(f"Invalid score '{score}', defaulting to 'no'")
-                    score = "no"
+        try:
+            prompt = self._format_prompt(
+                question=question,
+                generation=generation
+            )
 
-                logger.debug(f"Answer usefulness check: {score}")
-                return score
+            score = await _arequest_score(self.llm, prompt)
+            _get_result_cache().put(key, score)
 
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse JSON, using text matching")
-                if "yes" in response_text.lower():
-                    return "yes"
-                else:
-                    return "no"
+            logger.debug(f"Answer usefulness check: {score}")
+            return score
 
         except Exception as e:
             logger.error(f"Failed to grade answer: {e}")
             raise Exception(f"Answer grading failed: {e}")
 
+    def grade_many(
+        self,
+        pairs: list[tuple[str, str]],
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Grade several answers concurrently.
+
+        Args:
+            pairs: (question, generation) tuples
+            max_workers: Concurrent requests (default: settings.GRADING_WORKERS)
+
+        Returns:
+            List of "yes"/"no" scores in the same order as pairs
+
+        Example:
+            >>> grader = AnswerGrader()
+            >>> grader.grade_many([(question, answer1), (question, answer2)])
+            ["yes", "no"]
+        """
+        logger.info(f"Checking usefulness of {len(pairs)} answers")
+        return _grade_concurrently(self.grade, pairs, max_workers)
+
+
+async def agrade_generation(
+    question: str,
+    generation: str,
+    documents: list[Document],
+    hallucination_grader: Optional[HallucinationGrader] = None,
+    answer_grader: Optional[AnswerGrader] = None,
+) -> Tuple[str, str]:
+    """
+    Run the hallucination and usefulness checks on an answer concurrently.
+
+    The two checks are independent once the answer exists, so their LLM
+    requests are awaited together instead of back to back.
+
+    Args:
+        question: The user's question
+        generation: The generated answer
+        documents: The source documents
+        hallucination_grader: Grader to use (default: the shared HallucinationGrader)
+        answer_grader: Grader to use (default: the shared AnswerGrader)
+
+    Returns:
+        (grounded, useful) tuple of "yes"/"no" scores
+
+    Example:
+        >>> grounded, useful = await agrade_generation(question, answer, documents)
+    """
+    hallucination_grader = hallucination_grader or _default_hallucination_grader()
+    answer_grader = answer_grader or _default_answer_grader()
+
+    grounded, useful = await asyncio.gather(
+        hallucination_grader.agrade(generation, documents),
+        answer_grader.agrade(question, generation),
+    )
+    return grounded, useful
+
+
+@lru_cache(maxsize=1)
+def _default_document_grader() -> DocumentGrader:
+    """Get the DocumentGrader shared by the convenience functions."""
+    return DocumentGrader()
+
+
+@lru_cache(maxsize=1)
+def _default_hallucination_grader() -> HallucinationGrader:
+    """Get the HallucinationGrader shared by agrade_generation."""
+    return HallucinationGrader()
+
+
+@lru_cache(maxsize=1)
+def _default_answer_grader() -> AnswerGrader:
+    """Get the AnswerGrader shared by agrade_generation."""
+    return AnswerGrader()
+
+
+@lru_cache(maxsize=1)
+def _get_grading_semaphore() -> asyncio.Semaphore:
+    """Bound the requests in flight across all grade_documents calls."""
+    return asyncio.Semaphore(settings.GRADING_WORKERS)
+
+
+async def _grade_on_pool(question: str, documents: list[Document]) -> list[str]:
+    """Grade documents concurrently under the shared semaphore."""
+    grader = _default_document_grader()
+    semaphore = _get_grading_semaphore()
+
+    async def grade_one(document: Document) -> str:
+        async with semaphore:
+            return await grader.agrade(question, document)
+
+    return list(await asyncio.gather(*(grade_one(doc) for doc in documents)))
+
 
 # Convenience functions for simple usage
 def grade_document(question: str, document: Document) -> str:
@@ -379,14 +996,17 @@ def grade_document(question: str, document: Document) -> str:
     Returns:
         "yes" if relevant, "no" if not
     """
-    grader = DocumentGrader()
-    return grader.grade(question, document)
+    return _default_document_grader().grade(question, document)
 
 
 def grade_documents(question: str, documents: list[Document]) -> list[str]:
     """
     Convenience function to grade multiple documents.
 
+    Documents are graded on the shared LLM event loop. Requests from all
+    concurrent callers share one limit of settings.GRADING_WORKERS in
+    flight, matched to Ollama's OLLAMA_NUM_PARALLEL.
+
     Args:
         question: The user's question
         documents: List of documents to grade
@@ -394,8 +1014,29 @@ def grade_documents(question: str, documents: list[Document]) -> list[str]:
     Returns:
         List of "yes"/"no" scores
     """
-    grader = DocumentGrader()
-    return grader.grade_batch(question, documents)
+    future = asyncio.run_coroutine_threadsafe(
+        _grade_on_pool(question, documents), get_llm_loop()
+    )
+    return future.result()
+
+
+def warmup() -> bool:
+    """
+    Load the grading model into Ollama ahead of the first real request.
+
+    Sends a one-token request so the model is resident (for
+    settings.OLLAMA_KEEP_ALIVE) when the first question is graded.
+
+    Returns:
+        True if the model answered, False if Ollama could not be reached
+    """
+    try:
+        _default_document_grader().llm.invoke("ping", options={"num_predict": 1})
+        logger.info(f"Grading model {_grader_model()} warmed up")
+        return True
+    except Exception as e:
+        logger.warning(f"Grading model warmup failed: {e}")
+        return False
 
 
 if __name__ == "__main__":
@@ -6,18 +6,57 @@ retrieval quality by rewriting vague or unclear queries.
 """
 
 import logging
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Sequence, Union
 
-from langchain_ollama import ChatOllama
+import numpy as np
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from config.settings import settings
 from config.prompts import QUERY_REWRITER_PROMPT
+from src.agents._grade_cache import ExactCache, fingerprint
+from src.agents._llm_pool import get_chat_ollama
 
 
 logger = logging.getLogger(__name__)
 
+# Question whose subject is only a pronoun ("How does it work?"), which a
+# rewrite should resolve however long the question is
+_VAGUE_SUBJECT_RE = re.compile(r"^\s*(how|what|why)\s+(does|is|are)\s+(it|this|that|they)\b", re.IGNORECASE)
+
+
+def _rewriter_model() -> str:
+    """Model used for query rewriting, falling back to the grading model."""
+    return settings.REWRITER_MODEL or settings.GRADING_MODEL
+
+
+# Relevance scores as "yes"/"no" strings, or a 0/1 array from relevance_mask
+Scores = Union[Sequence[str], np.ndarray]
+
+
+def relevance_mask(scores: Scores) -> np.ndarray:
+    """
+    Convert relevance scores to a 0/1 array, one entry per document.
+
+    Arrays are returned unchanged, so callers can convert grader output
+    once and pass the mask to should_rewrite and rewrite_with_history.
+
+    Example:
+        >>> relevance_mask(["yes", "no", "yes"])
+        array([1, 0, 1], dtype=uint8)
+    """
+    if isinstance(scores, np.ndarray):
+        return scores
+    return np.fromiter((s == "yes" for s in scores), dtype=np.uint8, count=len(scores))
+
+
+@lru_cache(maxsize=1)
+def _get_rewrite_cache() -> ExactCache:
+    """Get the process-wide cache of rewrites for identical questions."""
+    return ExactCache(max_entries=settings.GRADE_CACHE_SIZE)
+
 
 class QueryRewriter:
     """
@@ -44,15 +83,14 @@ class QueryRewriter:
         """
         Initialize the QueryRewriter with Ollama LLM.
 
-        Loads the grading model from settings and builds the rewriting chain.
+        Loads the rewriter model from settings and builds the rewriting chain.
         """
-        logger.info(f"Initializing QueryRewriter with model: {settings.GRADING_MODEL}")
+        logger.info(f"Initializing QueryRewriter with model: {_rewriter_model()}")
 
         # Initialize the LLM
-        self.llm = ChatOllama(
-            model=settings.GRADING_MODEL,
+        self.llm = get_chat_ollama(
+            _rewriter_model(),
             temperature=0,  # Temperature 0 for deterministic rewriting
-            base_url=settings.OLLAMA_BASE_URL,
         )
 
         # Create the prompt template
@@ -63,12 +101,29 @@ class QueryRewriter:
 
         logger.info("QueryRewriter initialized successfully")
 
-    def rewrite(self, question: str) -> str:
+    @staticmethod
+    def _is_specific_enough(question: str) -> bool:
+        """
+        Check whether a question is specific enough to retrieve with as-is.
+
+        True for questions of at least settings.REWRITER_MIN_SPECIFIC_WORDS
+        words that do not open with a pronoun subject such as "how does it".
+        """
+        min_words = settings.REWRITER_MIN_SPECIFIC_WORDS
+        return (
+            bool(min_words)
+            and len(question.split()) >= min_words
+            and not _VAGUE_SUBJECT_RE.match(question)
+        )
+
+    def rewrite(self, question: str, force: bool = False) -> str:
         """
         Rewrite a question to improve retrieval quality.
 
         Args:
             question: The original question to rewrite
+            force: Rewrite even a question that looks specific enough, e.g.
+                after it already failed to retrieve relevant documents
 
         Returns:
             Improved question string
@@ -86,9 +141,19 @@ class QueryRewriter:
         if not question:
             raise ValueError("Question cannot be empty")
 
+        if not force and self._is_specific_enough(question):
+            logger.info("Question is already specific, skipping rewrite")
+            return question
+
         logger.info(f"Rewriting question: {question[:100]}...")
         logger.debug(f"Original question: {question}")
 
+        key = (_rewriter_model(), fingerprint(question))
+        cached = _get_rewrite_cache().get(key)
+        if cached is not None:
+            logger.info("Returning cached rewrite")
+            return cached
+
         try:
             # Invoke the rewriting chain
             improved_question = self.chain.invoke({"question": question})
@@ -102,6 +167,8 @@ class QueryRewriter:
             elif improved_question.startswith("'") and improved_question.endswith("'"):
                 improved_question = improved_question[1:-1]
 
+            _get_rewrite_cache().put(key, improved_question)
+
             logger.info("Question rewritten successfully")
             logger.debug(f"Improved question: {improved_question}")
 
@@ -117,7 +184,7 @@ class QueryRewriter:
         self,
         question: str,
         previous_questions: List[str],
-        previous_scores: List[List[str]]
+        previous_scores: Sequence[Scores]
     ) -> str:
         """
         Rewrite question considering retrieval history.
@@ -128,7 +195,7 @@ class QueryRewriter:
         Args:
             question: The current question to rewrite
             previous_questions: List of previous query attempts
-            previous_scores: List of relevance scores for each previous attempt
+            previous_scores: Relevance scores (or relevance_mask arrays) for each previous attempt
 
         Returns:
             Improved question string
@@ -151,8 +218,8 @@ class QueryRewriter:
         if previous_questions:
             context_parts.append("Previous query attempts:")
             for i, (prev_q, scores) in enumerate(zip(previous_questions, previous_scores), 1):
-                relevant_count = sum(1 for s in scores if s == "yes")
-                context_parts.append(f"{i}. '{prev_q}' - {relevant_count}/{len(scores)} relevant")
+                mask = relevance_mask(scores)
+                context_parts.append(f"{i}. '{prev_q}' - {int(mask.sum())}/{mask.size} relevant")
 
         # If we have history, use it to inform the rewrite
         if context_parts:
@@ -161,17 +228,19 @@ class QueryRewriter:
 
             # For now, use the standard rewrite
             # TODO: Could enhance the prompt to include history context
-            return self.rewrite(question)
+            return self.rewrite(question, force=True)
         else:
-            return self.rewrite(question)
+            # Rewriting with history follows failed attempts, so skip the
+            # specificity pre-filter here too
+            return self.rewrite(question, force=True)
 
-    def should_rewrite(self, question: str, relevance_scores: List[str]) -> bool:
+    def should_rewrite(self, question: str, relevance_scores: Scores) -> bool:
         """
         Determine if a question should be rewritten based on retrieval results.
 
         Args:
             question: The current question
-            relevance_scores: List of relevance scores from retrieval
+            relevance_scores: Relevance scores from retrieval, or their relevance_mask
 
         Returns:
             True if should rewrite, False otherwise
@@ -186,11 +255,12 @@ class QueryRewriter:
             True
         """
         # Calculate relevance
-        if not relevance_scores:
+        mask = relevance_mask(relevance_scores)
+        if not mask.size:
             return True  # No scores, should rewrite
 
-        relevant_count = sum(1 for s in relevance_scores if s == "yes")
-        total_count = len(relevance_scores)
+        relevant_count = int(mask.sum())
+        total_count = mask.size
 
         # If no relevant documents, should rewrite
         if relevant_count == 0:
@@ -198,7 +268,7 @@ class QueryRewriter:
             return True
 
         # If low relevance (less than 50%), consider rewriting
-        if relevant_count / total_count < 0.5:
+        if mask.mean() < 0.5:
             logger.info(f"Low relevance ({relevant_count}/{total_count}) - should rewrite")
             return True
 
@@ -206,6 +276,12 @@ class QueryRewriter:
         return False
 
 
+@lru_cache(maxsize=1)
+def _default_rewriter() -> QueryRewriter:
+    """Get the QueryRewriter shared by rewrite_query."""
+    return QueryRewriter()
+
+
 # Convenience functions for simple usage
 def rewrite_query(question: str) -> str:
     """
@@ -222,8 +298,7 @@ def rewrite_query(question: str) -> str:
         >>> improved = rewrite_query("How does it work?")
         >>> print(improved)
     """
-    rewriter = QueryRewriter()
-    return rewriter.rewrite(question)
+    return _default_rewriter().rewrite(question)
 
 
 if __name__ == "__main__":
@@ -1,49 +1,288 @@
 """
 Web Search Agent for Agentic RAG System
 
-This module implements web search functionality using Tavily API (primary)
-and DuckDuckGo (fallback) to retrieve external information when local
-documents are insufficient.
+This module implements web search functionality using Tavily API and
+DuckDuckGo, queried concurrently, to retrieve external information when
+local documents are insufficient.
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import List, Optional
-
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+import requests
 from langchain_core.documents import Document
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config.settings import settings
 from config.prompts import WEB_SEARCH_QUERY_PROMPT
+from src.agents._grade_cache import ExactCache, SemanticGradeCache, fingerprint
+from src.agents._llm_pool import get_chat_ollama
+
+logger = logging.getLogger(__name__)
 
-# Try to import web search libraries
-try:
-    from tavily import TavilyClient
-    TAVILY_AVAILABLE = True
-except ImportError:
-    TAVILY_AVAILABLE = False
-    logging.warning("Tavily not available. Install with: pip install tavily-python")
 
-try:
-    from duckduckgo_search import DDGS
-    DUCKDUCKGO_AVAILABLE = True
-except ImportError:
-    DUCKDUCKGO_AVAILABLE = False
-    logging.warning("DuckDuckGo search not available. Install with: pip install duckduckgo-search")
+_TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+_TAVILY_TIMEOUT_SECONDS = 30
 
+# C-level accessor for the Tavily result fields kept in each Document
+_tavily_fields = itemgetter("content", "url", "title", "score")
 
-logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """
+    Get the HTTP session shared by all Tavily searches.
+
+    The pooled session keeps the TLS connection to the Tavily API alive
+    between searches, so only the first search pays for the handshake.
+    Transient gateway errors are retried with backoff.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# The DuckDuckGo backend is imported on first use: duckduckgo_search pulls
+# in httpx/certifi, which is wasted startup time when Tavily is configured.
+@lru_cache(maxsize=1)
+def _get_ddgs() -> Optional[type]:
+    """Import and cache DDGS, or return None if duckduckgo_search is missing."""
+    try:
+        from duckduckgo_search import DDGS
+    except ImportError:
+        logger.warning("DuckDuckGo search not available. Install with: pip install duckduckgo-search")
+        return None
+    return DDGS
+
+
+# Provider calls in flight across all concurrent searches
+_SEARCH_WORKERS = 4
+
+# Optimized queries kept for reuse by identical and near-identical questions
+_EXACT_QUERY_CACHE_ENTRIES = 1024
+_QUERY_CACHE_ENTRIES = 512
+
+# Questions of at most this many words are turned into a search query by
+# keeping their first keywords instead of asking the LLM
+_FAST_QUERY_MAX_WORDS = 8
+_FAST_QUERY_KEYWORDS = 6
+_KEYWORD_RE = re.compile(r"[A-Za-z0-9][\w'+#.-]*")
+_STOPWORDS = frozenset({
+    "a", "about", "all", "am", "an", "and", "any", "are", "as", "at", "be",
+    "been", "but", "by", "can", "could", "did", "do", "does", "for", "from",
+    "had", "has", "have", "how", "i", "if", "in", "into", "is", "it", "its",
+    "me", "my", "of", "on", "or", "our", "please", "should", "so", "some",
+    "tell", "than", "that", "the", "their", "them", "then", "there", "these",
+    "they", "this", "those", "to", "us", "was", "we", "were", "what",
+    "what's", "when", "where", "which", "who", "whom", "why", "will", "with",
+    "would", "you", "your",
+})
+
+# Adaptive bypass of the query LLM: an optimized query whose keywords
+# overlap the question's above the Jaccard threshold counts as unchanged.
+# Once the EMA of changed queries drops below the minimum rate, questions
+# skip the LLM until a number of skipped calls have passed, after which
+# the LLM is evaluated again
+_OPT_UNCHANGED_JACCARD = 0.8
+_OPT_EMA_WEIGHT = 0.1
+_OPT_MIN_SAMPLES = 20
+_OPT_MIN_CHANGE_RATE = 0.2
+_OPT_PROBE_INTERVAL = 200
+
+# Expired entries are purged from the persistent query cache on the first
+# write of a process and every this many writes after it
+_PERSISTENT_QUERY_PURGE_INTERVAL = 100
+_persistent_query_writes = 0
+_persistent_query_lock = threading.Lock()
+
+# Search results kept for repeats of a query within the result TTL
+_RESULT_CACHE_ENTRIES = 256
+
+# Searches currently running, keyed by (query, max_results); concurrent
+# identical searches wait on the first one instead of querying again
+_inflight_searches: Dict[Tuple[str, int], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_exact_query_cache() -> ExactCache:
+    """Get the process-wide cache of optimized queries for identical questions."""
+    return ExactCache(max_entries=_EXACT_QUERY_CACHE_ENTRIES)
+
+
+@lru_cache(maxsize=1)
+def _get_result_cache() -> ExactCache:
+    """Get the process-wide cache of recent search results."""
+    return ExactCache(
+        max_entries=_RESULT_CACHE_ENTRIES if settings.WEB_RESULT_CACHE_TTL_SECONDS else 0,
+        ttl_seconds=settings.WEB_RESULT_CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_query_cache() -> SemanticGradeCache:
+    """Get the process-wide cache of optimized queries, keyed by question embedding."""
+    return SemanticGradeCache(
+        threshold=settings.WEB_QUERY_CACHE_SIMILARITY,
+        ttl_seconds=float("inf"),  # A question's search query does not go stale
+        max_entries=_QUERY_CACHE_ENTRIES,
+    )
+
+
+def _embed_question(question: str) -> Optional[np.ndarray]:
+    """
+    Embed a question as a unit vector for the query cache.
+
+    Returns:
+        float32 unit vector, or None if embedding failed
+    """
+    from src.vectorstore.chroma_store import embed_query
+
+    try:
+        vector = np.asarray(embed_query(question), dtype=np.float32)
+    except Exception as e:
+        logger.warning(f"Skipping search query cache, embedding failed: {e}")
+        return None
+    return vector / (np.linalg.norm(vector) or 1.0)
+
+
+def _persistent_query_filter(since: float) -> dict:
+    """Metadata filter for persisted queries of the current models, stored after `since`."""
+    return {"$and": [
+        {"embedding_model": settings.EMBEDDING_MODEL},
+        {"query_model": settings.GENERATION_MODEL},
+        {"ts": {"$gte": since}},
+    ]}
+
+
+def _lookup_persistent_query(vector: np.ndarray) -> Optional[str]:
+    """
+    Find the optimized query of the most similar persisted question.
+
+    Returns:
+        The query, or None if no live entry reaches
+        settings.WEB_QUERY_CACHE_SIMILARITY or the lookup failed
+    """
+    from src.vectorstore.chroma_store import get_query_cache_collection
+
+    try:
+        result = get_query_cache_collection().query(
+            query_embeddings=[vector.tolist()],
+            n_results=1,
+            where=_persistent_query_filter(time.time() - settings.WEB_QUERY_CACHE_PERSIST_TTL_SECONDS),
+        )
+    except Exception as e:
+        logger.warning(f"Skipping persistent query cache, lookup failed: {e}")
+        return None
+
+    distances = result["distances"][0]
+    if not distances or distances[0] > 1.0 - settings.WEB_QUERY_CACHE_SIMILARITY:
+        return None
+    return result["documents"][0][0]
+
+
+def _store_persistent_query(question: str, vector: np.ndarray, query: str) -> None:
+    """Persist a question's optimized query, purging expired entries periodically."""
+    from src.vectorstore.chroma_store import get_query_cache_collection
+
+    global _persistent_query_writes
+
+    now = time.time()
+    try:
+        collection = get_query_cache_collection()
+        collection.upsert(
+            ids=[fingerprint(f"{settings.GENERATION_MODEL}\0{question}").hex()],
+            embeddings=[vector.tolist()],
+            documents=[query],
+            metadatas=[{
+                "embedding_model": settings.EMBEDDING_MODEL,
+                "query_model": settings.GENERATION_MODEL,
+                "ts": now,
+            }],
+        )
+
+        with _persistent_query_lock:
+            purge = _persistent_query_writes % _PERSISTENT_QUERY_PURGE_INTERVAL == 0
+            _persistent_query_writes += 1
+        if purge:
+            collection.delete(where={"ts": {"$lt": now - settings.WEB_QUERY_CACHE_PERSIST_TTL_SECONDS}})
+    except Exception as e:
+        logger.warning(f"Failed to persist search query: {e}")
+
+
+@lru_cache(maxsize=1)
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs search providers, shared by all searches."""
+    return ThreadPoolExecutor(max_workers=_SEARCH_WORKERS, thread_name_prefix="web-search")
+
+
+def _keywords(text: str) -> List[str]:
+    """Distinct non-stopword words of a text, in order of appearance."""
+    keywords = []
+    for word in _KEYWORD_RE.findall(text):
+        word = word.rstrip(".-")
+        if word and word.lower() not in _STOPWORDS and word not in keywords:
+            keywords.append(word)
+    return keywords
+
+
+def _fast_optimize(question: str) -> Optional[str]:
+    """
+    Build a search query from the keywords of a short question.
+
+    Returns:
+        The first keywords joined by spaces, or None if the question is too
+        long (or has no keywords) and should be optimized by the LLM
+    """
+    if len(question.split()) > _FAST_QUERY_MAX_WORDS:
+        return None
+
+    return " ".join(_keywords(question)[:_FAST_QUERY_KEYWORDS]) or None
+
+
+def _keyword_jaccard(a: str, b: str) -> float:
+    """Jaccard similarity of the lowercased keyword sets of two texts."""
+    words_a = {word.lower() for word in _keywords(a)}
+    words_b = {word.lower() for word in _keywords(b)}
+    union = words_a | words_b
+    return len(words_a & words_b) / len(union) if union else 1.0
+
+
+def _ddgs_installed() -> bool:
+    """Check whether duckduckgo_search can be imported without importing it."""
+    return importlib.util.find_spec("duckduckgo_search") is not None
 
 
 class WebSearcher:
     """
     Performs web searches to retrieve external information.
 
-    Uses Tavily API as primary search engine (when API key is available)
-    and falls back to DuckDuckGo when Tavily is not configured.
+    Queries Tavily (when an API key is available) and DuckDuckGo at the
+    same time and uses the first non-empty result set.
 
     Attributes:
-        tavily_client: Tavily API client (if API key provided)
+        tavily_available: Whether a Tavily API key is configured
         llm: Ollama LLM for optimizing search queries
         query_prompt: Template for converting questions to search queries
 
@@ -60,43 +299,93 @@ class WebSearcher:
         """
         logger.info("Initializing WebSearcher")
 
-        # Initialize Tavily if API key is available
-        self.tavily_client = None
-        if TAVILY_AVAILABLE and settings.TAVILY_API_KEY:
-            try:
-                self.tavily_client = TavilyClient(api_key=settings.TAVILY_API_KEY)
-                logger.info("Tavily client initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Tavily client: {e}")
+        # Tavily is used when an API key is available
+        self.tavily_available = bool(settings.TAVILY_API_KEY)
+        if self.tavily_available:
+            logger.info("Tavily search available")
 
         # Check DuckDuckGo availability
-        self.ddg_available = DUCKDUCKGO_AVAILABLE
+        self.ddg_available = _ddgs_installed()
+        if not self.ddg_available:
+            logger.warning("DuckDuckGo search not available. Install with: pip install duckduckgo-search")
         if self.ddg_available:
-            logger.info("DuckDuckGo search available as fallback")
+            logger.info("DuckDuckGo search available")
 
         # Initialize LLM for query optimization
-        self.llm = ChatOllama(
-            model=settings.GENERATION_MODEL,
-            temperature=0,
-            base_url=settings.OLLAMA_BASE_URL,
-        )
+        self.llm = get_chat_ollama(settings.GENERATION_MODEL, temperature=0)
         self.query_prompt = ChatPromptTemplate.from_template(WEB_SEARCH_QUERY_PROMPT)
 
+        # Share of LLM-optimized queries that differ from the question's
+        # keywords, used to decide whether the LLM call is worth making
+        self._opt_change_rate = 1.0
+        self._opt_samples = 0
+        self._opt_skipped = 0
+        self._skip_opt = False
+        self._opt_lock = threading.Lock()
+
         # Log available search methods
-        if not self.tavily_client and not self.ddg_available:
+        if not self.tavily_available and not self.ddg_available:
             logger.warning("No web search engines available!")
         else:
             methods = []
-            if self.tavily_client:
+            if self.tavily_available:
                 methods.append("Tavily")
             if self.ddg_available:
                 methods.append("DuckDuckGo")
             logger.info(f"Available search methods: {', '.join(methods)}")
 
+    @property
+    def cache_stats(self) -> dict:
+        """Entries, hits, misses and hit rate of the search query cache."""
+        return _get_query_cache().stats()
+
+    def _record_optimization(self, question: str, optimized_query: str) -> None:
+        """Update the change rate of LLM queries, disabling the LLM if it is low."""
+        changed = _keyword_jaccard(question, optimized_query) <= _OPT_UNCHANGED_JACCARD
+        with self._opt_lock:
+            self._opt_samples += 1
+            self._opt_change_rate = (
+                (1 - _OPT_EMA_WEIGHT) * self._opt_change_rate + _OPT_EMA_WEIGHT * changed
+            )
+            if (
+                not self._skip_opt
+                and self._opt_samples >= _OPT_MIN_SAMPLES
+                and self._opt_change_rate < _OPT_MIN_CHANGE_RATE
+            ):
+                self._skip_opt = True
+                self._opt_skipped = 0
+                logger.info(
+                    f"Query LLM changed only {self._opt_change_rate:.0%} of recent queries, "
+                    f"using question keywords for the next {_OPT_PROBE_INTERVAL} searches"
+                )
+
+    def _should_skip_optimization(self) -> bool:
+        """Whether to bypass the query LLM, re-enabling it after the probe interval."""
+        with self._opt_lock:
+            if not self._skip_opt:
+                return False
+            self._opt_skipped += 1
+            if self._opt_skipped > _OPT_PROBE_INTERVAL:
+                self._skip_opt = False
+                self._opt_change_rate = 1.0
+                self._opt_samples = 0
+                logger.info("Re-evaluating the query LLM")
+                return False
+            return True
+
     def _optimize_search_query(self, question: str) -> str:
         """
         Optimize a question for web search engines.
 
+        With settings.FAST_QUERY_OPT, a short question is reduced to its
+        keywords without calling the LLM. The query LLM runs at temperature
+        0, so a repeated question reuses its earlier query. With
+        settings.WEB_QUERY_CACHE, a question whose embedding is within
+        settings.WEB_QUERY_CACHE_SIMILARITY of an earlier one does too, and
+        with settings.WEB_QUERY_CACHE_PERSIST that includes questions from
+        earlier runs. With settings.WEB_QUERY_OPT_ADAPTIVE, the LLM is
+        bypassed while its queries rarely differ from the question's keywords.
+
         Args:
             question: The user's question
 
@@ -109,12 +398,47 @@ class WebSearcher:
             >>> print(query)
             "LangGraph benefits building agents"
         """
+        if settings.FAST_QUERY_OPT:
+            fast_query = _fast_optimize(question)
+            if fast_query:
+                logger.debug(f"Keyword query: '{question}' -> '{fast_query}'")
+                return fast_query
+
+        key = (settings.GENERATION_MODEL, fingerprint(question))
+        cached = _get_exact_query_cache().get(key)
+        if cached is not None:
+            return cached
+
+        if settings.WEB_QUERY_OPT_ADAPTIVE and self._should_skip_optimization():
+            return " ".join(_keywords(question)) or question
+
+        vector = _embed_question(question) if settings.WEB_QUERY_CACHE else None
+        if vector is not None:
+            cached = _get_query_cache().lookup(vector)
+            if cached is None and settings.WEB_QUERY_CACHE_PERSIST:
+                cached = _lookup_persistent_query(vector)
+                if cached is not None:
+                    _get_query_cache().add(vector, cached)
+            if cached is not None:
+                logger.debug(f"Optimized query served from cache: '{question}' -> '{cached}'")
+                _get_exact_query_cache().put(key, cached)
+                return cached
+
         try:
             # Generate optimized query
             prompt = self.query_prompt.invoke({"question": question})
             response = self.llm.invoke(prompt)
             optimized_query = response.content.strip()
 
+            if optimized_query:
+                _get_exact_query_cache().put(key, optimized_query)
+                if vector is not None:
+                    _get_query_cache().add(vector, optimized_query)
+                    if settings.WEB_QUERY_CACHE_PERSIST:
+                        _store_persistent_query(question, vector, optimized_query)
+                if settings.WEB_QUERY_OPT_ADAPTIVE:
+                    self._record_optimization(question, optimized_query)
+
             logger.debug(f"Optimized query: '{question}' -> '{optimized_query}'")
             return optimized_query
 
@@ -127,6 +451,9 @@ class WebSearcher:
         """
         Perform web search using Tavily API.
 
+        Posts to the search endpoint through the shared keep-alive session
+        rather than the Tavily SDK, which opens a new connection per call.
+
         Args:
             query: Search query
             max_results: Maximum number of results to return
@@ -137,35 +464,45 @@ class WebSearcher:
         Raises:
             Exception: If Tavily search fails
         """
-        if not self.tavily_client:
-            raise Exception("Tavily client not initialized")
+        if not self.tavily_available:
+            raise Exception("Tavily API key not configured")
 
         logger.info(f"Searching Tavily with query: {query}")
 
         try:
             # Perform search
-            response = self.tavily_client.search(
-                query=query,
-                max_results=max_results,
-                search_depth="basic",  # Use "advanced" for deeper search
-                include_answer=False,
-                include_raw_content=False,
-                include_images=False,
+            response = _get_http_session().post(
+                _TAVILY_SEARCH_URL,
+                data=orjson.dumps({
+                    "query": query,
+                    "max_results": max_results,
+                    "search_depth": "basic",  # Use "advanced" for deeper search
+                    "include_answer": False,
+                    "include_raw_content": False,
+                    "include_images": False,
+                }),
+                headers={
+                    "Authorization": f"Bearer {settings.TAVILY_API_KEY}",
+                    "Content-Type": "application/json",
+                },
+                timeout=_TAVILY_TIMEOUT_SECONDS,
             )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-            # Convert results to Documents
-            documents = []
-            for result in response.get("results", []):
-                doc = Document(
-                    page_content=result.get("content", ""),
+            # Convert results to Documents; Tavily always returns these fields
+            documents = [
+                Document(
+                    page_content=content,
                     metadata={
-                        "source": result.get("url", ""),
-                        "title": result.get("title", ""),
-                        "score": result.get("score", 0.0),
+                        "source": url,
+                        "title": title,
+                        "score": score,
                         "search_engine": "tavily"
                     }
                 )
-                documents.append(doc)
+                for content, url, title, score in map(_tavily_fields, data["results"])
+            ]
 
             logger.info(f"Tavily search returned {len(documents)} results")
             return documents
@@ -188,32 +525,32 @@ class WebSearcher:
         Raises:
             Exception: If DuckDuckGo search fails
         """
-        if not self.ddg_available:
+        ddgs_class = _get_ddgs() if self.ddg_available else None
+        if not ddgs_class:
             raise Exception("DuckDuckGo search not available")
 
         logger.info(f"Searching DuckDuckGo with query: {query}")
 
         try:
             # Perform search
-            ddgs = DDGS()
+            ddgs = ddgs_class()
             results = ddgs.text(
                 query,
                 max_results=max_results
             )
 
             # Convert results to Documents
-            documents = []
-            if results:
-                for result in results:
-                    doc = Document(
-                        page_content=result.get("body", ""),
-                        metadata={
-                            "source": result.get("link", ""),
-                            "title": result.get("title", ""),
-                            "search_engine": "duckduckgo"
-                        }
-                    )
-                    documents.append(doc)
+            documents = [
+                Document(
+                    page_content=result.get("body", ""),
+                    metadata={
+                        "source": result.get("link", ""),
+                        "title": result.get("title", ""),
+                        "search_engine": "duckduckgo"
+                    }
+                )
+                for result in results or ()
+            ]
 
             logger.info(f"DuckDuckGo search returned {len(documents)} results")
             return documents
@@ -222,11 +559,114 @@ class WebSearcher:
             logger.error(f"DuckDuckGo search failed: {e}")
             raise Exception(f"DuckDuckGo search error: {e}")
 
+    def _providers(self) -> List[Tuple[str, Callable[[str, int], List[Document]]]]:
+        """Available search methods, in order of preference."""
+        providers = []
+        if self.tavily_available:
+            providers.append(("Tavily", self._search_tavily))
+        if self.ddg_available:
+            providers.append(("DuckDuckGo", self._search_duckduckgo))
+        return providers
+
+    def _search_concurrently(self, query: str, max_results: int) -> Optional[List[Document]]:
+        """
+        Run every available search method at once and keep the first results.
+
+        The search round-trips overlap, so a failing or slow provider no
+        longer delays the other. When several providers finish together,
+        the preferred one (Tavily) wins. Providers run on a shared thread
+        pool; those not yet started once results are found are cancelled,
+        and those already running finish in the background since their
+        SDK calls cannot be interrupted.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+
+        Returns:
+            Documents from the first provider with results, or None if all
+            providers failed or returned nothing
+        """
+        providers = self._providers()
+        if not providers:
+            return None
+
+        executor = _get_search_executor()
+        futures = {
+            executor.submit(search, query, max_results): rank
+            for rank, (_, search) in enumerate(providers)
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=futures.get):
+                    name = providers[futures[future]][0]
+                    try:
+                        documents = future.result()
+                    except Exception as e:
+                        logger.warning(f"{name} search failed: {e}")
+                        continue
+                    if documents:
+                        logger.info(f"Web search successful using {name}")
+                        return documents
+            return None
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _search_coalesced(self, query: str, max_results: int) -> Optional[List[Document]]:
+        """
+        Search for a query, sharing results between identical searches.
+
+        Results of a query are reused for settings.WEB_RESULT_CACHE_TTL_SECONDS,
+        and a search for a query already being searched waits for that
+        search instead of querying the providers again.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+
+        Returns:
+            Documents from the first provider with results, or None if all
+            providers failed or returned nothing
+        """
+        key = (query, max_results)
+        documents = _get_result_cache().get(key)
+        if documents is not None:
+            logger.info(f"Web search results served from cache for query: {query}")
+            return list(documents)
+
+        with _inflight_lock:
+            future = _inflight_searches.get(key)
+            leader = future is None
+            if leader:
+                future = _inflight_searches[key] = Future()
+
+        if not leader:
+            logger.info(f"Joining in-flight web search for query: {query}")
+            documents = future.result()
+            return list(documents) if documents else documents
+
+        try:
+            documents = self._search_concurrently(query, max_results)
+            if documents:
+                _get_result_cache().put(key, list(documents))
+            future.set_result(documents)
+            return documents
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight_searches.pop(key, None)
+
     def search(self, question: str, max_results: Optional[int] = None) -> List[Document]:
         """
         Perform web search for the given question.
 
-        Tries Tavily first (if configured), falls back to DuckDuckGo.
+        Tavily (if configured) and DuckDuckGo are queried concurrently, and
+        the first non-empty result set is returned.
 
         Args:
             question: The user's question
@@ -256,31 +696,39 @@ class WebSearcher:
         # Optimize query for web search
         search_query = self._optimize_search_query(question)
 
-        # Try Tavily first
-        if self.tavily_client:
-            try:
-                documents = self._search_tavily(search_query, max_results)
-                if documents:
-                    logger.info("Web search successful using Tavily")
-                    return documents
-            except Exception as e:
-                logger.warning(f"Tavily search failed: {e}")
-
-        # Fall back to DuckDuckGo
-        if self.ddg_available:
-            try:
-                documents = self._search_duckduckgo(search_query, max_results)
-                if documents:
-                    logger.info("Web search successful using DuckDuckGo")
-                    return documents
-            except Exception as e:
-                logger.warning(f"DuckDuckGo search failed: {e}")
+        documents = self._search_coalesced(search_query, max_results)
+        if documents:
+            return documents
 
         # All methods failed
         error_msg = "Web search failed: No search engines available or all searches failed"
         logger.error(error_msg)
         raise Exception(error_msg)
 
+    async def asearch(self, question: str, max_results: Optional[int] = None) -> List[Document]:
+        """
+        Perform web search without blocking the event loop.
+
+        Async counterpart of search(), sharing its caches and in-flight
+        searches. duckduckgo_search has no async client since AsyncDDGS was
+        removed in 6.x, so the search runs in a worker thread, as its
+        documentation recommends.
+
+        Args:
+            question: The user's question
+            max_results: Maximum number of results (defaults to settings.WEB_SEARCH_MAX_RESULTS)
+
+        Returns:
+            List of Document objects with search results
+
+        Raises:
+            Exception: If all search methods fail
+
+        Example:
+            >>> docs = await searcher.asearch("What is LangGraph?")
+        """
+        return await asyncio.to_thread(self.search, question, max_results)
+
     def is_available(self) -> bool:
         """
         Check if any web search method is available.
@@ -293,10 +741,16 @@ class WebSearcher:
             >>> if searcher.is_available():
             ...     docs = searcher.search("AI news")
         """
-        return self.tavily_client is not None or self.ddg_available
+        return self.tavily_available or self.ddg_available
 
 
 # Convenience function for simple usage
+@lru_cache(maxsize=1)
+def _get_web_searcher() -> WebSearcher:
+    """Get the WebSearcher shared by calls to web_search."""
+    return WebSearcher()
+
+
 def web_search(question: str, max_results: Optional[int] = None) -> List[Document]:
     """
     Convenience function to perform web search.
@@ -314,8 +768,7 @@ def web_search(question: str, max_results: Optional[int] = None) -> List[Documen
         >>> print(len(docs))
         3
     """
-    searcher = WebSearcher()
-    return searcher.search(question, max_results)
+    return _get_web_searcher().search(question, max_results)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,14 @@ This module implements all node functions that process the state
 as it flows through the LangGraph state machine.
 """
 
+import asyncio
 import logging
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from langchain_core.documents import Document
 
@@ -19,12 +25,98 @@ from config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _shared_agent(agent_class, *args):
+    """
+    Get the instance of an agent class shared by every node execution.
+
+    Agents are stateless between calls, so one instance per class and
+    constructor arguments is built on first use instead of on every graph
+    step. Keying on the class object means a patched class gets its own
+    instance.
+    """
+    return agent_class(*args)
+
+
+# Web searches started by retrieve ahead of the grading decision, keyed by
+# question with their start time; older entries are cancelled beyond the limit
+_PREFETCH_LIMIT = 8
+_prefetched_searches: "OrderedDict[str, Tuple[Future, float]]" = OrderedDict()
+_prefetch_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs speculative web searches."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="web-prefetch")
+
+
+def _search_web(question: str) -> List[Document]:
+    """Run a web search for a question with the configured result count."""
+    from src.agents.web_searcher import WebSearcher
+
+    return _shared_agent(WebSearcher).search(question=question, max_results=settings.WEB_SEARCH_MAX_RESULTS)
+
+
+def _is_fresh_prefetch(entry: Tuple[Future, float]) -> bool:
+    """
+    Check whether a prefetched search can still serve its question.
+
+    A search left unclaimed expires after
+    settings.WEB_RESULT_CACHE_TTL_SECONDS, like cached search results;
+    failed or cancelled searches are never reused.
+    """
+    future, started_at = entry
+    ttl = settings.WEB_RESULT_CACHE_TTL_SECONDS
+    if ttl and time.monotonic() - started_at >= ttl:
+        return False
+    return not future.done() or (not future.cancelled() and future.exception() is None)
+
+
+def _prefetch_web_search(question: str) -> None:
+    """Start a web search for the question unless a fresh one is already running."""
+    with _prefetch_lock:
+        entry = _prefetched_searches.get(question)
+        if entry is not None:
+            if _is_fresh_prefetch(entry):
+                return
+            entry[0].cancel()
+            del _prefetched_searches[question]
+        _prefetched_searches[question] = (
+            _get_prefetch_executor().submit(_search_web, question),
+            time.monotonic(),
+        )
+        while len(_prefetched_searches) > _PREFETCH_LIMIT:
+            _, (stale, _) = _prefetched_searches.popitem(last=False)
+            stale.cancel()
+
+
+def _take_prefetched_web_search(question: str) -> Optional[Future]:
+    """Claim the fresh speculative web search for a question, if one was started."""
+    with _prefetch_lock:
+        entry = _prefetched_searches.pop(question, None)
+    if entry is None or not _is_fresh_prefetch(entry):
+        return None
+    return entry[0]
+
+
+def _discard_prefetched_web_search(question: str) -> None:
+    """Cancel the speculative web search of a run that answers from local documents."""
+    with _prefetch_lock:
+        entry = _prefetched_searches.pop(question, None)
+    if entry is not None:
+        entry[0].cancel()
+
+
 def retrieve(state: GraphState) -> dict:
     """
     Retrieve documents from the vector store based on the question.
 
     This node performs a similarity search in the ChromaDB vector store
-    to find the most relevant documents for the user's question.
+    to find the most relevant documents for the user's question. With
+    settings.WEB_SEARCH_PREFETCH, a web search for the question starts in
+    the background first, so the web_search node does not wait for it if
+    grading falls back to the web.
 
     Args:
         state: Current graph state containing the question
@@ -41,6 +133,9 @@ def retrieve(state: GraphState) -> dict:
     logger.info("Node: retrieve")
     logger.debug(f"Retrieving documents for question: {state['question']}")
 
+    if settings.WEB_SEARCH_PREFETCH and state["question"]:
+        _prefetch_web_search(state["question"])
+
     try:
         # Perform similarity search
         documents = similarity_search(
@@ -50,9 +145,11 @@ def retrieve(state: GraphState) -> dict:
 
         logger.info(f"Retrieved {len(documents)} documents")
 
-        # Log document sources for debugging
-        for i, doc in enumerate(documents):
-            logger.debug(f"  Document {i+1}: source={doc.metadata.get('source', 'unknown')}")
+        # Log document sources for debugging; skip the per-document
+        # formatting when debug logging is off
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, doc in enumerate(documents):
+                logger.debug(f"  Document {i+1}: source={doc.metadata.get('source', 'unknown')}")
 
         return {"documents": documents}
 
@@ -94,6 +191,10 @@ def generate(state: GraphState) -> dict:
     logger.info("Node: generate")
     logger.debug(f"Generating answer for question: {state['question']}")
 
+    # The run answers from the documents it has; drop any unclaimed web
+    # search so a later run of the question does not pick up its result
+    _discard_prefetched_web_search(state["question"])
+
     if not state["documents"]:
         logger.warning("No documents available for generation")
         return {
@@ -117,16 +218,20 @@ def generate(state: GraphState) -> dict:
 
         # Initialize generator with prompt variant from state
         prompt_variant = state.get("prompt_variant", "baseline")
-        generator = AnswerGenerator(prompt_variant=prompt_variant)
+        generator = _shared_agent(AnswerGenerator, prompt_variant)
 
-        # Generate answer
-        answer = generator.generate(
+        # Stream the answer so the LLM tokens reach LangGraph's "messages"
+        # stream mode while the node is still running
+        answer = "".join(generator.generate_stream(
             question=state["question"],
-            documents=state["documents"]
-        )
+            documents=state["documents"],
+            regeneration_count=regeneration_count,
+            max_regenerations=settings.MAX_REGENERATIONS
+        ))
 
         logger.info("Answer generated successfully")
-        logger.debug(f"Generated answer: {answer[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Generated answer: {answer[:200]}...")
 
         return {
             "generation": answer,
@@ -176,21 +281,51 @@ def grade_documents(state: GraphState) -> dict:
         from src.agents.graders import DocumentGrader
 
         # Initialize grader
-        grader = DocumentGrader()
+        grader = _shared_agent(DocumentGrader)
 
         # Grade all documents
         logger.info(f"Grading {len(state['documents'])} documents")
         scores = grader.grade_batch(state["question"], state["documents"])
 
-        # Count relevant documents
-        relevant_count = sum(1 for s in scores if s == "yes")
-        logger.info(f"Grading complete: {relevant_count}/{len(scores)} documents relevant")
+        _log_relevance_scores(state["documents"], scores)
+        return {"relevance_scores": scores}
+
+    except Exception as e:
+        logger.error(f"Document grading failed: {e}")
+        # On failure, grade all as relevant to allow system to continue
+        logger.warning("Falling back: grading all documents as relevant")
+        return {"relevance_scores": ["yes"] * len(state["documents"])}
 
-        # Log individual scores
-        for i, (doc, score) in enumerate(zip(state["documents"], scores)):
-            source = doc.metadata.get("source", "unknown")
-            logger.debug(f"  Document {i+1}: {score} (source: {source})")
 
+async def agrade_documents(state: GraphState) -> dict:
+    """
+    Grade documents for relevance without blocking the event loop.
+
+    Async counterpart of grade_documents, used when the workflow runs
+    with ainvoke/astream. All documents are graded concurrently with
+    DocumentGrader.agrade_batch.
+
+    Args:
+        state: Current graph state containing question and documents
+
+    Returns:
+        Dictionary with updated relevance_scores field
+    """
+    logger.info("Node: grade_documents (async)")
+
+    if not state["documents"]:
+        logger.warning("No documents to grade")
+        return {"relevance_scores": []}
+
+    try:
+        from src.agents.graders import DocumentGrader
+
+        grader = _shared_agent(DocumentGrader)
+
+        logger.info(f"Grading {len(state['documents'])} documents")
+        scores = await grader.agrade_batch(state["question"], state["documents"])
+
+        _log_relevance_scores(state["documents"], scores)
         return {"relevance_scores": scores}
 
     except Exception as e:
@@ -200,6 +335,19 @@ def grade_documents(state: GraphState) -> dict:
         return {"relevance_scores": ["yes"] * len(state["documents"])}
 
 
+def _log_relevance_scores(documents: List[Document], scores: List[str]) -> None:
+    """Log the relevant count and each document's score."""
+    relevant_count = sum(1 for s in scores if s == "yes")
+    logger.info(f"Grading complete: {relevant_count}/{len(scores)} documents relevant")
+
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    for i, (doc, score) in enumerate(zip(documents, scores)):
+        source = doc.metadata.get("source", "unknown")
+        logger.debug(f"  Document {i+1}: {score} (source: {source})")
+
+
 def transform_query(state: GraphState) -> dict:
     """
     Transform the query to improve retrieval.
@@ -230,11 +378,12 @@ def transform_query(state: GraphState) -> dict:
         from src.agents.rewriter import QueryRewriter
 
         # Initialize rewriter
-        rewriter = QueryRewriter()
+        rewriter = _shared_agent(QueryRewriter)
 
-        # Rewrite the question
+        # Rewrite the question; it already failed retrieval, so skip the
+        # specificity pre-filter
         logger.info(f"Original question: {state['question']}")
-        improved_question = rewriter.rewrite(state["question"])
+        improved_question = rewriter.rewrite(state["question"], force=True)
         logger.info(f"Improved question: {improved_question}")
 
         # Increment retry count
@@ -289,35 +438,80 @@ def web_search(state: GraphState) -> dict:
         from src.agents.web_searcher import WebSearcher
 
         # Initialize searcher
-        searcher = WebSearcher()
+        searcher = _shared_agent(WebSearcher)
 
         # Check if web search is available
         if not searcher.is_available():
-            logger.warning("Web search not available - no search engines configured")
-            logger.warning("To enable web search:")
-            logger.warning("  1. Set TAVILY_API_KEY in .env file for Tavily")
-            logger.warning("  2. Or install duckduckgo-search: pip install duckduckgo-search")
+            _log_web_search_unavailable()
             return {
                 "documents": [],
                 "web_search_needed": "No"
             }
 
-        # Perform web search
-        documents = searcher.search(
-            question=state["question"],
-            max_results=settings.WEB_SEARCH_MAX_RESULTS
-        )
+        # Use the search retrieve started for this question, if any
+        prefetched = _take_prefetched_web_search(state["question"])
+        if prefetched is not None:
+            logger.info("Using prefetched web search")
+            documents = prefetched.result()
+        else:
+            documents = searcher.search(
+                question=state["question"],
+                max_results=settings.WEB_SEARCH_MAX_RESULTS
+            )
+
+        _log_web_results(documents)
+        return {
+            "documents": documents,
+            "web_search_needed": "Yes"
+        }
+
+    except Exception as e:
+        logger.error(f"Web search failed: {e}")
+        # Return empty documents on failure - system can degrade gracefully
+        return {
+            "documents": [],
+            "web_search_needed": "No"
+        }
+
+
+async def aweb_search(state: GraphState) -> dict:
+    """
+    Perform web search without blocking the event loop.
+
+    Async counterpart of web_search, used when the workflow runs with
+    ainvoke/astream. A prefetched search is awaited rather than waited on.
 
-        logger.info(f"Web search returned {len(documents)} documents")
+    Args:
+        state: Current graph state containing question
 
-        # Log search results for debugging
-        for i, doc in enumerate(documents):
-            title = doc.metadata.get("title", "No title")
-            source = doc.metadata.get("source", "Unknown")
-            engine = doc.metadata.get("search_engine", "Unknown")
-            logger.debug(f"  Result {i+1}: {title} ({engine})")
-            logger.debug(f"    Source: {source}")
+    Returns:
+        Dictionary with updated documents and web_search_needed fields
+    """
+    logger.info("Node: web_search (async)")
 
+    try:
+        from src.agents.web_searcher import WebSearcher
+
+        searcher = _shared_agent(WebSearcher)
+
+        if not searcher.is_available():
+            _log_web_search_unavailable()
+            return {
+                "documents": [],
+                "web_search_needed": "No"
+            }
+
+        prefetched = _take_prefetched_web_search(state["question"])
+        if prefetched is not None:
+            logger.info("Using prefetched web search")
+            documents = await asyncio.wrap_future(prefetched)
+        else:
+            documents = await searcher.asearch(
+                question=state["question"],
+                max_results=settings.WEB_SEARCH_MAX_RESULTS
+            )
+
+        _log_web_results(documents)
         return {
             "documents": documents,
             "web_search_needed": "Yes"
@@ -332,6 +526,29 @@ def web_search(state: GraphState) -> dict:
         }
 
 
+def _log_web_search_unavailable() -> None:
+    """Warn that no search engine is configured and how to enable one."""
+    logger.warning("Web search not available - no search engines configured")
+    logger.warning("To enable web search:")
+    logger.warning("  1. Set TAVILY_API_KEY in .env file for Tavily")
+    logger.warning("  2. Or install duckduckgo-search: pip install duckduckgo-search")
+
+
+def _log_web_results(documents: List[Document]) -> None:
+    """Log the result count and each result's title, engine and source."""
+    logger.info(f"Web search returned {len(documents)} documents")
+
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    for i, doc in enumerate(documents):
+        title = doc.metadata.get("title", "No title")
+        source = doc.metadata.get("source", "Unknown")
+        engine = doc.metadata.get("search_engine", "Unknown")
+        logger.debug(f"  Result {i+1}: {title} ({engine})")
+        logger.debug(f"    Source: {source}")
+
+
 def check_hallucination(state: GraphState) -> dict:
     """
     Check if the generated answer is grounded in the documents.
@@ -370,7 +587,7 @@ def check_hallucination(state: GraphState) -> dict:
         from src.agents.graders import HallucinationGrader
 
         # Initialize grader
-        grader = HallucinationGrader()
+        grader = _shared_agent(HallucinationGrader)
 
         # Check if generation is grounded
         logger.debug(f"Checking if generation is grounded: {state['generation'][:100]}...")
@@ -428,7 +645,7 @@ def check_usefulness(state: GraphState) -> dict:
         from src.agents.graders import AnswerGrader
 
         # Initialize grader
-        grader = AnswerGrader()
+        grader = _shared_agent(AnswerGrader)
 
         # Check if answer addresses question
         logger.debug(f"Checking if answer addresses question: {state['question'][:100]}...")
@@ -459,6 +676,12 @@ NODE_FUNCTIONS = {
     "check_usefulness": check_usefulness,
 }
 
+# Async variants of nodes, used when the workflow runs with ainvoke/astream
+ASYNC_NODE_FUNCTIONS = {
+    "grade_documents": agrade_documents,
+    "web_search": aweb_search,
+}
+
 
 def get_node(node_name: str):
     """
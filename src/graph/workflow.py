@@ -6,8 +6,9 @@ agentic RAG workflow using LangGraph.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Any, Dict, Iterator, List, Tuple
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from src.graph.state import GraphState
@@ -15,8 +16,10 @@ from src.graph.nodes import (
     retrieve,
     generate,
     grade_documents,
+    agrade_documents,
     transform_query,
     web_search,
+    aweb_search,
     check_hallucination,
     check_usefulness
 )
@@ -30,6 +33,20 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Answer returned when the workflow exhausts its recursion limit
+_RECURSION_FALLBACK_MESSAGE = (
+    "I apologize, but I'm having difficulty answering this question. "
+    "The system exhausted its maximum processing steps while trying to "
+    "generate a reliable answer. This could mean:\n\n"
+    "1. The question requires information not available in the knowledge base\n"
+    "2. The retrieval system is struggling to find relevant documents\n"
+    "3. The answer generation is stuck in a correction loop\n\n"
+    "Please try:\n"
+    "- Rephrasing your question more specifically\n"
+    "- Breaking complex questions into simpler parts\n"
+    "- Checking if the knowledge base contains relevant information"
+)
+
 
 class AgenticRAGWorkflow:
     """
@@ -108,10 +125,19 @@ class AgenticRAGWorkflow:
 
         # Add all 7 nodes with web search now integrated
         workflow.add_node("retrieve", retrieve)
-        workflow.add_node("grade_documents", grade_documents)
+        # Grading and web search run on threads under invoke/stream and
+        # without blocking the event loop under ainvoke/astream
+        workflow.add_node(
+            "grade_documents",
+            RunnableLambda(grade_documents, afunc=agrade_documents, name="grade_documents")
+        )
         workflow.add_node("generate", generate)
         workflow.add_node("transform_query", transform_query)
-        workflow.add_node("web_search", web_search)  # Web search fallback for insufficient local docs
+        # Web search fallback for insufficient local docs
+        workflow.add_node(
+            "web_search",
+            RunnableLambda(web_search, afunc=aweb_search, name="web_search")
+        )
         workflow.add_node("check_hallucination", check_hallucination)
         workflow.add_node("check_usefulness", check_usefulness)
 
@@ -167,6 +193,21 @@ class AgenticRAGWorkflow:
 
         return app
 
+    def _initial_state(self, question: str) -> GraphState:
+        """Build the state a run starts from."""
+        return {
+            "question": question,
+            "generation": "",
+            "web_search_needed": "No",
+            "documents": [],
+            "retry_count": 0,
+            "regeneration_count": 0,
+            "relevance_scores": [],
+            "hallucination_check": "",
+            "usefulness_check": "",
+            "prompt_variant": self.prompt_variant
+        }
+
     def run(self, question: str) -> Dict[str, Any]:
         """
         Run the workflow with a question.
@@ -195,19 +236,7 @@ class AgenticRAGWorkflow:
 
         logger.info(f"Running workflow for question: {question[:100]}...")
 
-        # Initialize state
-        initial_state: GraphState = {
-            "question": question,
-            "generation": "",
-            "web_search_needed": "No",
-            "documents": [],
-            "retry_count": 0,
-            "regeneration_count": 0,
-            "relevance_scores": [],
-            "hallucination_check": "",
-            "usefulness_check": "",
-            "prompt_variant": self.prompt_variant
-        }
+        initial_state = self._initial_state(question)
 
         try:
             # Run the workflow with recursion limit
@@ -234,18 +263,7 @@ class AgenticRAGWorkflow:
                 # Return a graceful fallback response
                 return {
                     "question": question,
-                    "generation": (
-                        "I apologize, but I'm having difficulty answering this question. "
-                        "The system exhausted its maximum processing steps while trying to "
-                        "generate a reliable answer. This could mean:\n\n"
-                        "1. The question requires information not available in the knowledge base\n"
-                        "2. The retrieval system is struggling to find relevant documents\n"
-                        "3. The answer generation is stuck in a correction loop\n\n"
-                        "Please try:\n"
-                        "- Rephrasing your question more specifically\n"
-                        "- Breaking complex questions into simpler parts\n"
-                        "- Checking if the knowledge base contains relevant information"
-                    ),
+                    "generation": _RECURSION_FALLBACK_MESSAGE,
                     "documents": [],
                     "retry_count": initial_state["retry_count"],
                     "regeneration_count": initial_state["regeneration_count"],
@@ -285,19 +303,7 @@ class AgenticRAGWorkflow:
 
         logger.info(f"Streaming workflow for question: {question[:100]}...")
 
-        # Initialize state
-        initial_state: GraphState = {
-            "question": question,
-            "generation": "",
-            "web_search_needed": "No",
-            "documents": [],
-            "retry_count": 0,
-            "regeneration_count": 0,
-            "relevance_scores": [],
-            "hallucination_check": "",
-            "usefulness_check": "",
-            "prompt_variant": self.prompt_variant
-        }
+        initial_state = self._initial_state(question)
 
         try:
             # Stream the workflow
@@ -308,6 +314,52 @@ class AgenticRAGWorkflow:
             logger.error(f"Workflow streaming failed: {e}")
             raise Exception(f"Workflow streaming failed: {e}")
 
+    def stream_answer(self, question: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the workflow with answer tokens as they are generated.
+
+        Uses LangGraph's "messages" stream mode, so the answer appears
+        token by token while the generate node is still running instead of
+        after it returns. Tokens from the graders' LLM calls are filtered
+        out. A regenerated answer is streamed again in full.
+
+        Args:
+            question: The user's question
+
+        Yields:
+            ("token", text) for each chunk of the answer, and
+            ("node", {node_name: update}) after each node completes
+
+        Example:
+            >>> for kind, payload in rag.stream_answer("What is Agentic RAG?"):
+            ...     if kind == "token":
+            ...         print(payload, end="", flush=True)
+        """
+        if not question:
+            raise ValueError("Question cannot be empty")
+
+        logger.info(f"Streaming answer for question: {question[:100]}...")
+
+        initial_state = self._initial_state(question)
+
+        try:
+            for mode, payload in self.workflow.stream(
+                initial_state,
+                config={"recursion_limit": settings.WORKFLOW_RECURSION_LIMIT},
+                stream_mode=["messages", "updates"],
+            ):
+                if mode == "updates":
+                    yield "node", payload
+                    continue
+
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") == "generate" and chunk.content:
+                    yield "token", chunk.content
+
+        except Exception as e:
+            logger.error(f"Workflow streaming failed: {e}")
+            raise Exception(f"Workflow streaming failed: {e}")
+
     def get_graph_info(self) -> Dict[str, Any]:
         """
         Get information about the workflow graph structure.
@@ -320,6 +372,23 @@ class AgenticRAGWorkflow:
             >>> info = rag.get_graph_info()
             >>> print(f"Nodes: {info['nodes']}")
         """
+        return self.describe_graph()
+
+    @classmethod
+    def describe_graph(cls) -> Dict[str, Any]:
+        """
+        Describe the workflow graph without building it.
+
+        The topology is static, so callers that only need to display it
+        (such as the CLI status command) can skip compiling the graph.
+
+        Returns:
+            Same dictionary as get_graph_info()
+
+        Example:
+            >>> info = AgenticRAGWorkflow.describe_graph()
+            >>> print(f"Edges: {len(info['edges'])}")
+        """
         return {
             "nodes": [
                 "retrieve",
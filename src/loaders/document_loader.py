@@ -6,10 +6,12 @@ and split them into chunks for embedding and storage in the vector store.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
+from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
@@ -19,6 +21,60 @@ from config.settings import settings
 logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# File extensions DocumentLoader can parse
+_SUPPORTED_EXTENSIONS = (".pdf", ".md", ".markdown", ".txt")
+
+
+def _read_text(path: Path) -> str:
+    """
+    Read a UTF-8 text file in one call.
+
+    The whole file is read as bytes and decoded once, avoiding the text
+    layer's incremental decoder. Newlines are normalized to "\\n" as text
+    mode would.
+
+    Args:
+        path: Text file to read
+
+    Returns:
+        The decoded file contents
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _scan_files(directory: str) -> List[str]:
+    """
+    Recursively collect supported file paths under a directory.
+
+    Walks the tree with os.scandir and an explicit stack. File types come
+    from the directory listing itself, so no extra stat() call or Path
+    object is needed per entry. Symlinked directories are not followed.
+
+    Args:
+        directory: Root directory to scan
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    files = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(_SUPPORTED_EXTENSIONS) and entry.is_file():
+                    files.append(entry.path)
+    files.sort()
+    return files
+
 
 class DocumentLoader:
     """
@@ -31,6 +87,7 @@ class DocumentLoader:
         self,
         chunk_size: Optional[int] = None,
         chunk_overlap: Optional[int] = None,
+        min_chunk_chars: Optional[int] = None,
     ):
         """
         Initialize the document loader.
@@ -38,9 +95,13 @@ class DocumentLoader:
         Args:
             chunk_size: Maximum character size for chunks (default: from settings)
             chunk_overlap: Character overlap between chunks (default: from settings)
+            min_chunk_chars: Minimum stripped length of a kept chunk (default: from settings)
         """
         self.chunk_size = chunk_size or settings.CHUNK_SIZE
         self.chunk_overlap = chunk_overlap or settings.CHUNK_OVERLAP
+        self.min_chunk_chars = (
+            settings.MIN_CHUNK_CHARS if min_chunk_chars is None else min_chunk_chars
+        )
 
         # Initialize text splitter with semantic separators
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -52,7 +113,7 @@ class DocumentLoader:
 
         logger.info(
             f"DocumentLoader initialized: chunk_size={self.chunk_size}, "
-            f"chunk_overlap={self.chunk_overlap}"
+            f"chunk_overlap={self.chunk_overlap}, min_chunk_chars={self.min_chunk_chars}"
         )
 
     def load_document(self, file_path: str) -> List[Document]:
@@ -88,8 +149,7 @@ class DocumentLoader:
 
             elif suffix in [".md", ".markdown", ".txt"]:
                 logger.debug(f"Loading text file: {file_path}")
-                loader = TextLoader(str(path), encoding="utf-8")
-                docs = loader.load()
+                docs = [Document(page_content=_read_text(path))]
 
             else:
                 raise ValueError(
@@ -108,12 +168,26 @@ class DocumentLoader:
             logger.error(f"Error loading document {file_path}: {e}")
             raise
 
-    def load_documents(self, directory: str) -> List[Document]:
+    def _load_document_safe(self, file_path: str) -> List[Document]:
+        """Load a single document, logging and skipping it on failure."""
+        try:
+            return self.load_document(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load {file_path}: {e}")
+            return []
+
+    def load_documents(self, directory: str, max_workers: Optional[int] = None) -> List[Document]:
         """
         Load all supported documents from a directory.
 
+        Files are parsed in parallel worker processes since PDF text
+        extraction is CPU-bound. Documents are returned in sorted file
+        path order.
+
         Args:
             directory: Path to directory containing documents
+            max_workers: Worker processes (default: settings.LOAD_WORKERS,
+                or the CPU count if that is 0); 1 loads sequentially
 
         Returns:
             List of all loaded Document objects
@@ -129,14 +203,8 @@ class DocumentLoader:
         if not path.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
 
-        # Supported file extensions
-        supported_extensions = {".pdf", ".md", ".markdown", ".txt"}
-
         # Find all supported files
-        files = [
-            f for f in path.rglob("*")
-            if f.is_file() and f.suffix.lower() in supported_extensions
-        ]
+        files = _scan_files(str(path))
 
         if not files:
             logger.warning(f"No supported documents found in {directory}")
@@ -144,19 +212,62 @@ class DocumentLoader:
 
         logger.info(f"Found {len(files)} supported document(s) in {directory}")
 
+        workers = max_workers or settings.LOAD_WORKERS or os.cpu_count() or 1
+        workers = min(workers, len(files))
+
         # Load all documents
         all_docs = []
-        for file_path in files:
-            try:
-                docs = self.load_document(str(file_path))
-                all_docs.extend(docs)
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
-                continue
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for docs in executor.map(self._load_document_safe, files):
+                    all_docs.extend(docs)
+        else:
+            for file_path in files:
+                all_docs.extend(self._load_document_safe(file_path))
 
         logger.info(f"Successfully loaded {len(all_docs)} document(s) total")
         return all_docs
 
+    def _split(self, document: Document) -> List[Document]:
+        """
+        Split one document, dropping chunks too short to be worth embedding.
+
+        Whitespace-only and tiny fragments (stray headings, separators)
+        would otherwise each cost an embedding request.
+        """
+        chunks = self.text_splitter.split_documents([document])
+        kept = [
+            chunk for chunk in chunks
+            if len(chunk.page_content.strip()) >= self.min_chunk_chars
+        ]
+        if len(kept) < len(chunks):
+            logger.debug(
+                f"Dropped {len(chunks) - len(kept)} chunk(s) shorter than "
+                f"{self.min_chunk_chars} characters from {document.metadata.get('source')}"
+            )
+        return kept
+
+    def iter_chunks(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """
+        Lazily split documents into chunks, one document at a time.
+
+        Produces the same chunks and chunk_index values as chunk_documents
+        (including the short-chunk filter) without holding every chunk in
+        memory at once.
+
+        Args:
+            documents: Documents to chunk (any iterable, consumed once)
+
+        Yields:
+            Chunked Document objects
+        """
+        index = 0
+        for document in documents:
+            for chunk in self._split(document):
+                chunk.metadata["chunk_index"] = index
+                index += 1
+                yield chunk
+
     def chunk_documents(self, documents: List[Document]) -> List[Document]:
         """
         Split documents into chunks for embedding and retrieval.
@@ -173,22 +284,29 @@ class DocumentLoader:
 
         logger.info(f"Chunking {len(documents)} document(s)...")
 
-        # Split documents into chunks
-        chunks = self.text_splitter.split_documents(documents)
+        # Split documents into chunks, dropping empty and near-empty ones
+        chunks = [chunk for document in documents for chunk in self._split(document)]
 
-        # Add chunk index to metadata
+        # Add chunk index to metadata, gathering size statistics in the same pass
+        total_size = 0
+        min_size = max_size = len(chunks[0].page_content) if chunks else 0
         for i, chunk in enumerate(chunks):
             chunk.metadata["chunk_index"] = i
+            size = len(chunk.page_content)
+            total_size += size
+            if size < min_size:
+                min_size = size
+            elif size > max_size:
+                max_size = size
 
         logger.info(f"Created {len(chunks)} chunks from {len(documents)} document(s)")
 
         # Log statistics
         if chunks:
-            chunk_sizes = [len(chunk.page_content) for chunk in chunks]
-            avg_size = sum(chunk_sizes) / len(chunk_sizes)
+            avg_size = total_size / len(chunks)
             logger.info(
-                f"Chunk statistics: min={min(chunk_sizes)}, "
-                f"max={max(chunk_sizes)}, avg={avg_size:.1f} characters"
+                f"Chunk statistics: min={min_size}, "
+                f"max={max_size}, avg={avg_size:.1f} characters"
             )
 
         return chunks
@@ -7,12 +7,73 @@ A/B test results for prompt variant comparison.
 
 import sqlite3
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+_INSERT_RUN_SQL = """
+    INSERT INTO ab_test_runs (
+        prompt_variant, question, answer, user_rating, user_feedback,
+        documents_retrieved, relevant_documents, web_search_used,
+        query_retries, hallucination_check, usefulness_check,
+        execution_time_ms, session_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Read queries are kept as constants so every call passes the identical SQL
+# text and hits sqlite3's per-connection statement cache instead of re-parsing
+_VARIANT_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_runs,
+        AVG(user_rating) as avg_rating,
+        COUNT(user_rating) as rated_runs,
+        AVG(execution_time_ms) as avg_time_ms
+    FROM ab_test_runs
+    WHERE prompt_variant = ?
+"""
+
+_ALL_VARIANT_STATS_SQL = """
+    SELECT
+        prompt_variant,
+        COUNT(*) as total_runs,
+        AVG(user_rating) as avg_rating,
+        COUNT(user_rating) as rated_runs,
+        AVG(execution_time_ms) as avg_time_ms
+    FROM ab_test_runs
+    GROUP BY prompt_variant
+"""
+
+_RECENT_RUNS_SQL = """
+    SELECT * FROM ab_test_runs
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+_RECENT_VARIANT_RUNS_SQL = """
+    SELECT * FROM ab_test_runs
+    WHERE prompt_variant = ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+_SESSION_RUNS_SQL = """
+    SELECT * FROM ab_test_runs
+    WHERE session_id = ?
+    ORDER BY timestamp ASC
+"""
+
+_SESSION_SUMMARY_SQL = """
+    SELECT
+        COUNT(*) as total_runs,
+        COUNT(user_rating) as rated_runs,
+        AVG(user_rating) as avg_rating
+    FROM ab_test_runs
+    WHERE session_id = ?
+"""
+
 
 class ABTestDatabase:
     """
@@ -41,6 +102,13 @@ class ABTestDatabase:
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row  # Enable row factory for dict-like access
 
+        # WAL with synchronous=NORMAL avoids an fsync on every commit while
+        # remaining safe against corruption; the connection is reused for the
+        # lifetime of this object so the pragmas are applied only once
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+
         self._create_tables()
         logger.info("A/B test database initialized successfully")
 
@@ -94,9 +162,40 @@ class ABTestDatabase:
             ON ab_test_runs(user_rating)
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_variant_id
+            ON ab_test_runs(prompt_variant, id DESC)
+        """)
+
         self.conn.commit()
         logger.debug("Database tables and indexes created")
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several statements into a single transaction.
+
+        Commits when the block exits normally and rolls back if it raises.
+
+        Yields:
+            The underlying SQLite connection
+
+        Example:
+            >>> db = ABTestDatabase()
+            >>> with db.transaction() as conn:
+            ...     conn.execute("DELETE FROM ab_test_runs WHERE session_id = ?", ("old",))
+        """
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+
     def save_test_run(self, data: Dict[str, Any]) -> int:
         """
         Save a test run to the database.
@@ -133,28 +232,7 @@ class ABTestDatabase:
         cursor = self.conn.cursor()
 
         try:
-            cursor.execute("""
-                INSERT INTO ab_test_runs (
-                    prompt_variant, question, answer, user_rating, user_feedback,
-                    documents_retrieved, relevant_documents, web_search_used,
-                    query_retries, hallucination_check, usefulness_check,
-                    execution_time_ms, session_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data["prompt_variant"],
-                data["question"],
-                data.get("answer"),
-                data.get("user_rating"),
-                data.get("user_feedback"),
-                data.get("documents_retrieved"),
-                data.get("relevant_documents"),
-                1 if data.get("web_search_used") else 0,  # Convert bool to int
-                data.get("query_retries"),
-                data.get("hallucination_check"),
-                data.get("usefulness_check"),
-                data.get("execution_time_ms"),
-                data.get("session_id")
-            ))
+            cursor.execute(_INSERT_RUN_SQL, self._run_params(data))
 
             self.conn.commit()
             run_id = cursor.lastrowid
@@ -167,6 +245,68 @@ class ABTestDatabase:
             self.conn.rollback()
             raise
 
+    def save_test_runs_batch(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save multiple test runs in a single transaction.
+
+        All rows are inserted with one executemany() call and committed once,
+        so a session of N questions costs a single commit instead of N.
+
+        Args:
+            rows: List of test run dictionaries (same keys as save_test_run)
+
+        Returns:
+            Number of rows inserted
+
+        Example:
+            >>> db = ABTestDatabase()
+            >>> db.save_test_runs_batch([
+            ...     {"prompt_variant": "baseline", "question": "Q1?"},
+            ...     {"prompt_variant": "baseline", "question": "Q2?"}
+            ... ])
+            2
+        """
+        if not rows:
+            return 0
+
+        try:
+            with self.transaction() as conn:
+                conn.executemany(_INSERT_RUN_SQL, [self._run_params(row) for row in rows])
+
+            logger.debug(f"Saved batch of {len(rows)} test runs")
+            return len(rows)
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save test run batch: {e}")
+            raise
+
+    @staticmethod
+    def _run_params(data: Dict[str, Any]) -> tuple:
+        """
+        Build the INSERT parameter tuple for a test run dictionary.
+
+        Args:
+            data: Test run dictionary (see save_test_run)
+
+        Returns:
+            Tuple of values ordered to match _INSERT_RUN_SQL
+        """
+        return (
+            data["prompt_variant"],
+            data["question"],
+            data.get("answer"),
+            data.get("user_rating"),
+            data.get("user_feedback"),
+            data.get("documents_retrieved"),
+            data.get("relevant_documents"),
+            1 if data.get("web_search_used") else 0,  # Convert bool to int
+            data.get("query_retries"),
+            data.get("hallucination_check"),
+            data.get("usefulness_check"),
+            data.get("execution_time_ms"),
+            data.get("session_id")
+        )
+
     def get_variant_stats(self, variant: str) -> Dict[str, Any]:
         """
         Get statistics for a specific prompt variant.
@@ -187,20 +327,20 @@ class ABTestDatabase:
             >>> stats["total_runs"] >= 0
             True
         """
-        cursor = self.conn.cursor()
+        row = self.conn.execute(_VARIANT_STATS_SQL, (variant,)).fetchone()
+        return self._stats_from_row(row)
 
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_runs,
-                AVG(user_rating) as avg_rating,
-                COUNT(user_rating) as rated_runs,
-                AVG(execution_time_ms) as avg_time_ms
-            FROM ab_test_runs
-            WHERE prompt_variant = ?
-        """, (variant,))
+    @staticmethod
+    def _stats_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """
+        Build a variant statistics dictionary from an aggregate row.
 
-        row = cursor.fetchone()
+        Args:
+            row: Row with total_runs, avg_rating, rated_runs and avg_time_ms
 
+        Returns:
+            Statistics dictionary (see get_variant_stats)
+        """
         return {
             "total_runs": row["total_runs"],
             "avg_rating": round(row["avg_rating"], 2) if row["avg_rating"] else None,
@@ -262,7 +402,18 @@ class ABTestDatabase:
             True
         """
         variants = ["baseline", "detailed", "bullets", "reasoning"]
-        return {variant: self.get_variant_stats(variant) for variant in variants}
+        empty = {"total_runs": 0, "avg_rating": None, "rated_runs": 0, "avg_time_ms": None}
+
+        # One grouped scan instead of a query per variant
+        rows = {
+            row["prompt_variant"]: row
+            for row in self.conn.execute(_ALL_VARIANT_STATS_SQL)
+        }
+
+        return {
+            variant: self._stats_from_row(rows[variant]) if variant in rows else dict(empty)
+            for variant in variants
+        }
 
     def get_recent_runs(self, limit: int = 10, variant: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -281,23 +432,14 @@ class ABTestDatabase:
             >>> len(recent) <= 5
             True
         """
-        cursor = self.conn.cursor()
-
+        # id is monotonic, so ordering by it matches insertion order without
+        # the second-granularity ties of timestamp, and lets SQLite walk the
+        # (prompt_variant, id) index and stop after `limit` rows
         if variant:
-            cursor.execute("""
-                SELECT * FROM ab_test_runs
-                WHERE prompt_variant = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (variant, limit))
+            rows = self.conn.execute(_RECENT_VARIANT_RUNS_SQL, (variant, limit)).fetchall()
         else:
-            cursor.execute("""
-                SELECT * FROM ab_test_runs
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,))
+            rows = self.conn.execute(_RECENT_RUNS_SQL, (limit,)).fetchall()
 
-        rows = cursor.fetchall()
         return [dict(row) for row in rows]
 
     def get_session_runs(self, session_id: str) -> List[Dict[str, Any]]:
@@ -316,16 +458,37 @@ class ABTestDatabase:
             >>> all(r["session_id"] == "abc123" for r in runs)
             True
         """
-        cursor = self.conn.cursor()
+        rows = self.conn.execute(_SESSION_RUNS_SQL, (session_id,)).fetchall()
+        return [dict(row) for row in rows]
 
-        cursor.execute("""
-            SELECT * FROM ab_test_runs
-            WHERE session_id = ?
-            ORDER BY timestamp ASC
-        """, (session_id,))
+    def get_session_summary(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get aggregate statistics for a specific session.
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        Aggregation is done in SQL, so no run rows are materialized.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Dictionary with statistics:
+                - total_runs: Total number of runs in the session
+                - rated_runs: Number of runs with user ratings
+                - avg_rating: Average user rating (1-5) or None
+
+        Example:
+            >>> db = ABTestDatabase()
+            >>> summary = db.get_session_summary("abc123")
+            >>> summary["total_runs"] >= summary["rated_runs"]
+            True
+        """
+        row = self.conn.execute(_SESSION_SUMMARY_SQL, (session_id,)).fetchone()
+
+        return {
+            "total_runs": row["total_runs"],
+            "rated_runs": row["rated_runs"],
+            "avg_rating": row["avg_rating"]
+        }
 
     def close(self):
         """
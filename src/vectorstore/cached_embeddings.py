@@ -0,0 +1,49 @@
+"""
+Persistent embedding cache for the Agentic RAG system.
+
+Wraps the Ollama embedder with LangChain's CacheBackedEmbeddings so that
+document texts already embedded with the current model are served from a
+local file store instead of being sent to Ollama again. Reloading an
+overlapping corpus only embeds the chunks that changed.
+"""
+
+import logging
+
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from langchain_core.embeddings import Embeddings
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_cached_embeddings(underlying: Embeddings) -> Embeddings:
+    """
+    Wrap an embedder with a content-addressed on-disk cache.
+
+    Cache keys are derived from a hash of each text, namespaced by the
+    embedding model so switching models never returns stale vectors.
+    Query embeddings are not cached.
+
+    Args:
+        underlying: Embedder used for cache misses
+
+    Returns:
+        Cache-backed embedder, or `underlying` if caching is disabled
+
+    Example:
+        >>> embeddings = get_cached_embeddings(get_embeddings())
+        >>> vectors = embeddings.embed_documents(["cached on second call"])
+    """
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return underlying
+
+    cache_path = settings.get_embedding_cache_path()
+    logger.debug(f"Using embedding cache at: {cache_path}")
+
+    return CacheBackedEmbeddings.from_bytes_store(
+        underlying,
+        LocalFileStore(str(cache_path)),
+        namespace=settings.EMBEDDING_MODEL,
+    )
@@ -6,33 +6,60 @@ and retrieval. Implements a singleton pattern for thread-safe access.
 """
 
 import logging
-from typing import List, Optional
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import chromadb
+import httpx
+import numpy as np
 from langchain_ollama import OllamaEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStoreRetriever
 
 from config.settings import settings
+from src.vectorstore.cached_embeddings import get_cached_embeddings
 
 # Configure logging
 logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
-# Global singleton instance
+# Global singleton instances
 _vector_store: Optional[Chroma] = None
+_raw_collection: Optional[chromadb.Collection] = None
+_query_cache_collection: Optional[chromadb.Collection] = None
+
+# Suffix of the collection persisting optimized web search queries
+_QUERY_CACHE_COLLECTION_SUFFIX = "_query_cache"
+
+# Recent question embeddings. Retrieval, relevance grading and the web
+# search query cache all embed the same question, so each question is sent
+# to Ollama once
+_QUERY_EMBEDDING_CACHE_SIZE = 256
 
 
 def get_embeddings() -> OllamaEmbeddings:
     """
     Get Ollama embeddings instance for generating embeddings.
 
+    The underlying HTTP client keeps enough pooled keep-alive connections
+    for the maximum number of ingestion workers, so concurrent embedding
+    requests reuse connections instead of reconnecting.
+
     Returns:
         OllamaEmbeddings instance configured with settings
     """
     return OllamaEmbeddings(
         model=settings.EMBEDDING_MODEL,
         base_url=settings.OLLAMA_BASE_URL,
+        client_kwargs={
+            # Concurrency is bounded by the ingest worker pool (at most 32)
+            "limits": httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=32,
+            )
+        },
     )
 
 
@@ -55,8 +82,9 @@ def get_vector_store() -> Chroma:
         try:
             logger.info("Initializing ChromaDB vector store...")
 
-            # Get embeddings
-            embeddings = get_embeddings()
+            # Get embeddings (document embeddings are served from the
+            # on-disk cache when the same text was embedded before)
+            embeddings = get_cached_embeddings(get_embeddings())
 
             # Get persist directory path
             persist_dir = settings.get_chroma_persist_path()
@@ -80,6 +108,78 @@ def get_vector_store() -> Chroma:
     return _vector_store
 
 
+def get_raw_collection() -> chromadb.Collection:
+    """
+    Get or create the singleton raw ChromaDB collection for ingestion.
+
+    Opens the same persist directory and collection as get_vector_store(),
+    but directly through chromadb with no embedding function attached, so
+    writes must always carry precomputed vectors and are never embedded a
+    second time. Query-time code keeps using the LangChain wrapper.
+
+    Returns:
+        chromadb Collection instance
+
+    Raises:
+        Exception: If the collection cannot be opened
+    """
+    global _raw_collection
+
+    if _raw_collection is None:
+        try:
+            persist_dir = settings.get_chroma_persist_path()
+            client = chromadb.PersistentClient(path=str(persist_dir))
+            _raw_collection = client.get_or_create_collection(
+                name=settings.CHROMA_COLLECTION,
+                embedding_function=None,
+            )
+
+            logger.debug(f"Opened raw ChromaDB collection '{settings.CHROMA_COLLECTION}'")
+
+        except Exception as e:
+            logger.error(f"Failed to open ChromaDB collection: {e}")
+            raise
+
+    return _raw_collection
+
+
+def get_query_cache_collection() -> chromadb.Collection:
+    """
+    Get or create the singleton collection of persisted web search queries.
+
+    Lives in the same persist directory as the document collection, under
+    the document collection's name plus "_query_cache". It measures cosine
+    distance and has no embedding function: entries are question
+    embeddings with the optimized query as their document.
+
+    Returns:
+        chromadb Collection instance
+
+    Raises:
+        Exception: If the collection cannot be opened
+    """
+    global _query_cache_collection
+
+    if _query_cache_collection is None:
+        try:
+            persist_dir = settings.get_chroma_persist_path()
+            client = chromadb.PersistentClient(path=str(persist_dir))
+            name = settings.CHROMA_COLLECTION + _QUERY_CACHE_COLLECTION_SUFFIX
+            _query_cache_collection = client.get_or_create_collection(
+                name=name,
+                embedding_function=None,
+                metadata={"hnsw:space": "cosine"},
+            )
+
+            logger.debug(f"Opened query cache collection '{name}'")
+
+        except Exception as e:
+            logger.error(f"Failed to open query cache collection: {e}")
+            raise
+
+    return _query_cache_collection
+
+
 def add_documents(documents: List[Document]) -> None:
     """
     Add documents to the vector store with embeddings.
@@ -111,6 +211,51 @@ def add_documents(documents: List[Document]) -> None:
         raise
 
 
+def add_embeddings(
+    texts: List[str],
+    embeddings: Union[List[List[float]], np.ndarray],
+    metadatas: List[Dict[str, Any]],
+    ids: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Add texts with precomputed embeddings directly to the Chroma collection.
+
+    Writes through get_raw_collection(), skipping LangChain's add_documents
+    wrapper, which would embed the texts again and rebuild Document objects. Use this when vectors were already
+    computed (e.g. by the ingestion pipeline).
+
+    Args:
+        texts: Chunk texts to store
+        embeddings: One vector per text (lists or a 2-D float32 array)
+        metadatas: One metadata dictionary per text
+        ids: Optional IDs (random UUIDs are generated if omitted)
+
+    Returns:
+        IDs of the stored entries
+
+    Raises:
+        Exception: If the collection write fails
+    """
+    if ids is None:
+        ids = [str(uuid.uuid4()) for _ in texts]
+
+    try:
+        collection = get_raw_collection()
+        collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas,
+        )
+
+        logger.debug(f"Added {len(ids)} pre-embedded documents to vector store")
+        return ids
+
+    except Exception as e:
+        logger.error(f"Failed to add embeddings to vector store: {e}")
+        raise
+
+
 def get_retriever(k: Optional[int] = None) -> VectorStoreRetriever:
     """
     Get a retriever for similarity search from the vector store.
@@ -145,10 +290,71 @@ def get_retriever(k: Optional[int] = None) -> VectorStoreRetriever:
         raise
 
 
+@lru_cache(maxsize=_QUERY_EMBEDDING_CACHE_SIZE)
+def _embed_query(query: str, model: str) -> Tuple[float, ...]:
+    """Embed a query with the given model; cached per (query, model)."""
+    return tuple(get_vector_store().embeddings.embed_query(query))
+
+
+def embed_query(query: str) -> List[float]:
+    """
+    Embed a question, reusing the vector of a recent identical question.
+
+    Query embeddings bypass the on-disk embedding cache, so without this
+    every component that needs the question vector would run the embedding
+    model again.
+
+    Args:
+        query: Question text
+
+    Returns:
+        Embedding vector of the question
+
+    Raises:
+        Exception: If embedding fails (failures are not cached)
+
+    Example:
+        >>> vector = embed_query("What is LangGraph?")
+        >>> embed_query("What is LangGraph?") == vector  # served from cache
+        True
+    """
+    return list(_embed_query(query, settings.EMBEDDING_MODEL))
+
+
+def similarity_search_by_vector(embedding: List[float], k: Optional[int] = None) -> List[Document]:
+    """
+    Perform similarity search for a precomputed query embedding.
+
+    Args:
+        embedding: Query vector from embed_query()
+        k: Number of documents to retrieve (default: from settings)
+
+    Returns:
+        List of similar Document objects
+
+    Raises:
+        Exception: If search fails
+    """
+    try:
+        retrieval_k = k or settings.RETRIEVAL_K
+        results = get_vector_store().similarity_search_by_vector(embedding, k=retrieval_k)
+
+        logger.debug(f"Retrieved {len(results)} documents by vector")
+
+        return results
+
+    except Exception as e:
+        logger.error(f"Similarity search by vector failed: {e}")
+        raise
+
+
 def similarity_search(query: str, k: Optional[int] = None) -> List[Document]:
     """
     Perform similarity search for a query.
 
+    The query is embedded through embed_query(), so later grading and web
+    search steps for the same question reuse its vector.
+
     Args:
         query: Search query string
         k: Number of documents to retrieve (default: from settings)
@@ -160,15 +366,13 @@ def similarity_search(query: str, k: Optional[int] = None) -> List[Document]:
         Exception: If search fails
     """
     try:
-        vector_store = get_vector_store()
-
         # Use provided k or default from settings
         retrieval_k = k or settings.RETRIEVAL_K
 
         logger.debug(f"Performing similarity search for: '{query}' (k={retrieval_k})")
 
         # Perform similarity search
-        results = vector_store.similarity_search(query, k=retrieval_k)
+        results = similarity_search_by_vector(embed_query(query), k=retrieval_k)
 
         logger.debug(f"Retrieved {len(results)} documents")
 
@@ -189,7 +393,10 @@ def clear_collection() -> None:
         Exception: If clearing fails
     """
     try:
-        global _vector_store
+        global _vector_store, _raw_collection
+
+        # The raw handle points at the collection about to be deleted
+        _raw_collection = None
 
         # If vector store exists, delete the collection
         if _vector_store is not None:
@@ -0,0 +1,290 @@
+"""
+Pipelined document ingestion for the Agentic RAG system.
+
+This module indexes chunked documents into ChromaDB using three overlapping
+stages: a producer thread that groups chunks into batches, a thread pool
+that embeds batches with Ollama, and an upsert stage that writes the
+precomputed vectors straight to the Chroma collection via add_embeddings.
+Bounded queues between the stages provide backpressure so memory stays
+capped.
+"""
+
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+from langchain_core.documents import Document
+
+from config.settings import settings
+from src.vectorstore.chroma_store import add_embeddings, get_vector_store
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the batch stream
+_DONE = object()
+
+# Embedding dimension recorded by scripts/setup_vectorstore.py
+_EMBED_DIM_FILE = "embed_dim.json"
+
+# Target payload per embedding request, and the batch size used when the
+# embedding dimension is unknown
+_EMBED_REQUEST_BYTES = 1_048_576
+_DEFAULT_EMBED_BATCH_SIZE = 256
+_MIN_EMBED_BATCH_SIZE = 16
+_MAX_EMBED_BATCH_SIZE = 512
+
+T = TypeVar("T")
+
+
+def _embed_dim_path() -> Path:
+    """Location of the recorded embedding dimension."""
+    return settings.get_chroma_persist_path() / _EMBED_DIM_FILE
+
+
+def save_embedding_dim(dim: int) -> Path:
+    """
+    Record the embedding dimension of the configured model.
+
+    Args:
+        dim: Length of the vectors produced by settings.EMBEDDING_MODEL
+
+    Returns:
+        Path of the written file
+    """
+    path = _embed_dim_path()
+    path.write_text(json.dumps({"model": settings.EMBEDDING_MODEL, "dim": dim}))
+    logger.debug(f"Recorded embedding dimension {dim} in {path}")
+    return path
+
+
+def load_embedding_dim() -> Optional[int]:
+    """
+    Read the recorded embedding dimension.
+
+    Returns:
+        The dimension, or None if it was never recorded or was recorded
+        for a different embedding model
+    """
+    try:
+        data = json.loads(_embed_dim_path().read_text())
+    except (OSError, ValueError):
+        return None
+
+    if data.get("model") != settings.EMBEDDING_MODEL:
+        return None
+    return data.get("dim")
+
+
+def default_embed_batch_size() -> int:
+    """
+    Pick the number of texts per embedding request.
+
+    Uses settings.EMBED_BATCH_SIZE when set. Otherwise the batch is sized so
+    each response carries about 1 MiB of float32 vectors for the recorded
+    embedding dimension, clamped to 16-512 texts.
+
+    Returns:
+        Texts per embedding request
+
+    Example:
+        >>> default_embed_batch_size()  # after recording a 768-dim model
+        341
+    """
+    if settings.EMBED_BATCH_SIZE:
+        return settings.EMBED_BATCH_SIZE
+
+    dim = load_embedding_dim()
+    if not dim:
+        return _DEFAULT_EMBED_BATCH_SIZE
+
+    size = _EMBED_REQUEST_BYTES // (dim * 4)
+    return max(_MIN_EMBED_BATCH_SIZE, min(size, _MAX_EMBED_BATCH_SIZE))
+
+
+def _iter_batches(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most `size` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _produce(
+    documents: Iterable[Document],
+    batch_size: int,
+    batches: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Producer stage: group documents into batches and feed the bounded queue.
+
+    Any exception raised while iterating is forwarded through the queue so
+    the consumer can re-raise it.
+    """
+    try:
+        for batch in _iter_batches(documents, batch_size):
+            while not stop.is_set():
+                try:
+                    batches.put(batch, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set():
+                return
+        item = _DONE
+    except Exception as e:
+        item = e
+
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _embed_texts(embeddings, texts: List[str]) -> np.ndarray:
+    """
+    Embed texts and pack the vectors into a float32 array.
+
+    Python float lists cost ~32 bytes per dimension against 4 for float32,
+    so packing right after the request keeps vectors waiting in the
+    pipeline about 8x smaller.
+    """
+    return np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+
+
+def _embed_batch(
+    embeddings,
+    texts: List[str],
+    executor: ThreadPoolExecutor,
+    size: int,
+) -> List[Future]:
+    """Submit one embedding request per `size` texts."""
+    return [
+        executor.submit(_embed_texts, embeddings, sub_batch)
+        for sub_batch in _iter_batches(texts, size)
+    ]
+
+
+def ingest_documents(
+    documents: Iterable[Document],
+    batch_size: Optional[int] = None,
+    embed_batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    queue_size: int = 4,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Embed and store documents using a pipelined producer/consumer flow.
+
+    Embedding of later batches overlaps with the Chroma write of earlier
+    ones, so Ollama and ChromaDB latency are hidden behind each other.
+    Each upsert batch is embedded as several smaller requests, so the Ollama
+    request size and the Chroma write size can be tuned independently.
+    Batches are written in input order.
+
+    Args:
+        documents: Chunked documents to index (any iterable, consumed once)
+        batch_size: Documents per Chroma write (default: settings.UPSERT_BATCH_SIZE)
+        embed_batch_size: Texts per embedding request (default: default_embed_batch_size())
+        max_workers: Concurrent embedding requests (default: settings.EMBED_WORKERS)
+        queue_size: Maximum batches buffered between the producer and embedders
+        on_progress: Optional callback invoked with the size of each stored batch
+
+    Returns:
+        Number of documents stored
+
+    Raises:
+        Exception: If embedding or storage fails
+
+    Example:
+        >>> chunks = DocumentLoader().chunk_documents(docs)
+        >>> stored = ingest_documents(chunks, on_progress=print)
+    """
+    batch_size = batch_size or settings.UPSERT_BATCH_SIZE
+    embed_batch_size = embed_batch_size or default_embed_batch_size()
+    max_workers = max_workers or settings.EMBED_WORKERS
+
+    embeddings = get_vector_store().embeddings
+
+    batches: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce,
+        args=(documents, batch_size, batches, stop),
+        name="ingest-producer",
+        daemon=True,
+    )
+
+    in_flight: Deque[Tuple[List[Document], List[str], List[Future]]] = deque()
+    pending_requests = 0
+    stored = 0
+    deduplicated = 0
+
+    def flush_oldest() -> None:
+        nonlocal pending_requests, stored
+        batch, unique_texts, futures = in_flight.popleft()
+        pending_requests -= len(futures)
+
+        # Fan each unique vector back out to every chunk with that text
+        vectors = np.concatenate([future.result() for future in futures])
+        row_of = {text: row for row, text in enumerate(unique_texts)}
+        texts = [doc.page_content for doc in batch]
+        rows = np.fromiter((row_of[text] for text in texts), dtype=np.intp, count=len(texts))
+        add_embeddings(texts, vectors[rows], [doc.metadata for doc in batch])
+        stored += len(batch)
+        if on_progress:
+            on_progress(len(batch))
+
+    logger.info(
+        f"Ingesting documents: upsert_batch={batch_size}, "
+        f"embed_batch={embed_batch_size}, workers={max_workers}"
+    )
+
+    producer.start()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest-embed") as executor:
+            try:
+                for item in iter(batches.get, _DONE):
+                    if isinstance(item, Exception):
+                        raise item
+
+                    # Identical chunks (repeated headers, licenses, ...) are
+                    # embedded once per batch
+                    unique_texts = list(dict.fromkeys(doc.page_content for doc in item))
+                    deduplicated += len(item) - len(unique_texts)
+
+                    futures = _embed_batch(embeddings, unique_texts, executor, embed_batch_size)
+                    in_flight.append((item, unique_texts, futures))
+                    pending_requests += len(futures)
+
+                    # Bound queued embedding work to roughly one round per worker
+                    while len(in_flight) > 1 and pending_requests > max_workers:
+                        flush_oldest()
+
+                while in_flight:
+                    flush_oldest()
+            except BaseException:
+                for _, _, futures in in_flight:
+                    for future in futures:
+                        future.cancel()
+                raise
+    except Exception as e:
+        logger.error(f"Failed to ingest documents: {e}")
+        raise
+    finally:
+        stop.set()
+        producer.join()
+
+    logger.info(
+        f"Successfully ingested {stored} documents "
+        f"({deduplicated} duplicate chunks reused an existing embedding)"
+    )
+    return stored
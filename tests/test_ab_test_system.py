@@ -199,6 +199,48 @@ class TestABTestDatabase:
         assert stats["rated_runs"] == 3
         assert stats["avg_rating"] == 4.0  # (4 + 5 + 3) / 3
 
+    def test_save_test_runs_batch(self, temp_db):
+        """Test saving several test runs in a single transaction."""
+        runs = [
+            {
+                "prompt_variant": "bullets",
+                "question": f"Question {i}?",
+                "user_rating": 3 + i,
+                "web_search_used": i == 0,
+                "session_id": "batch_session"
+            }
+            for i in range(3)
+        ]
+
+        inserted = temp_db.save_test_runs_batch(runs)
+
+        assert inserted == 3
+        assert not temp_db.conn.in_transaction
+
+        stats = temp_db.get_variant_stats("bullets")
+        assert stats["total_runs"] == 3
+        assert stats["avg_rating"] == 4.0  # (3 + 4 + 5) / 3
+
+        session_runs = temp_db.get_session_runs("batch_session")
+        assert [r["web_search_used"] for r in session_runs] == [1, 0, 0]
+
+    def test_save_test_runs_batch_empty(self, temp_db):
+        """Test that an empty batch is a no-op."""
+        assert temp_db.save_test_runs_batch([]) == 0
+        assert temp_db.get_variant_stats("baseline")["total_runs"] == 0
+
+    def test_transaction_rolls_back_on_error(self, temp_db):
+        """Test that a failing transaction leaves no partial writes."""
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO ab_test_runs (prompt_variant, question) VALUES (?, ?)",
+                    ("baseline", "Rolled back?")
+                )
+                raise RuntimeError("boom")
+
+        assert temp_db.get_variant_stats("baseline")["total_runs"] == 0
+
     def test_get_variant_stats_empty(self, temp_db):
         """Test getting stats for a variant with no data."""
         stats = temp_db.get_variant_stats("detailed")
@@ -283,6 +325,18 @@ class TestABTestDatabase:
             assert all_stats[variant]["total_runs"] == 1
             assert all_stats[variant]["avg_rating"] == 4.0
 
+    def test_get_all_variant_stats_matches_single_variant(self, temp_db):
+        """Test grouped statistics agree with per-variant statistics."""
+        temp_db.save_test_run({"prompt_variant": "baseline", "question": "Q1?", "user_rating": 3})
+        temp_db.save_test_run({"prompt_variant": "baseline", "question": "Q2?"})
+        temp_db.save_test_run({"prompt_variant": "custom", "question": "Q3?", "user_rating": 5})
+
+        all_stats = temp_db.get_all_variant_stats()
+
+        assert set(all_stats) == {"baseline", "detailed", "bullets", "reasoning"}
+        for variant, stats in all_stats.items():
+            assert stats == temp_db.get_variant_stats(variant)
+
     def test_get_recent_runs(self, temp_db):
         """Test retrieving recent test runs."""
         # Add multiple test runs
@@ -352,6 +406,39 @@ class TestABTestDatabase:
         assert len(session_runs) == 3
         assert all(r["session_id"] == session_id for r in session_runs)
 
+    def test_get_session_summary(self, temp_db):
+        """Test aggregate statistics for a session."""
+        session_id = "summary_session"
+
+        for rating in (4, None, 5):
+            temp_db.save_test_run({
+                "prompt_variant": "baseline",
+                "question": "Question?",
+                "user_rating": rating,
+                "session_id": session_id
+            })
+
+        temp_db.save_test_run({
+            "prompt_variant": "baseline",
+            "question": "Other question?",
+            "user_rating": 1,
+            "session_id": "other_session"
+        })
+
+        summary = temp_db.get_session_summary(session_id)
+
+        assert summary["total_runs"] == 3
+        assert summary["rated_runs"] == 2
+        assert summary["avg_rating"] == 4.5
+
+    def test_get_session_summary_empty(self, temp_db):
+        """Test session summary for an unknown session."""
+        summary = temp_db.get_session_summary("missing")
+
+        assert summary["total_runs"] == 0
+        assert summary["rated_runs"] == 0
+        assert summary["avg_rating"] is None
+
     def test_database_context_manager(self):
         """Test using database as a context manager."""
         with tempfile.TemporaryDirectory() as tmpdir:
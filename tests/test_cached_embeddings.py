@@ -0,0 +1,38 @@
+"""
+Unit tests for the persistent embedding cache.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from src.vectorstore.cached_embeddings import get_cached_embeddings
+
+
+class TestCachedEmbeddings:
+    """Test get_cached_embeddings."""
+
+    def test_repeated_texts_skip_underlying(self, tmp_path):
+        """Test texts embedded once are served from the cache afterwards."""
+        underlying = MagicMock()
+        underlying.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+
+        with patch('src.vectorstore.cached_embeddings.settings') as mock_settings:
+            mock_settings.EMBEDDING_CACHE_ENABLED = True
+            mock_settings.EMBEDDING_MODEL = "test-model"
+            mock_settings.get_embedding_cache_path.return_value = tmp_path
+            embeddings = get_cached_embeddings(underlying)
+
+        first = embeddings.embed_documents(["alpha", "beta"])
+        second = embeddings.embed_documents(["alpha", "beta", "gamma"])
+
+        assert first == [[5.0], [4.0]]
+        assert second == [[5.0], [4.0], [5.0]]
+        assert underlying.embed_documents.call_args_list[-1].args[0] == ["gamma"]
+        assert underlying.embed_documents.call_count == 2
+
+    def test_disabled_returns_underlying(self):
+        """Test the embedder is returned unchanged when caching is off."""
+        underlying = MagicMock()
+
+        with patch('src.vectorstore.cached_embeddings.settings') as mock_settings:
+            mock_settings.EMBEDDING_CACHE_ENABLED = False
+            assert get_cached_embeddings(underlying) is underlying
@@ -0,0 +1,92 @@
+"""
+Unit tests for DocumentLoader.
+
+Tests cover:
+- Directory scanning for supported files
+- Loading text documents
+"""
+
+import pytest
+
+from src.loaders.document_loader import DocumentLoader, _scan_files
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Create a small nested directory of documents."""
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "a.md").write_text("# Alpha\n\nFirst document.", encoding="utf-8")
+    (tmp_path / "nested" / "b.TXT").write_text("Second document.", encoding="utf-8")
+    (tmp_path / "nested" / "deeper" / "c.markdown").write_text("Third document.", encoding="utf-8")
+    (tmp_path / "nested" / "ignored.py").write_text("print('skip')", encoding="utf-8")
+    (tmp_path / "folder.md").mkdir()
+    return tmp_path
+
+
+class TestScanFiles:
+    """Test recursive discovery of supported files."""
+
+    def test_finds_supported_files_recursively(self, corpus):
+        """Test nested files are found, sorted, and filtered by extension."""
+        files = _scan_files(str(corpus))
+
+        assert files == sorted([
+            str(corpus / "a.md"),
+            str(corpus / "nested" / "b.TXT"),
+            str(corpus / "nested" / "deeper" / "c.markdown"),
+        ])
+
+    def test_empty_directory(self, tmp_path):
+        """Test an empty directory yields no files."""
+        assert _scan_files(str(tmp_path)) == []
+
+
+class TestLoadDocuments:
+    """Test loading documents from a directory."""
+
+    def test_loads_all_supported_documents(self, corpus):
+        """Test every supported file becomes a document with its source."""
+        docs = DocumentLoader().load_documents(str(corpus), max_workers=1)
+
+        assert [doc.metadata["source"] for doc in docs] == _scan_files(str(corpus))
+        assert docs[0].page_content == "# Alpha\n\nFirst document."
+
+    def test_text_newlines_normalized(self, tmp_path):
+        """Test Windows and old Mac line endings load as plain newlines."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes("line one\r\nline two\rline thr\u00e9e\n".encode("utf-8"))
+
+        docs = DocumentLoader().load_document(str(path))
+
+        assert len(docs) == 1
+        assert docs[0].page_content == "line one\nline two\nline thr\u00e9e\n"
+        assert docs[0].metadata["source"] == str(path)
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing directory raises ValueError."""
+        with pytest.raises(ValueError):
+            DocumentLoader().load_documents(str(tmp_path / "missing"))
+
+
+class TestChunking:
+    """Test chunk filtering and indexing."""
+
+    def test_short_chunks_dropped(self):
+        """Test near-empty chunks are filtered and indexes stay contiguous."""
+        from langchain_core.documents import Document
+
+        loader = DocumentLoader(chunk_size=41, chunk_overlap=5, min_chunk_chars=10)
+        first = "A paragraph that is long enough to keep."
+        second = "Another one, also long enough to be kept"
+        document = Document(
+            page_content=f"{first}\n\n---\n\n{second}",
+            metadata={"source": "test"},
+        )
+
+        chunks = loader.chunk_documents([document])
+
+        assert [chunk.page_content for chunk in chunks] == [first, second]
+        assert [chunk.metadata["chunk_index"] for chunk in chunks] == [0, 1]
+        assert [chunk.page_content for chunk in loader.iter_chunks([document])] == [
+            chunk.page_content for chunk in chunks
+        ]
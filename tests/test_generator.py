@@ -0,0 +1,362 @@
+"""
+Unit tests for the AnswerGenerator.
+
+The LLM is replaced with a mock, so no Ollama server is needed.
+
+Tests cover:
+- Shared LLM clients and prompts
+- Context formatting
+- Answer generation
+- Regeneration budget
+- Token counting
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from langchain_core.documents import Document
+
+from src.agents.generator import AnswerGenerator
+from config.settings import settings
+
+
+@pytest.fixture
+def generator():
+    """AnswerGenerator whose LLM returns a fixed answer."""
+    AnswerGenerator.clear_cache()
+    generator = AnswerGenerator()
+    generator.llm = Mock()
+    generator.llm.invoke.return_value = Mock(content="LangGraph builds agent workflows.")
+    generator.llm_light = generator.llm
+    return generator
+
+
+@pytest.fixture
+def documents():
+    """Two small context documents."""
+    return [
+        Document(page_content="LangGraph is a library.", metadata={"source": "a"}),
+        Document(page_content="It builds agent workflows.", metadata={"source": "b"}),
+    ]
+
+
+class TestSharedClients:
+    """Test reuse of LLM clients and prompt templates."""
+
+    def test_generators_share_llm_and_prompt(self):
+        """Test new generators reuse the cached client and template."""
+        first = AnswerGenerator()
+        second = AnswerGenerator()
+
+        assert first.llm is second.llm
+        assert first.rag_prompt is second.rag_prompt
+
+    def test_light_model_defaults_to_generation_model(self, monkeypatch):
+        """Test regenerations reuse the main client when no light model is set."""
+        monkeypatch.setattr("src.agents.generator.settings.GENERATION_MODEL_LIGHT", "")
+
+        generator = AnswerGenerator()
+
+        assert generator.llm_light is generator.llm
+
+    def test_light_model_client(self, monkeypatch):
+        """Test a configured light model gets its own client."""
+        monkeypatch.setattr("src.agents.generator.settings.GENERATION_MODEL_LIGHT", "llama3.2:3b")
+
+        generator = AnswerGenerator()
+
+        assert generator.llm_light.model == "llama3.2:3b"
+        assert generator.llm_light is not generator.llm
+
+    def test_variants_get_their_own_prompt(self):
+        """Test each prompt variant keeps its own template."""
+        assert AnswerGenerator("baseline").rag_prompt is not AnswerGenerator("detailed").rag_prompt
+
+
+class TestFormatDocuments:
+    """Test context formatting."""
+
+    def test_cached_matches_uncached(self, generator, documents):
+        """Test the cached formatter produces the same context."""
+        assert generator._format_documents_cached(documents) == generator._format_documents(documents)
+
+    def test_same_contents_reuse_context(self, generator, documents):
+        """Test equal contents return the already-joined string."""
+        first = generator._format_documents_cached(documents)
+        copies = [Document(page_content=doc.page_content) for doc in documents]
+
+        assert generator._format_documents_cached(copies) is first
+
+    def test_changed_contents_reformat(self, generator, documents):
+        """Test different contents are not served from the cache."""
+        first = generator._format_documents_cached(documents)
+        documents[1] = Document(page_content="Something else.")
+
+        assert generator._format_documents_cached(documents) != first
+
+    def test_duplicate_contents_skipped(self, generator, documents):
+        """Test repeated contents appear once, in first-seen order."""
+        repeated = documents + [Document(page_content=documents[0].page_content)]
+
+        assert generator._format_documents(repeated) == "LangGraph is a library.\n\nIt builds agent workflows."
+        assert generator._format_documents_cached(repeated) == generator._format_documents(repeated)
+
+    def test_context_truncated_at_limit(self, generator, documents, monkeypatch):
+        """Test the context stops at MAX_CONTEXT_CHARS characters."""
+        monkeypatch.setattr("src.agents.generator.settings.MAX_CONTEXT_CHARS", 30)
+
+        context = generator._format_documents_cached(documents)
+
+        assert context == "LangGraph is a library.\n\nIt bu"
+        assert len(context) == 30
+        assert generator._format_documents(documents) == context
+
+
+class TestGenerate:
+    """Test answer generation."""
+
+    def test_returns_llm_content(self, generator, documents):
+        """Test the answer is the LLM message content."""
+        answer = generator.generate("What is LangGraph?", documents)
+
+        assert answer == "LangGraph builds agent workflows."
+        generator.llm.invoke.assert_called_once()
+
+    def test_prompt_filled_once(self, generator, documents):
+        """Test placeholders inside the question are left as literal text."""
+        generator.generate("What does {context} mean?", documents)
+
+        message = generator.llm.invoke.call_args.args[0][0]
+        assert message.type == "human"
+        assert "What does {context} mean?" in message.content
+        assert message.content.count("LangGraph is a library.") == 1
+
+    def test_identical_request_served_from_cache(self, generator, documents):
+        """Test a repeated question/context pair skips the LLM."""
+        first = generator.generate("What is LangGraph?", documents)
+        copies = [Document(page_content=doc.page_content) for doc in documents]
+
+        assert AnswerGenerator().generate("What is LangGraph?", copies) == first
+        generator.llm.invoke.assert_called_once()
+
+    def test_changed_request_not_cached(self, generator, documents):
+        """Test a different question or variant calls the LLM again."""
+        generator.generate("What is LangGraph?", documents)
+        generator.generate("What is LangChain?", documents)
+
+        other = AnswerGenerator(prompt_variant="detailed")
+        other.llm = generator.llm
+        other.generate("What is LangGraph?", documents)
+
+        assert generator.llm.invoke.call_count == 3
+
+    def test_cache_key_holds_fingerprints(self, generator, documents):
+        """Test cache keys store fixed-size digests, not the contents."""
+        key = generator._cache_key("What is LangGraph?", documents)
+        fingerprints = key[-1]
+
+        assert len(fingerprints) == len(documents)
+        assert all(isinstance(fp, bytes) and len(fp) == 16 for fp in fingerprints)
+        assert fingerprints[0] != fingerprints[1]
+
+    def test_cache_evicts_least_recent(self, generator, documents, monkeypatch):
+        """Test the cache holds at most ANSWER_CACHE_SIZE answers."""
+        monkeypatch.setattr("src.agents.generator.settings.ANSWER_CACHE_SIZE", 2)
+
+        for question in ("q1", "q2", "q1", "q3", "q1", "q2"):
+            generator.generate(question, documents)
+
+        # q1 hit twice; q2 was evicted by q3 and generated again
+        assert generator.llm.invoke.call_count == 4
+
+    def test_empty_question_rejected(self, generator, documents):
+        """Test an empty question raises ValueError."""
+        with pytest.raises(ValueError):
+            generator.generate("", documents)
+
+    def test_no_documents_rejected(self, generator):
+        """Test missing documents raise ValueError."""
+        with pytest.raises(ValueError):
+            generator.generate("What is LangGraph?", [])
+
+    def test_stream_validates_request(self, generator):
+        """Test streaming rejects an empty question before calling the LLM."""
+        with pytest.raises(ValueError, match="Question cannot be empty"):
+            next(generator.generate_stream("", []))
+        generator.llm.stream.assert_not_called()
+
+
+class TestRegenerationBudget:
+    """Test budget-aware generation during hallucination regenerations."""
+
+    def test_within_budget_prompt_unchanged(self, generator, documents):
+        """Test early regenerations use the normal prompt."""
+        generator.generate("What is LangGraph?", documents, regeneration_count=1, max_regenerations=3)
+
+        prompt = generator.llm.invoke.call_args.args[0]
+        assert [message.type for message in prompt] == ["human"]
+
+    def test_over_budget_adds_system_instruction(self, generator, documents):
+        """Test the LLM is told to finalize on the last allowed regeneration."""
+        generator.generate("What is LangGraph?", documents, regeneration_count=10, max_regenerations=10)
+
+        prompt = generator.llm.invoke.call_args.args[0]
+        assert [message.type for message in prompt] == ["system", "human"]
+        assert "over budget" in prompt[0].content
+
+    def test_over_budget_not_served_normal_answer(self, generator, documents):
+        """Test over-budget requests do not share cache entries with normal ones."""
+        generator.generate("What is LangGraph?", documents)
+        generator.generate("What is LangGraph?", documents, regeneration_count=10, max_regenerations=10)
+
+        assert generator.llm.invoke.call_count == 2
+
+    def test_regeneration_uses_light_model(self, generator, documents, monkeypatch):
+        """Test only the first attempt goes to the main model."""
+        monkeypatch.setattr("src.agents.generator.settings.GENERATION_MODEL_LIGHT", "llama3.2:3b")
+        generator.llm_light = Mock()
+        generator.llm_light.invoke.return_value = Mock(content="light answer")
+
+        first = generator.generate("What is LangGraph?", documents)
+        retry = generator.generate("What is LangGraph?", documents, regeneration_count=1, max_regenerations=3)
+
+        assert first == "LangGraph builds agent workflows."
+        assert retry == "light answer"
+        generator.llm.invoke.assert_called_once()
+        generator.llm_light.invoke.assert_called_once()
+
+    def test_default_budget_last_attempt_uses_llm(self, generator, documents):
+        """Test every regeneration under the default budget gets an LLM answer."""
+        max_regenerations = settings.MAX_REGENERATIONS
+
+        for count in range(1, max_regenerations + 1):
+            answer = generator.generate("What is LangGraph?", documents, regeneration_count=count)
+            assert answer == "LangGraph builds agent workflows."
+
+        prompts = [call.args[0] for call in generator.llm.invoke.call_args_list]
+        assert [message.type for message in prompts[0]] == ["human"]
+        assert [message.type for message in prompts[-1]] == ["system", "human"]
+
+    def test_exhausted_budget_skips_llm(self, generator, documents, monkeypatch):
+        """Test the final attempt summarizes the documents when enabled."""
+        monkeypatch.setattr("src.agents.generator.settings.GENERATION_BUDGET_SUMMARY", True)
+
+        answer = generator.generate("What is LangGraph?", documents, regeneration_count=2, max_regenerations=3)
+        assert [message.type for message in generator.llm.invoke.call_args.args[0]] == ["system", "human"]
+
+        answer = generator.generate("What is LangGraph?", documents, regeneration_count=3, max_regenerations=3)
+
+        assert answer == "LangGraph is a library.\nIt builds agent workflows."
+        generator.llm.invoke.assert_called_once()
+
+    def test_defaults_to_setting(self, generator, documents, monkeypatch):
+        """Test the budget falls back to settings.MAX_REGENERATIONS."""
+        monkeypatch.setattr("src.agents.generator.settings.MAX_REGENERATIONS", 2)
+
+        generator.generate("What is LangGraph?", documents, regeneration_count=2)
+
+        prompt = generator.llm.invoke.call_args.args[0]
+        assert [message.type for message in prompt] == ["system", "human"]
+
+
+class TestAsyncGenerate:
+    """Test async generation."""
+
+    @pytest.mark.asyncio
+    async def test_agenerate_uses_ainvoke(self, generator, documents):
+        """Test agenerate awaits the LLM and shares the answer cache."""
+        generator.llm.ainvoke = AsyncMock(return_value=Mock(content="async answer"))
+
+        assert await generator.agenerate("What is LangGraph?", documents) == "async answer"
+        assert generator.generate("What is LangGraph?", documents) == "async answer"
+        generator.llm.invoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_agenerate_many_bounded_and_ordered(self, generator, documents):
+        """Test answers keep input order and concurrency stays within the limit."""
+        running = 0
+        peak = 0
+
+        async def fake_ainvoke(prompt):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            # Answer with whichever context document the prompt carries
+            return Mock(content=next(
+                f"answer {i}" for i in range(6) if f"context {i}." in prompt[0].content
+            ))
+
+        generator.llm.ainvoke = fake_ainvoke
+        pairs = [
+            ("What is LangGraph?", [Document(page_content=f"context {i}.")])
+            for i in range(6)
+        ]
+
+        answers = await generator.agenerate_many(pairs, max_concurrency=2)
+
+        assert answers == [f"answer {i}" for i in range(6)]
+        assert peak == 2
+
+
+class TestGenerateStream:
+    """Test streaming generation."""
+
+    def test_streams_llm_chunks_with_document_context(self, generator, documents):
+        """Test chunks come from the LLM and the prompt carries the documents."""
+        generator.llm.stream.return_value = iter([Mock(content="Lang"), Mock(content="Graph")])
+
+        chunks = list(generator.generate_stream("What is LangGraph?", documents))
+
+        assert chunks == ["Lang", "Graph"]
+        prompt = generator.llm.stream.call_args.args[0][0].content
+        assert "LangGraph is a library." in prompt
+        assert "It builds agent workflows." in prompt
+
+    def test_streamed_answer_is_cached(self, generator, documents):
+        """Test a completed stream serves later identical requests."""
+        generator.llm.stream.return_value = iter([Mock(content="Lang"), Mock(content="Graph")])
+
+        list(generator.generate_stream("What is LangGraph?", documents))
+
+        assert list(generator.generate_stream("What is LangGraph?", documents)) == ["LangGraph"]
+        assert generator.generate("What is LangGraph?", documents) == "LangGraph"
+        generator.llm.stream.assert_called_once()
+        generator.llm.invoke.assert_not_called()
+
+    def test_exhausted_budget_yields_summary(self, generator, documents, monkeypatch):
+        """Test the out-of-budget summary is yielded without calling the LLM."""
+        monkeypatch.setattr("src.agents.generator.settings.GENERATION_BUDGET_SUMMARY", True)
+        chunks = list(generator.generate_stream(
+            "What is LangGraph?", documents, regeneration_count=3, max_regenerations=3
+        ))
+
+        assert chunks == ["LangGraph is a library.\nIt builds agent workflows."]
+        generator.llm.stream.assert_not_called()
+
+
+class TestCountTokens:
+    """Test token counting."""
+
+    def test_counts_each_text_in_one_batch(self, generator, documents):
+        """Test the question and each document are encoded together."""
+        encoding = Mock()
+        encoding.encode_batch.return_value = [[1, 2, 3], [4, 5], [6, 7, 8, 9]]
+
+        with patch("src.agents.generator._get_encoding", return_value=encoding):
+            counts = generator.count_tokens("What is LangGraph?", documents)
+
+        assert counts == {"question": 3, "context": 6, "total": 9}
+        texts = encoding.encode_batch.call_args.args[0]
+        assert texts == ["What is LangGraph?"] + [doc.page_content for doc in documents]
+
+    def test_character_estimate_without_encoding(self, generator, documents):
+        """Test the 4-characters-per-token fallback."""
+        with patch("src.agents.generator._get_encoding", return_value=None):
+            counts = generator.count_tokens("12345678", documents)
+
+        assert counts["question"] == 2
+        assert counts["context"] == len(documents[0].page_content) // 4 + len(documents[1].page_content) // 4
+        assert counts["total"] == counts["question"] + counts["context"]
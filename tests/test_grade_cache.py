@@ -0,0 +1,119 @@
+"""
+Unit tests for the semantic relevance grade cache.
+
+Tests cover:
+- Pair vector construction
+- Similarity-thresholded lookups
+- TTL expiry and size-bounded eviction
+- Hit-rate statistics
+- Exact-match cache expiry
+"""
+
+import numpy as np
+import pytest
+
+from src.agents._grade_cache import ExactCache, SemanticGradeCache, pair_vector
+
+
+def unit(rng, dim=64):
+    """Random unit vector."""
+    v = rng.standard_normal(dim)
+    return v / np.linalg.norm(v)
+
+
+def nudge(rng, v, amount):
+    """Unit vector close to v."""
+    w = v + amount * rng.standard_normal(v.shape)
+    return w / np.linalg.norm(w)
+
+
+@pytest.fixture
+def rng():
+    """Seeded generator for reproducible vectors."""
+    return np.random.default_rng(42)
+
+
+class TestPairVector:
+    """Test combining question and document embeddings."""
+
+    def test_unit_length_and_mean_similarity(self, rng):
+        """Test pair cosine equals the mean of the component cosines."""
+        q1, d1, q2, d2 = (unit(rng) for _ in range(4))
+
+        a = pair_vector(q1 * 3, d1)
+        b = pair_vector(q2, d2 * 0.5)
+
+        assert a.dtype == np.float32
+        assert np.linalg.norm(a) == pytest.approx(1.0, abs=1e-5)
+        assert float(a @ b) == pytest.approx((q1 @ q2 + d1 @ d2) / 2, abs=1e-5)
+
+
+class TestSemanticGradeCache:
+    """Test lookups, expiry and eviction."""
+
+    def test_near_duplicate_hits(self, rng):
+        """Test a slightly perturbed pair reuses the cached grade."""
+        cache = SemanticGradeCache(threshold=0.95)
+        q, d = unit(rng), unit(rng)
+        cache.add(pair_vector(q, d), "yes")
+
+        assert cache.lookup(pair_vector(nudge(rng, q, 0.02), d)) == "yes"
+
+    def test_dissimilar_pair_misses(self, rng):
+        """Test an unrelated pair is not served from the cache."""
+        cache = SemanticGradeCache(threshold=0.95)
+        cache.add(pair_vector(unit(rng), unit(rng)), "yes")
+
+        assert cache.lookup(pair_vector(unit(rng), unit(rng))) is None
+
+    def test_expired_entries_ignored(self, rng, monkeypatch):
+        """Test grades older than the TTL are dropped."""
+        clock = [100.0]
+        monkeypatch.setattr("src.agents._grade_cache.time.monotonic", lambda: clock[0])
+        cache = SemanticGradeCache(ttl_seconds=10)
+        vector = pair_vector(unit(rng), unit(rng))
+        cache.add(vector, "no")
+
+        clock[0] = 111.0
+
+        assert cache.lookup(vector) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_oldest_evicted_beyond_max_entries(self, rng):
+        """Test the cache keeps at most max_entries grades."""
+        cache = SemanticGradeCache(max_entries=2)
+        vectors = [pair_vector(unit(rng), unit(rng)) for _ in range(3)]
+        for vector in vectors:
+            cache.add(vector, "yes")
+
+        assert cache.stats()["entries"] == 2
+        assert cache.lookup(vectors[0]) is None
+        assert cache.lookup(vectors[2]) == "yes"
+
+    def test_stats_track_hit_rate(self, rng):
+        """Test hits and misses are counted."""
+        cache = SemanticGradeCache()
+        vector = pair_vector(unit(rng), unit(rng))
+        cache.add(vector, "yes")
+
+        cache.lookup(vector)
+        cache.lookup(pair_vector(unit(rng), unit(rng)))
+
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+class TestExactCache:
+    """Test the exact-match result cache."""
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test a result is dropped once its TTL has passed."""
+        clock = [100.0]
+        monkeypatch.setattr("src.agents._grade_cache.time.monotonic", lambda: clock[0])
+        cache = ExactCache(max_entries=4, ttl_seconds=60)
+
+        cache.put(("query",), ["result"])
+        clock[0] += 59
+        assert cache.get(("query",)) == ["result"]
+
+        clock[0] += 2
+        assert cache.get(("query",)) is None
@@ -7,16 +7,30 @@ Tests cover:
 - AnswerGrader (answer usefulness)
 """
 
+import asyncio
+
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
 from langchain_core.documents import Document
 
+from src.agents import graders
 from src.agents.graders import (
     DocumentGrader,
     HallucinationGrader,
-    AnswerGrader
+    AnswerGrader,
+    agrade_generation
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Start every test with an empty grade cache."""
+    graders._get_result_cache.cache_clear()
+    yield
+    graders._get_result_cache.cache_clear()
+
+
 class TestDocumentGrader:
     """Test DocumentGrader for document relevance evaluation."""
 
@@ -279,3 +293,578 @@ class TestGraderIntegration:
 
         # Full pipeline successful
         assert True
+
+
+class TestGradeMany:
+    """Test concurrent grade_many batching without a live LLM."""
+
+    def test_hallucination_scores_in_input_order(self):
+        """Test each pair is graded once and scores keep input order."""
+        grader = HallucinationGrader()
+        docs = [Document(page_content="LangGraph is a library.")]
+        pairs = [(f"answer {i}", docs) for i in range(6)]
+
+        def fake_grade(generation, documents):
+            return "yes" if int(generation.split()[-1]) % 2 == 0 else "no"
+
+        with patch.object(grader, "grade", side_effect=fake_grade) as grade:
+            scores = grader.grade_many(pairs, max_workers=3)
+
+        assert scores == ["yes", "no", "yes", "no", "yes", "no"]
+        assert grade.call_count == 6
+
+    def test_answer_error_propagates(self):
+        """Test a failing sub-request is raised to the caller."""
+        grader = AnswerGrader()
+
+        with patch.object(grader, "grade", side_effect=Exception("Answer grading failed: down")):
+            with pytest.raises(Exception, match="down"):
+                grader.grade_many([("q", "a"), ("q", "b")])
+
+    def test_empty_input(self):
+        """Test no requests are made for an empty batch."""
+        grader = AnswerGrader()
+
+        with patch.object(grader, "grade") as grade:
+            assert grader.grade_many([]) == []
+
+        grade.assert_not_called()
+
+
+class TestDocumentGraderBatch:
+    """Test concurrent document grading without a live LLM."""
+
+    @pytest.fixture
+    def documents(self):
+        """Six documents whose index decides their score."""
+        return [Document(page_content=f"chunk {i}") for i in range(6)]
+
+    def test_grade_batch_keeps_document_order(self, documents):
+        """Test grade_batch returns one score per document, in order."""
+        grader = DocumentGrader()
+
+        def fake_grade(question, document):
+            return "yes" if int(document.page_content.split()[-1]) % 3 == 0 else "no"
+
+        with patch.object(grader, "grade", side_effect=fake_grade) as grade:
+            scores = grader.grade_batch("What is LangGraph?", documents)
+
+        assert scores == ["yes", "no", "no", "yes", "no", "no"]
+        assert grade.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_agrade_batch_bounded_and_ordered(self, documents):
+        """Test async grading overlaps requests up to the concurrency limit."""
+        grader = DocumentGrader()
+        running = 0
+        peak = 0
+
+        async def fake_ainvoke(prompt, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            score = "yes" if "chunk 0" in prompt else "no"
+            return Mock(content=f'{{"score": "{score}"}}')
+
+        grader.llm = Mock(ainvoke=fake_ainvoke)
+
+        scores = await grader.agrade_batch("What is LangGraph?", documents, max_concurrency=3)
+
+        assert scores == ["yes"] + ["no"] * 5
+        assert peak == 3
+
+    def test_prompt_ends_with_document(self):
+        """Test only the document follows the shared instructions and question."""
+        grader = DocumentGrader()
+        text = grader.prompt.invoke({"question": "QUESTION", "document": "DOCUMENT"}).to_string()
+
+        assert text.index("QUESTION") < text.index("DOCUMENT")
+        assert text.rstrip().endswith("DOCUMENT")
+
+    def test_single_call_groups_documents(self, documents):
+        """Test documents are graded in numbered groups of batch_size."""
+        grader = DocumentGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.side_effect = [
+            Mock(content='{"scores": ["yes", "no", "no", "yes"]}'),
+            Mock(content='{"scores": ["No", "YES"]}'),
+        ]
+
+        scores = grader.grade_batch_single_call("What is LangGraph?", documents, batch_size=4)
+
+        assert scores == ["yes", "no", "no", "yes", "no", "yes"]
+        assert grader.llm.invoke.call_count == 2
+        prompt = grader.llm.invoke.call_args_list[1].args[0]
+        assert "[1] chunk 4" in prompt and "[2] chunk 5" in prompt
+
+    def test_single_call_falls_back_on_mismatch(self, documents):
+        """Test a group with the wrong number of scores is graded per document."""
+        grader = DocumentGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"scores": ["yes"]}')
+
+        with patch.object(grader, "grade", return_value="no") as grade:
+            scores = grader.grade_batch_single_call("What is LangGraph?", documents[:3], batch_size=8)
+
+        assert scores == ["no", "no", "no"]
+        assert grade.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_agrade_rejects_empty_document(self):
+        """Test async grading validates input before calling the LLM."""
+        grader = DocumentGrader()
+        grader.llm = Mock()
+
+        with pytest.raises(ValueError, match="Document cannot be empty"):
+            await grader.agrade("What is LangGraph?", Document(page_content=""))
+
+
+class TestAgradeGeneration:
+    """Test concurrent hallucination and usefulness checks."""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self):
+        """Test both graders are awaited together and return their scores."""
+        hallucination_started = asyncio.Event()
+        answer_started = asyncio.Event()
+        hallucination_grader = HallucinationGrader()
+        answer_grader = AnswerGrader()
+
+        # Each check only finishes once the other is in flight
+        async def grounded(prompt, **kwargs):
+            hallucination_started.set()
+            await asyncio.wait_for(answer_started.wait(), timeout=1)
+            return Mock(content='{"score": "yes"}')
+
+        async def useful(prompt, **kwargs):
+            answer_started.set()
+            await asyncio.wait_for(hallucination_started.wait(), timeout=1)
+            return Mock(content='{"score": "no"}')
+
+        hallucination_grader.llm = Mock(ainvoke=grounded)
+        answer_grader.llm = Mock(ainvoke=useful)
+
+        scores = await agrade_generation(
+            "What is LangGraph?",
+            "LangGraph is a library.",
+            [Document(page_content="LangGraph is a library.")],
+            hallucination_grader=hallucination_grader,
+            answer_grader=answer_grader,
+        )
+
+        assert scores == ("yes", "no")
+
+    @pytest.mark.asyncio
+    async def test_default_graders_are_shared(self):
+        """Test calls without graders reuse one instance of each."""
+        graders._default_hallucination_grader.cache_clear()
+        graders._default_answer_grader.cache_clear()
+
+        with patch("src.agents.graders.HallucinationGrader") as hallucination_class, \
+                patch("src.agents.graders.AnswerGrader") as answer_class:
+            hallucination_class.return_value.agrade = AsyncMock(return_value="yes")
+            answer_class.return_value.agrade = AsyncMock(return_value="yes")
+            documents = [Document(page_content="LangGraph is a library.")]
+
+            for _ in range(2):
+                await agrade_generation("What is LangGraph?", "LangGraph is a library.", documents)
+
+        hallucination_class.assert_called_once_with()
+        answer_class.assert_called_once_with()
+        graders._default_hallucination_grader.cache_clear()
+        graders._default_answer_grader.cache_clear()
+
+
+class TestConvenienceFunctions:
+    """Test the shared grader behind the module-level helpers."""
+
+    @pytest.fixture(autouse=True)
+    def shared_grader(self):
+        """Shared DocumentGrader with a mocked LLM, dropped after the test."""
+        graders._default_document_grader.cache_clear()
+        grader = graders._default_document_grader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+        grader.llm.ainvoke = AsyncMock(return_value=Mock(content='{"score": "yes"}'))
+        yield grader
+        graders._default_document_grader.cache_clear()
+
+    def test_grader_reused_across_calls(self, shared_grader):
+        """Test repeated calls go through one grader instance."""
+        document = Document(page_content="LangGraph is a library.")
+
+        assert graders.grade_document("What is LangGraph?", document) == "yes"
+        assert graders.grade_documents("What's LangGraph?", [document]) == ["yes"]
+        assert graders._default_document_grader() is shared_grader
+        assert shared_grader.llm.invoke.call_count == 1
+        assert shared_grader.llm.ainvoke.call_count == 1
+
+    def test_grade_documents_bounded_across_callers(self, shared_grader, monkeypatch):
+        """Test concurrent callers share one in-flight limit on the grading loop."""
+        monkeypatch.setattr(graders.settings, "GRADING_WORKERS", 2)
+        graders._get_grading_semaphore.cache_clear()
+        in_flight = peak = 0
+
+        async def fake_ainvoke(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(content='{"score": "no"}')
+
+        shared_grader.llm.ainvoke = fake_ainvoke
+        documents = [Document(page_content=f"chunk {i}") for i in range(4)]
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(
+                    lambda q: graders.grade_documents(q, documents), ["first?", "second?"]
+                ))
+        finally:
+            graders._get_grading_semaphore.cache_clear()
+
+        assert results == [["no"] * 4, ["no"] * 4]
+        assert peak == 2
+
+    def test_warmup_requests_one_token(self, shared_grader):
+        """Test warmup sends a one-token request and reports failures."""
+        assert graders.warmup() is True
+        assert shared_grader.llm.invoke.call_args.kwargs == {"options": {"num_predict": 1}}
+
+        shared_grader.llm.invoke.side_effect = Exception("connection refused")
+        assert graders.warmup() is False
+
+
+class TestSemanticGradeCache:
+    """Test DocumentGrader reuse of grades for near-duplicate pairs."""
+
+    @pytest.fixture
+    def grader(self, monkeypatch):
+        """DocumentGrader with the semantic cache enabled and a mocked LLM."""
+        monkeypatch.setattr(graders.settings, "GRADE_SEMANTIC_CACHE", True)
+        graders._get_semantic_cache.cache_clear()
+        grader = DocumentGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+        yield grader
+        graders._get_semantic_cache.cache_clear()
+
+    def test_repeat_pair_skips_llm(self, grader):
+        """Test a second grade of the same pair is served from the cache."""
+        vector = graders.pair_vector([1.0, 0.0], [0.0, 1.0])
+        document = Document(page_content="LangGraph is a library.")
+
+        with patch("src.agents.graders._grade_pair_vector", return_value=vector):
+            assert grader.grade("What is LangGraph?", document) == "yes"
+            assert grader.grade("What's LangGraph?", document) == "yes"
+
+        grader.llm.invoke.assert_called_once()
+        assert graders._get_semantic_cache().stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_agrade_shares_semantic_cache(self, grader):
+        """Test async grading reads and fills the same semantic cache."""
+        vector = graders.pair_vector([1.0, 0.0], [0.0, 1.0])
+        document = Document(page_content="LangGraph is a library.")
+        grader.llm.ainvoke = AsyncMock(return_value=Mock(content='{"score": "yes"}'))
+
+        with patch("src.agents.graders._grade_pair_vector", return_value=vector):
+            assert await grader.agrade("What is LangGraph?", document) == "yes"
+            assert grader.grade("What's LangGraph?", document) == "yes"
+            assert await grader.agrade("Tell me about LangGraph", document) == "yes"
+
+        grader.llm.ainvoke.assert_awaited_once()
+        grader.llm.invoke.assert_not_called()
+        assert graders._get_semantic_cache().stats()["hits"] == 2
+
+    def test_embedding_failure_grades_normally(self, grader):
+        """Test grading still works when the pair cannot be embedded."""
+        document = Document(page_content="LangGraph is a library.")
+
+        with patch("src.agents.graders._grade_pair_vector", return_value=None):
+            grader.grade("What is LangGraph?", document)
+            grader.grade("What's LangGraph?", document)
+
+        assert grader.llm.invoke.call_count == 2
+
+
+class TestResultCache:
+    """Test exact-match caching of grader results."""
+
+    def test_identical_requests_graded_once(self):
+        """Test each grader calls the LLM once per distinct request."""
+        document = Document(page_content="LangGraph is a library.")
+        doc_grader, hallucination_grader, answer_grader = DocumentGrader(), HallucinationGrader(), AnswerGrader()
+        for grader in (doc_grader, hallucination_grader, answer_grader):
+            grader.llm = Mock()
+            grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+
+        for _ in range(2):
+            doc_grader.grade("What is LangGraph?", document)
+            hallucination_grader.grade("LangGraph is a library.", [document])
+            answer_grader.grade("What is LangGraph?", "LangGraph is a library.")
+        doc_grader.grade("What is LangChain?", document)
+
+        assert doc_grader.llm.invoke.call_count == 2
+        hallucination_grader.llm.invoke.assert_called_once()
+        answer_grader.llm.invoke.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_shares_cache(self):
+        """Test agrade reuses grades produced by grade."""
+        grader = AnswerGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "no"}')
+
+        grader.grade("What is LangGraph?", "I don't know.")
+
+        assert await grader.agrade("What is LangGraph?", "I don't know.") == "no"
+        grader.llm.ainvoke.assert_not_called()
+
+    def test_disabled_when_size_zero(self, monkeypatch):
+        """Test GRADE_CACHE_SIZE=0 turns caching off."""
+        monkeypatch.setattr(graders.settings, "GRADE_CACHE_SIZE", 0)
+        grader = AnswerGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+
+        grader.grade("What is LangGraph?", "A library.")
+        grader.grade("What is LangGraph?", "A library.")
+
+        assert grader.llm.invoke.call_count == 2
+
+
+class TestParseYesNo:
+    """Test extracting scores from grader responses."""
+
+    @pytest.mark.parametrize("response, expected", [
+        ('{"score": "yes"}', "yes"),
+        ('{"score":"NO"}', "no"),
+        ('Sure. {"score" : "Yes"}', "yes"),
+        ("yes", "yes"),
+        ("No, the document is unrelated.", "no"),
+        ("It mentions yesterday's release notes. no", "no"),
+        ('{"score": "maybe"}', "no"),
+        ("", "no"),
+    ])
+    def test_parse(self, response, expected):
+        """Test JSON scores, bare answers and unparseable responses."""
+        assert graders._parse_yes_no(response) == expected
+
+
+class TestConstrainedOutput:
+    """Test grader requests constrain the response format."""
+
+    def test_grade_requests_score_schema(self):
+        """Test single-document grading passes the score schema."""
+        grader = DocumentGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+
+        grader.grade("What is LangGraph?", Document(page_content="LangGraph builds agents."))
+
+        fmt = grader.llm.invoke.call_args.kwargs["format"]
+        assert fmt["properties"]["score"]["enum"] == ["yes", "no"]
+
+    def test_single_call_requests_scores_schema(self):
+        """Test batch grading passes the scores array schema."""
+        grader = DocumentGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"scores": ["no"]}')
+
+        grader.grade_batch_single_call("What is LangGraph?", [Document(page_content="chunk")])
+
+        assert grader.llm.invoke.call_args.kwargs["format"]["required"] == ["scores"]
+
+
+class TestGraderModel:
+    """Test selecting the model used by the graders."""
+
+    def test_small_model_used_when_set(self, monkeypatch):
+        """Test GRADING_MODEL_SMALL overrides GRADING_MODEL for the graders."""
+        monkeypatch.setattr(graders.settings, "GRADING_MODEL_SMALL", "qwen2.5:1.5b-instruct-q4_K_M")
+
+        assert DocumentGrader().llm.model == "qwen2.5:1.5b-instruct-q4_K_M"
+        assert AnswerGrader().llm.model == "qwen2.5:1.5b-instruct-q4_K_M"
+
+    def test_falls_back_to_grading_model(self, monkeypatch):
+        """Test an empty GRADING_MODEL_SMALL keeps GRADING_MODEL."""
+        monkeypatch.setattr(graders.settings, "GRADING_MODEL_SMALL", "")
+
+        assert HallucinationGrader().llm.model == graders.settings.GRADING_MODEL
+
+    def test_cache_keyed_by_model(self, monkeypatch):
+        """Test grades from one model are not served for another."""
+        key = graders._result_key("relevance", "q", "d")
+        monkeypatch.setattr(graders.settings, "GRADING_MODEL_SMALL", "other-model")
+
+        assert graders._result_key("relevance", "q", "d") != key
+
+
+class TestSharedClient:
+    """Test graders share one pooled ChatOllama client."""
+
+    def test_graders_share_client(self):
+        """Test all graders of one model reuse the same client."""
+        assert DocumentGrader().llm is HallucinationGrader().llm is AnswerGrader().llm
+
+    def test_client_has_connection_limits(self):
+        """Test the shared client is configured with an explicit pool."""
+        limits = DocumentGrader().llm.client_kwargs["limits"]
+
+        assert limits.max_connections == 64
+        assert limits.max_keepalive_connections == 32
+
+    def test_agrade_batch_across_event_loops(self, monkeypatch):
+        """Test async grading survives repeated asyncio.run calls."""
+        monkeypatch.setattr(graders.settings, "GRADE_SEMANTIC_CACHE", False)
+        monkeypatch.setattr(graders.settings, "GRADER_STREAM_EARLY_EXIT", False)
+        bound_loop = None
+
+        async def loop_bound_ainvoke(prompt, **kwargs):
+            # Like an httpx async client, fail when reused from another loop
+            nonlocal bound_loop
+            loop = asyncio.get_running_loop()
+            if bound_loop is None:
+                bound_loop = loop
+            elif loop is not bound_loop:
+                raise RuntimeError("Event loop is closed")
+            return Mock(content='{"score": "yes"}')
+
+        grader = DocumentGrader()
+        grader.llm = Mock(ainvoke=loop_bound_ainvoke)
+
+        for i in range(3):
+            document = Document(page_content=f"chunk {i}")
+            assert asyncio.run(grader.agrade_batch("What is LangGraph?", [document])) == ["yes"]
+
+
+class TestDocumentTruncation:
+    """Test long documents are cut before grading."""
+
+    def test_relevance_prompt_truncated(self, monkeypatch):
+        """Test only the first GRADER_MAX_DOC_CHARS characters are sent."""
+        monkeypatch.setattr(graders.settings, "GRADER_MAX_DOC_CHARS", 10)
+        grader = DocumentGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+
+        grader.grade("What is LangGraph?", Document(page_content="0123456789TAIL"))
+
+        prompt = grader.llm.invoke.call_args.args[0]
+        assert "0123456789" in prompt and "TAIL" not in prompt
+
+    def test_hallucination_context_truncated_per_document(self, monkeypatch):
+        """Test each document is cut separately before joining."""
+        monkeypatch.setattr(graders.settings, "GRADER_MAX_DOC_CHARS", 4)
+
+        inputs = HallucinationGrader._prompt_inputs(
+            "answer", [Document(page_content="aaaaXX"), Document(page_content="bbbbYY")]
+        )
+
+        assert inputs["documents"] == "aaaa\n\nbbbb"
+
+    def test_zero_disables_truncation(self, monkeypatch):
+        """Test GRADER_MAX_DOC_CHARS=0 sends documents whole."""
+        monkeypatch.setattr(graders.settings, "GRADER_MAX_DOC_CHARS", 0)
+
+        assert graders._truncate("x" * 10000) == "x" * 10000
+
+    def test_hallucination_context_bounded(self, monkeypatch):
+        """Test the joined context stops at HALLUCINATION_MAX_CHARS."""
+        monkeypatch.setattr(graders.settings, "GRADER_MAX_DOC_CHARS", 0)
+        monkeypatch.setattr(graders.settings, "HALLUCINATION_MAX_CHARS", 9)
+        documents = [Document(page_content=text) for text in ["aaaa", "bbbb", "cccc"]]
+
+        assert graders._bounded_context(documents) == "aaaa\n\nbbb"
+
+    def test_hallucination_context_unbounded(self, monkeypatch):
+        """Test HALLUCINATION_MAX_CHARS=0 joins every document."""
+        monkeypatch.setattr(graders.settings, "HALLUCINATION_MAX_CHARS", 0)
+        documents = [Document(page_content=text) for text in ["aa", "bb", "cc"]]
+
+        assert graders._bounded_context(documents) == "aa\n\nbb\n\ncc"
+
+
+class TestPromptFormatting:
+    """Test graders format prompts without ChatPromptTemplate."""
+
+    def test_matches_template_output(self):
+        """Test the raw format gives the template's human message."""
+        grader = DocumentGrader()
+        inputs = {"question": "What is {LangGraph}?", "document": "LangGraph builds agents."}
+
+        expected = grader.prompt.invoke(inputs).to_messages()[0].content
+        assert grader._format_prompt(**inputs) == expected
+
+    def test_llm_receives_string(self):
+        """Test the formatted string is passed straight to the LLM."""
+        grader = AnswerGrader()
+        grader.llm = Mock()
+        grader.llm.invoke.return_value = Mock(content='{"score": "yes"}')
+
+        grader.grade("What is LangGraph?", "A graph library.")
+
+        prompt = grader.llm.invoke.call_args.args[0]
+        assert isinstance(prompt, str) and "A graph library." in prompt
+
+
+class TestStreamEarlyExit:
+    """Test stopping grader streams once the score is decoded."""
+
+    @staticmethod
+    def chunks(*parts):
+        """Build a generator of message chunks that records being closed."""
+        state = {"read": 0, "closed": False}
+
+        def stream(*args, **kwargs):
+            try:
+                for part in parts:
+                    state["read"] += 1
+                    yield Mock(content=part)
+            finally:
+                state["closed"] = True
+
+        return stream, state
+
+    def test_stops_after_score(self):
+        """Test the stream is closed as soon as the score appears."""
+        stream, state = self.chunks('{"score', '": "Ye', 's"', "}", " trailing")
+        llm = Mock(stream=stream)
+
+        assert graders._stream_first_yes_no(llm, "prompt") == "yes"
+        assert state["read"] == 3
+        assert state["closed"]
+
+    def test_falls_back_at_end_of_stream(self):
+        """Test a response without a JSON score is parsed when the stream ends."""
+        stream, state = self.chunks("The answer is ", "no.")
+        llm = Mock(stream=stream)
+
+        assert graders._stream_first_yes_no(llm, "prompt") == "no"
+        assert state["closed"]
+
+    @pytest.mark.asyncio
+    async def test_async_stops_after_score(self):
+        """Test the async helper closes the stream after the score."""
+        read = []
+
+        async def astream(*args, **kwargs):
+            for part in ['{"score": "no"', "}", " trailing"]:
+                read.append(part)
+                yield Mock(content=part)
+
+        assert await graders._astream_first_yes_no(Mock(astream=astream), "prompt") == "no"
+        assert len(read) == 1
+
+    def test_graders_stream_when_enabled(self, monkeypatch):
+        """Test GRADER_STREAM_EARLY_EXIT switches grading to streaming."""
+        monkeypatch.setattr(graders.settings, "GRADER_STREAM_EARLY_EXIT", True)
+        stream, _ = self.chunks('{"score": "yes"}')
+        grader = HallucinationGrader()
+        grader.llm = Mock(stream=stream)
+
+        assert grader.grade("An answer.", [Document(page_content="Context.")]) == "yes"
+        grader.llm.invoke.assert_not_called()
@@ -0,0 +1,236 @@
+"""
+Unit tests for pipelined document ingestion.
+
+Tests cover:
+- Batching and ordered writes
+- Progress reporting
+- Error propagation from each stage
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+from langchain_core.documents import Document
+
+from src.vectorstore import ingest
+from src.vectorstore.ingest import ingest_documents
+
+
+def make_docs(n):
+    """Create n small documents with distinct content."""
+    return [
+        Document(page_content=f"chunk {i}", metadata={"source": "test", "chunk_index": i})
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def mock_store():
+    """Vector store whose embedder returns one vector per text."""
+    store = MagicMock()
+    store.embeddings.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    with patch('src.vectorstore.ingest.get_vector_store', return_value=store), \
+            patch('src.vectorstore.chroma_store.get_raw_collection', return_value=store._collection):
+        yield store
+
+
+class TestIngestDocuments:
+    """Test the ingest_documents pipeline."""
+
+    def test_stores_all_documents_in_order(self, mock_store):
+        """Test every document is written once, batches in input order."""
+        docs = make_docs(25)
+
+        stored = ingest_documents(docs, batch_size=10, max_workers=3)
+
+        assert stored == 25
+        calls = mock_store._collection.add.call_args_list
+        assert [len(c.kwargs["documents"]) for c in calls] == [10, 10, 5]
+
+        written = [text for c in calls for text in c.kwargs["documents"]]
+        assert written == [doc.page_content for doc in docs]
+
+    def test_passes_precomputed_embeddings(self, mock_store):
+        """Test vectors from the embedder are passed to the collection."""
+        ingest_documents(make_docs(3), batch_size=3, max_workers=1)
+
+        call = mock_store._collection.add.call_args
+        assert call.kwargs["embeddings"].tolist() == [[7.0], [7.0], [7.0]]
+        assert call.kwargs["embeddings"].dtype == np.float32
+        assert call.kwargs["metadatas"][0]["chunk_index"] == 0
+        assert len(set(call.kwargs["ids"])) == 3
+
+    def test_embed_batch_size_independent_of_upsert_batch(self, mock_store):
+        """Test each upsert batch is embedded in smaller requests."""
+        docs = make_docs(12)
+
+        ingest_documents(docs, batch_size=10, embed_batch_size=4, max_workers=2)
+
+        embed_sizes = sorted(
+            len(c.args[0]) for c in mock_store.embeddings.embed_documents.call_args_list
+        )
+        assert embed_sizes == [2, 2, 4, 4]
+
+        calls = mock_store._collection.add.call_args_list
+        assert [len(c.kwargs["embeddings"]) for c in calls] == [10, 2]
+        written = [text for c in calls for text in c.kwargs["documents"]]
+        assert written == [doc.page_content for doc in docs]
+
+    def test_reports_progress(self, mock_store):
+        """Test progress callback receives each stored batch size."""
+        progress = []
+
+        ingest_documents(make_docs(7), batch_size=3, on_progress=progress.append)
+
+        assert progress == [3, 3, 1]
+
+    def test_empty_input(self, mock_store):
+        """Test nothing is written for empty input."""
+        assert ingest_documents([], batch_size=3) == 0
+        mock_store._collection.add.assert_not_called()
+
+    def test_embedding_error_propagates(self, mock_store):
+        """Test an embedding failure is raised to the caller."""
+        mock_store.embeddings.embed_documents.side_effect = RuntimeError("ollama down")
+
+        with pytest.raises(RuntimeError, match="ollama down"):
+            ingest_documents(make_docs(50), batch_size=2, max_workers=2, queue_size=1)
+
+    def test_producer_error_propagates(self, mock_store):
+        """Test a failure while iterating the input is raised to the caller."""
+        def broken():
+            yield from make_docs(3)
+            raise ValueError("bad chunk")
+
+        with pytest.raises(ValueError, match="bad chunk"):
+            ingest_documents(broken(), batch_size=2)
+
+    def test_duplicate_chunks_embedded_once(self, mock_store):
+        """Test identical chunk texts share one embedding but are all stored."""
+        docs = [
+            Document(page_content=text, metadata={"chunk_index": i})
+            for i, text in enumerate(["license", "body a", "license", "body b", "license"])
+        ]
+
+        stored = ingest_documents(docs, batch_size=5)
+
+        assert stored == 5
+        embedded = [t for c in mock_store.embeddings.embed_documents.call_args_list for t in c.args[0]]
+        assert embedded == ["license", "body a", "body b"]
+
+        call = mock_store._collection.add.call_args
+        assert call.kwargs["documents"] == [doc.page_content for doc in docs]
+        assert call.kwargs["embeddings"].tolist() == [[7.0], [6.0], [7.0], [6.0], [7.0]]
+
+
+class TestEmbedBatchSize:
+    """Test deriving the embedding batch size from the recorded dimension."""
+
+    @pytest.fixture(autouse=True)
+    def persist_dir(self, tmp_path, monkeypatch):
+        """Point the Chroma persist directory at a temporary path."""
+        monkeypatch.setattr(ingest.settings, "CHROMA_PERSIST_DIR", str(tmp_path))
+        monkeypatch.setattr(ingest.settings, "EMBED_BATCH_SIZE", 0)
+
+    @pytest.mark.parametrize("dim, expected", [(1024, 256), (768, 341), (384, 512), (32768, 16)])
+    def test_sized_from_recorded_dim(self, dim, expected):
+        """Test batches target ~1 MiB of float32 vectors, clamped to 16-512."""
+        ingest.save_embedding_dim(dim)
+
+        assert ingest.load_embedding_dim() == dim
+        assert ingest.default_embed_batch_size() == expected
+
+    def test_unknown_dim_uses_default(self):
+        """Test the fallback when setup_vectorstore has not run."""
+        assert ingest.load_embedding_dim() is None
+        assert ingest.default_embed_batch_size() == 256
+
+    def test_dim_for_other_model_ignored(self, monkeypatch):
+        """Test a dimension recorded for another model is not reused."""
+        ingest.save_embedding_dim(384)
+        monkeypatch.setattr(ingest.settings, "EMBEDDING_MODEL", "other-embedder")
+
+        assert ingest.load_embedding_dim() is None
+
+    def test_explicit_setting_wins(self, monkeypatch):
+        """Test a configured EMBED_BATCH_SIZE overrides the derived size."""
+        ingest.save_embedding_dim(384)
+        monkeypatch.setattr(ingest.settings, "EMBED_BATCH_SIZE", 64)
+
+        assert ingest.default_embed_batch_size() == 64
+
+
+class TestAddEmbeddings:
+    """Test the add_embeddings helper in chroma_store."""
+
+    def test_writes_precomputed_vectors(self, mock_store):
+        """Test vectors are passed through without re-embedding."""
+        from src.vectorstore.chroma_store import add_embeddings
+
+        ids = add_embeddings(["a", "b"], [[1.0], [2.0]], [{"k": 1}, {"k": 2}])
+
+        assert len(ids) == 2
+        mock_store.embeddings.embed_documents.assert_not_called()
+        mock_store._collection.add.assert_called_once_with(
+            ids=ids,
+            embeddings=[[1.0], [2.0]],
+            documents=["a", "b"],
+            metadatas=[{"k": 1}, {"k": 2}],
+        )
+
+
+class TestGetRawCollection:
+    """Test the ingest-only raw collection handle."""
+
+    def test_collection_has_no_embedding_function(self, tmp_path, monkeypatch):
+        """Test writes without vectors are rejected instead of embedded."""
+        from src.vectorstore import chroma_store
+
+        monkeypatch.setattr(chroma_store.settings, "CHROMA_PERSIST_DIR", str(tmp_path))
+        monkeypatch.setattr(chroma_store, "_raw_collection", None)
+
+        collection = chroma_store.get_raw_collection()
+
+        assert chroma_store.get_raw_collection() is collection
+        collection.add(ids=["a"], embeddings=[[1.0, 0.0]], documents=["text"])
+        assert collection.count() == 1
+        with pytest.raises(ValueError):
+            collection.add(ids=["b"], documents=["needs embedding"])
+
+
+class TestEmbedQuery:
+    """Test the shared question embedding used by retrieval and grading."""
+
+    @pytest.fixture
+    def store(self):
+        """Vector store whose embedder returns a fixed query vector."""
+        from src.vectorstore import chroma_store
+
+        store = MagicMock()
+        store.embeddings.embed_query.return_value = [0.5, 0.5]
+        store.similarity_search_by_vector.return_value = [Document(page_content="hit")]
+        chroma_store._embed_query.cache_clear()
+        with patch('src.vectorstore.chroma_store.get_vector_store', return_value=store):
+            yield store
+        chroma_store._embed_query.cache_clear()
+
+    def test_search_embeds_question_once(self, store):
+        """Test retrieval and later lookups share one embedding request."""
+        from src.vectorstore.chroma_store import embed_query, similarity_search
+
+        results = similarity_search("What is LangGraph?", k=2)
+
+        assert [doc.page_content for doc in results] == ["hit"]
+        store.similarity_search_by_vector.assert_called_once_with([0.5, 0.5], k=2)
+        assert embed_query("What is LangGraph?") == [0.5, 0.5]
+        store.embeddings.embed_query.assert_called_once_with("What is LangGraph?")
+
+    def test_cache_keyed_by_model(self, store, monkeypatch):
+        """Test switching embedding models re-embeds the question."""
+        from src.vectorstore import chroma_store
+
+        chroma_store.embed_query("What is LangGraph?")
+        monkeypatch.setattr(chroma_store.settings, "EMBEDDING_MODEL", "other-embedder")
+        chroma_store.embed_query("What is LangGraph?")
+
+        assert store.embeddings.embed_query.call_count == 2
@@ -11,16 +11,21 @@ Tests cover:
 - check_usefulness
 """
 
+import threading
+
 import pytest
 from langchain_core.documents import Document
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
+from src.graph import nodes
 from src.graph.nodes import (
     retrieve,
     grade_documents,
+    agrade_documents,
     generate,
     transform_query,
     web_search,
+    aweb_search,
     check_hallucination,
     check_usefulness
 )
@@ -150,6 +155,50 @@ class TestGradeDocumentsNode:
         assert "yes" in result["relevance_scores"]
         assert "no" in result["relevance_scores"]
 
+    @pytest.mark.asyncio
+    @patch('src.agents.graders.DocumentGrader')
+    async def test_agrade_documents_uses_async_batch(self, mock_grader_class):
+        """Test the async node grades through agrade_batch."""
+        mock_grader = Mock()
+        mock_grader.agrade_batch = AsyncMock(return_value=["no", "yes"])
+        mock_grader_class.return_value = mock_grader
+
+        documents = [
+            Document(page_content="Irrelevant content", metadata={"source": "test1"}),
+            Document(page_content="Relevant content", metadata={"source": "test2"})
+        ]
+        state: GraphState = {
+            "question": "What is LangGraph?",
+            "generation": "",
+            "web_search_needed": "No",
+            "documents": documents,
+            "retry_count": 0,
+            "relevance_scores": [],
+            "hallucination_check": "",
+            "usefulness_check": ""
+        }
+
+        result = await agrade_documents(state)
+
+        assert result == {"relevance_scores": ["no", "yes"]}
+        mock_grader.agrade_batch.assert_awaited_once_with("What is LangGraph?", documents)
+        mock_grader.grade_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('src.agents.graders.DocumentGrader')
+    async def test_agrade_documents_falls_back_on_error(self, mock_grader_class):
+        """Test async grading failures mark every document relevant."""
+        mock_grader = Mock()
+        mock_grader.agrade_batch = AsyncMock(side_effect=Exception("Ollama down"))
+        mock_grader_class.return_value = mock_grader
+
+        state = {
+            "question": "What is LangGraph?",
+            "documents": [Document(page_content="a"), Document(page_content="b")],
+        }
+
+        assert await agrade_documents(state) == {"relevance_scores": ["yes", "yes"]}
+
 
 class TestGenerateNode:
     """Test the generate node."""
@@ -235,6 +284,8 @@ class TestTransformQueryNode:
         assert len(result["question"]) > 0
         assert "retry_count" in result
         assert result["retry_count"] == 1
+        # The question already failed retrieval, so it is always rewritten
+        mock_rewriter.rewrite.assert_called_once_with("What is LangGraph?", force=True)
 
     @patch('src.agents.rewriter.QueryRewriter')
     def test_transform_query_increments_retry(self, mock_rewriter_class):
@@ -260,6 +311,136 @@ class TestTransformQueryNode:
         assert result["retry_count"] == 3
 
 
+    @patch('src.agents.rewriter.QueryRewriter')
+    def test_transform_query_reuses_rewriter(self, mock_rewriter_class):
+        """Test the rewriter is constructed once across node executions."""
+        mock_rewriter_class.return_value.rewrite.return_value = "Improved question"
+        state: GraphState = {
+            "question": "Original question",
+            "generation": "",
+            "web_search_needed": "No",
+            "documents": [],
+            "retry_count": 0,
+            "relevance_scores": [],
+            "hallucination_check": "",
+            "usefulness_check": ""
+        }
+
+        transform_query(state)
+        transform_query(state)
+
+        mock_rewriter_class.assert_called_once_with()
+        assert mock_rewriter_class.return_value.rewrite.call_count == 2
+
+
+class TestWebSearchPrefetch:
+    """Test speculative web searches started by retrieve."""
+
+    @pytest.fixture(autouse=True)
+    def prefetch_enabled(self, monkeypatch):
+        """Enable prefetching with an empty registry."""
+        monkeypatch.setattr(nodes.settings, "WEB_SEARCH_PREFETCH", True)
+        nodes._prefetched_searches.clear()
+        yield
+        nodes._prefetched_searches.clear()
+
+    @patch('src.graph.nodes.similarity_search', return_value=[])
+    @patch('src.agents.web_searcher.WebSearcher')
+    def test_web_search_reuses_prefetch(self, mock_searcher_class, mock_similarity_search):
+        """Test the web_search node waits on the search retrieve started."""
+        web_docs = [Document(page_content="Web result", metadata={"source": "web"})]
+        mock_searcher = Mock()
+        mock_searcher.is_available.return_value = True
+        mock_searcher.search.return_value = web_docs
+        mock_searcher_class.return_value = mock_searcher
+        state = {"question": "Latest developments in AI", "documents": []}
+
+        retrieve(state)
+        result = web_search(state)
+
+        assert result == {"documents": web_docs, "web_search_needed": "Yes"}
+        mock_searcher.search.assert_called_once_with(
+            question="Latest developments in AI", max_results=nodes.settings.WEB_SEARCH_MAX_RESULTS
+        )
+        assert not nodes._prefetched_searches
+
+    @patch('src.graph.nodes.similarity_search', return_value=[])
+    @patch('src.graph.nodes._search_web', return_value=[])
+    def test_prefetch_disabled(self, mock_search_web, mock_similarity_search, monkeypatch):
+        """Test retrieve starts no web search unless WEB_SEARCH_PREFETCH is set."""
+        monkeypatch.setattr(nodes.settings, "WEB_SEARCH_PREFETCH", False)
+
+        retrieve({"question": "What is LangGraph?", "documents": []})
+
+        mock_search_web.assert_not_called()
+
+    @patch('src.graph.nodes.similarity_search', return_value=[])
+    @patch('src.agents.generator.AnswerGenerator')
+    @patch('src.agents.web_searcher.WebSearcher')
+    def test_local_answer_discards_prefetch(
+        self, mock_searcher_class, mock_generator_class, mock_similarity_search
+    ):
+        """Test a run answered locally leaves no search for the next run."""
+        mock_searcher = mock_searcher_class.return_value
+        mock_searcher.is_available.return_value = True
+        mock_searcher.search.side_effect = [
+            [Document(page_content="First run", metadata={"source": "web"})],
+            [Document(page_content="Second run", metadata={"source": "web"})],
+        ]
+        mock_generator_class.return_value.generate_stream.return_value = iter(["Answer"])
+        question = "Latest developments in AI"
+        local_docs = [Document(page_content="Local", metadata={"source": "test"})]
+
+        retrieve({"question": question, "documents": []})
+        nodes._prefetched_searches[question][0].result()
+        generate({"question": question, "documents": local_docs, "regeneration_count": 0})
+        retrieve({"question": question, "documents": []})
+        result = web_search({"question": question, "documents": []})
+
+        assert result["documents"][0].page_content == "Second run"
+        assert mock_searcher.search.call_count == 2
+
+    def test_expired_prefetch_replaced(self, monkeypatch):
+        """Test a prefetch older than the result TTL is not reused."""
+        monkeypatch.setattr(nodes.settings, "WEB_RESULT_CACHE_TTL_SECONDS", 60.0)
+        clock = [1000.0]
+        monkeypatch.setattr(nodes.time, "monotonic", lambda: clock[0])
+
+        with patch('src.graph.nodes._search_web', side_effect=[["old"], ["new"]]) as search:
+            nodes._prefetch_web_search("What is LangGraph?")
+            nodes._prefetched_searches["What is LangGraph?"][0].result()
+            clock[0] += 61
+            nodes._prefetch_web_search("What is LangGraph?")
+            future = nodes._take_prefetched_web_search("What is LangGraph?")
+
+        assert future.result() == ["new"]
+        assert search.call_count == 2
+
+    def test_failed_prefetch_replaced(self):
+        """Test a failed prefetch is retried rather than reused."""
+        with patch('src.graph.nodes._search_web', side_effect=[RuntimeError("down"), ["new"]]):
+            nodes._prefetch_web_search("What is LangGraph?")
+            first, _ = nodes._prefetched_searches["What is LangGraph?"]
+            with pytest.raises(RuntimeError):
+                first.result()
+            nodes._prefetch_web_search("What is LangGraph?")
+            future = nodes._take_prefetched_web_search("What is LangGraph?")
+
+        assert future.result() == ["new"]
+
+    def test_stale_prefetches_cancelled(self):
+        """Test prefetches beyond the limit are dropped oldest first."""
+        release = threading.Event()
+        with patch('src.graph.nodes._search_web', side_effect=lambda q: release.wait(2) and []):
+            for i in range(nodes._PREFETCH_LIMIT + 3):
+                nodes._prefetch_web_search(f"question {i}")
+            release.set()
+
+        assert len(nodes._prefetched_searches) == nodes._PREFETCH_LIMIT
+        assert "question 0" not in nodes._prefetched_searches
+        assert nodes._take_prefetched_web_search("question 0") is None
+
+
 class TestWebSearchNode:
     """Test the web_search node."""
 
@@ -319,6 +500,41 @@ class TestWebSearchNode:
         assert result["web_search_needed"] == "No"
 
 
+    @pytest.mark.asyncio
+    @patch('src.agents.web_searcher.WebSearcher')
+    async def test_aweb_search_uses_async_search(self, mock_searcher_class):
+        """Test the async node searches through asearch."""
+        documents = [Document(page_content="Web result", metadata={"source": "web1"})]
+        mock_searcher = Mock()
+        mock_searcher.is_available.return_value = True
+        mock_searcher.asearch = AsyncMock(return_value=documents)
+        mock_searcher_class.return_value = mock_searcher
+
+        result = await aweb_search({"question": "Latest developments in AI"})
+
+        assert result == {"documents": documents, "web_search_needed": "Yes"}
+        mock_searcher.asearch.assert_awaited_once()
+        mock_searcher.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('src.agents.web_searcher.WebSearcher')
+    async def test_aweb_search_awaits_prefetch(self, mock_searcher_class, monkeypatch):
+        """Test a prefetched search is awaited instead of searching again."""
+        documents = [Document(page_content="Prefetched", metadata={"source": "web1"})]
+        prefetched = nodes.Future()
+        prefetched.set_result(documents)
+        monkeypatch.setattr(nodes, "_take_prefetched_web_search", lambda question: prefetched)
+        mock_searcher = Mock()
+        mock_searcher.is_available.return_value = True
+        mock_searcher.asearch = AsyncMock()
+        mock_searcher_class.return_value = mock_searcher
+
+        result = await aweb_search({"question": "Latest developments in AI"})
+
+        assert result["documents"] == documents
+        mock_searcher.asearch.assert_not_awaited()
+
+
 class TestCheckHallucinationNode:
     """Test the check_hallucination node."""
 
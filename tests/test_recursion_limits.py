@@ -217,7 +217,7 @@ class TestRecursionLimitConfiguration:
 class TestRecursionLimitErrorRecovery:
     """Test graceful error recovery for recursion limit errors."""
 
-    @patch('src.graph.workflow.AgenticRAGWorkflow._build_workflow')
+    @patch.object(AgenticRAGWorkflow, '_build_workflow')
     def test_workflow_catches_recursion_limit_error(self, mock_build_workflow):
         """Test that workflow catches recursion limit errors and returns fallback."""
         # Create a mock workflow that raises recursion limit error
@@ -234,7 +234,7 @@ class TestRecursionLimitErrorRecovery:
         assert "apologize" in result["generation"].lower()
         assert result.get("error") == "recursion_limit_exceeded"
 
-    @patch('src.graph.workflow.AgenticRAGWorkflow._build_workflow')
+    @patch.object(AgenticRAGWorkflow, '_build_workflow')
     def test_workflow_reraises_non_recursion_errors(self, mock_build_workflow):
         """Test that workflow re-raises non-recursion errors."""
         # Create a mock workflow that raises a different error
@@ -248,7 +248,7 @@ class TestRecursionLimitErrorRecovery:
         with pytest.raises(Exception, match="Some other error"):
             workflow.run("Test question")
 
-    @patch('src.graph.workflow.AgenticRAGWorkflow._build_workflow')
+    @patch.object(AgenticRAGWorkflow, '_build_workflow')
     def test_fallback_response_includes_helpful_message(self, mock_build_workflow):
         """Test that fallback response includes helpful troubleshooting message."""
         mock_workflow = Mock()
@@ -264,7 +264,7 @@ class TestRecursionLimitErrorRecovery:
         assert "Rephrasing your question" in generation or "rephrase" in generation.lower()
         assert "Breaking complex questions" in generation or "simpler parts" in generation.lower()
 
-    @patch('src.graph.workflow.AgenticRAGWorkflow._build_workflow')
+    @patch.object(AgenticRAGWorkflow, '_build_workflow')
     def test_fallback_response_preserves_metadata(self, mock_build_workflow):
         """Test that fallback response preserves initial state metadata."""
         mock_workflow = Mock()
@@ -319,7 +319,7 @@ class TestStatePersistence:
         # the workflow can be created without errors
         assert workflow is not None
 
-    @patch('src.graph.workflow.AgenticRAGWorkflow._build_workflow')
+    @patch.object(AgenticRAGWorkflow, '_build_workflow')
     def test_regeneration_count_persists_in_error_case(self, mock_build_workflow):
         """Test that regeneration_count is preserved in error fallback."""
         mock_workflow = Mock()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the query rewriter.
+
+Tests cover:
+- Relevance mask conversion
+- Rewrite decisions from score lists and masks
+- Skipping the LLM for already-specific questions
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.agents import rewriter as rewriter_module
+from src.agents.rewriter import QueryRewriter, relevance_mask
+
+
+class TestRelevanceMask:
+    """Test converting relevance scores to a 0/1 array."""
+
+    def test_converts_scores(self):
+        """Test only "yes" counts as relevant."""
+        mask = relevance_mask(["yes", "no", "yes", "maybe"])
+
+        assert mask.dtype == np.uint8
+        assert mask.tolist() == [1, 0, 1, 0]
+
+    def test_array_passed_through(self):
+        """Test an existing mask is not converted again."""
+        mask = np.array([1, 0], dtype=np.uint8)
+
+        assert relevance_mask(mask) is mask
+
+
+class TestShouldRewrite:
+    """Test the rewrite decision."""
+
+    @pytest.fixture
+    def rewriter(self):
+        """Create a rewriter; should_rewrite makes no LLM calls."""
+        return QueryRewriter()
+
+    @pytest.mark.parametrize("scores, expected", [
+        ([], True),
+        (["no", "no", "no", "no"], True),
+        (["yes", "no", "no", "no"], True),
+        (["yes", "yes", "no", "no"], False),
+        (["yes", "yes", "yes", "yes"], False),
+    ])
+    def test_scores_and_masks_agree(self, rewriter, scores, expected):
+        """Test score lists and their masks give the same decision."""
+        assert rewriter.should_rewrite("q", scores) is expected
+        assert rewriter.should_rewrite("q", relevance_mask(scores)) is expected
+
+
+class TestSpecificQuestions:
+    """Test the pre-filter that skips rewriting specific questions."""
+
+    SPECIFIC = "How does the Agentic RAG workflow decide when to fall back to web search results?"
+
+    @pytest.fixture
+    def rewriter(self):
+        """Create a rewriter whose chain must not be called."""
+        rewriter = QueryRewriter()
+        rewriter.chain = Mock()
+        rewriter.chain.invoke.return_value = "rewritten question"
+        return rewriter
+
+    def test_specific_question_returned_unchanged(self, rewriter, monkeypatch):
+        """Test a long, specific question skips the LLM call."""
+        monkeypatch.setattr("src.agents.rewriter.settings.REWRITER_MIN_SPECIFIC_WORDS", 12)
+
+        assert rewriter.rewrite(self.SPECIFIC) == self.SPECIFIC
+        rewriter.chain.invoke.assert_not_called()
+
+    @pytest.mark.parametrize("question", [
+        "How does it work?",
+        "How does it decide when to fall back to web search for questions about the documents?",
+    ])
+    def test_short_or_vague_question_rewritten(self, rewriter, monkeypatch, question):
+        """Test short questions and pronoun subjects still go to the LLM."""
+        monkeypatch.setattr("src.agents.rewriter.settings.REWRITER_MIN_SPECIFIC_WORDS", 12)
+
+        assert rewriter.rewrite(question) == "rewritten question"
+
+    def test_force_rewrites_specific_question(self, rewriter, monkeypatch):
+        """Test force=True bypasses the pre-filter."""
+        monkeypatch.setattr("src.agents.rewriter.settings.REWRITER_MIN_SPECIFIC_WORDS", 12)
+
+        assert rewriter.rewrite(self.SPECIFIC, force=True) == "rewritten question"
+
+    def test_history_rewrites_specific_question(self, rewriter, monkeypatch):
+        """Test rewrite_with_history bypasses the pre-filter after failed attempts."""
+        monkeypatch.setattr("src.agents.rewriter.settings.REWRITER_MIN_SPECIFIC_WORDS", 12)
+        rewriter_module._get_rewrite_cache.cache_clear()
+
+        improved = rewriter.rewrite_with_history(
+            self.SPECIFIC, [self.SPECIFIC], [["no", "no", "no", "no"]]
+        )
+
+        assert improved == "rewritten question"
+        rewriter.chain.invoke.assert_called_once()
+
+    def test_zero_always_rewrites(self, rewriter, monkeypatch):
+        """Test REWRITER_MIN_SPECIFIC_WORDS=0 disables the pre-filter."""
+        monkeypatch.setattr("src.agents.rewriter.settings.REWRITER_MIN_SPECIFIC_WORDS", 0)
+
+        assert rewriter.rewrite(self.SPECIFIC) == "rewritten question"
@@ -0,0 +1,525 @@
+"""
+Unit tests for the web searcher.
+
+Tests cover:
+- Concurrent provider queries
+- Provider preference and failure handling
+- Semantic cache of optimized search queries
+- Sharing results between identical searches
+- Keyword queries for short questions
+- Adaptive bypass of the query LLM
+- Persistent query cache in ChromaDB
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+from langchain_core.documents import Document
+
+from src.agents import web_searcher
+from src.agents.web_searcher import WebSearcher
+
+
+def make_docs(engine, n=2):
+    """Create n search results attributed to an engine."""
+    return [
+        Document(page_content=f"{engine} result {i}", metadata={"search_engine": engine})
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def fresh_result_cache():
+    """Keep search results from leaking between tests."""
+    web_searcher._get_result_cache.cache_clear()
+    yield
+    web_searcher._get_result_cache.cache_clear()
+
+
+@pytest.fixture
+def searcher():
+    """WebSearcher with both providers enabled and query optimization bypassed."""
+    searcher = WebSearcher()
+    searcher.tavily_available = True
+    searcher.ddg_available = True
+    searcher._optimize_search_query = lambda question: question
+    return searcher
+
+
+class TestConcurrentSearch:
+    """Test querying the search providers concurrently."""
+
+    def test_providers_run_concurrently(self, searcher):
+        """Test both providers are in flight at the same time."""
+        both_started = threading.Barrier(2, timeout=2)
+
+        def tavily(query, max_results):
+            both_started.wait()
+            return make_docs("tavily")
+
+        def duckduckgo(query, max_results):
+            both_started.wait()
+            return []
+
+        with patch.object(searcher, "_search_tavily", side_effect=tavily), \
+                patch.object(searcher, "_search_duckduckgo", side_effect=duckduckgo):
+            documents = searcher.search("What is LangGraph?")
+
+        assert documents == make_docs("tavily")
+
+    def test_first_non_empty_result_wins(self, searcher):
+        """Test a fast provider is not held up by a slow one."""
+        release = threading.Event()
+
+        def slow_tavily(query, max_results):
+            release.wait(2)
+            return make_docs("tavily")
+
+        with patch.object(searcher, "_search_tavily", side_effect=slow_tavily), \
+                patch.object(searcher, "_search_duckduckgo", return_value=make_docs("duckduckgo")):
+            start = time.monotonic()
+            documents = searcher.search("What is LangGraph?")
+            elapsed = time.monotonic() - start
+        release.set()
+
+        assert documents == make_docs("duckduckgo")
+        assert elapsed < 1
+
+    def test_failed_provider_falls_through(self, searcher):
+        """Test a failing provider does not fail the search."""
+        with patch.object(searcher, "_search_tavily", side_effect=Exception("quota exceeded")), \
+                patch.object(searcher, "_search_duckduckgo", return_value=make_docs("duckduckgo")):
+            assert searcher.search("What is LangGraph?") == make_docs("duckduckgo")
+
+    def test_all_providers_fail(self, searcher):
+        """Test an error is raised when no provider returns results."""
+        with patch.object(searcher, "_search_tavily", return_value=[]), \
+                patch.object(searcher, "_search_duckduckgo", side_effect=Exception("rate limited")):
+            with pytest.raises(Exception, match="Web search failed"):
+                searcher.search("What is LangGraph?")
+
+    def test_single_provider(self, searcher):
+        """Test search works with only one provider configured."""
+        searcher.tavily_available = False
+
+        with patch.object(searcher, "_search_duckduckgo", return_value=make_docs("duckduckgo")):
+            assert searcher.search("What is LangGraph?") == make_docs("duckduckgo")
+
+
+    def test_provider_threads_reused(self, searcher):
+        """Test searches share one provider thread pool."""
+        threads = set()
+
+        def record(query, max_results):
+            threads.add(threading.current_thread().name)
+            return make_docs("tavily")
+
+        with patch.object(searcher, "_search_tavily", side_effect=record), \
+                patch.object(searcher, "_search_duckduckgo", return_value=[]):
+            for _ in range(5):
+                searcher.search("What is LangGraph?")
+
+        assert all(name.startswith("web-search") for name in threads)
+        assert len(threads) <= web_searcher._SEARCH_WORKERS
+
+class TestTavilySearch:
+    """Test Tavily searches through the shared HTTP session."""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        """Replace the shared session with a mock returning two results."""
+        session = Mock()
+        session.post.return_value = Mock(content=(
+            b'{"results": [{"url": "https://a", "title": "A", "content": "first", "score": 0.9},'
+            b' {"url": "https://b", "title": "B", "content": "second", "score": 0.5}]}'
+        ))
+        monkeypatch.setattr(web_searcher, "_get_http_session", lambda: session)
+        monkeypatch.setattr(web_searcher.settings, "TAVILY_API_KEY", "tvly-test")
+        return session
+
+    def test_posts_to_search_endpoint(self, searcher, session):
+        """Test the query and key are posted and results become Documents."""
+        documents = searcher._search_tavily("LangGraph", 2)
+
+        call = session.post.call_args
+        assert call.args[0] == "https://api.tavily.com/search"
+        assert call.kwargs["headers"]["Authorization"] == "Bearer tvly-test"
+        assert b'"max_results":2' in call.kwargs["data"]
+        assert [doc.page_content for doc in documents] == ["first", "second"]
+        assert documents[0].metadata == {
+            "source": "https://a", "title": "A", "score": 0.9, "search_engine": "tavily",
+        }
+
+    def test_session_shared(self):
+        """Test every search reuses one pooled session."""
+        web_searcher._get_http_session.cache_clear()
+
+        assert web_searcher._get_http_session() is web_searcher._get_http_session()
+
+    def test_malformed_response_raised(self, searcher, session):
+        """Test a response missing result fields fails the Tavily search."""
+        session.post.return_value = Mock(content=b'{"results": [{"title": "A"}]}')
+
+        with pytest.raises(Exception, match="Tavily search error"):
+            searcher._search_tavily("LangGraph", 2)
+
+    def test_http_error_raised(self, searcher, session):
+        """Test an error status fails the Tavily search."""
+        session.post.return_value.raise_for_status.side_effect = Exception("401 Unauthorized")
+
+        with pytest.raises(Exception, match="Tavily search error"):
+            searcher._search_tavily("LangGraph", 2)
+
+
+class TestQueryCache:
+    """Test reuse of optimized queries for near-identical questions."""
+
+    VECTORS = {
+        "What is LangGraph?": [1.0, 0.0, 0.0],
+        "what is langgraph": [0.99, 0.1, 0.0],
+        "How do I bake bread?": [0.0, 1.0, 0.0],
+    }
+
+    @pytest.fixture(autouse=True)
+    def query_cache(self, monkeypatch):
+        """Fresh query cache and deterministic question embeddings."""
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", True)
+        monkeypatch.setattr(web_searcher.settings, "FAST_QUERY_OPT", False)
+        monkeypatch.setattr(
+            web_searcher, "_embed_question",
+            lambda q: np.asarray(self.VECTORS[q], dtype=np.float32) / np.linalg.norm(self.VECTORS[q]),
+        )
+        web_searcher._get_query_cache.cache_clear()
+        web_searcher._get_exact_query_cache.cache_clear()
+        yield
+        web_searcher._get_query_cache.cache_clear()
+        web_searcher._get_exact_query_cache.cache_clear()
+
+    @pytest.fixture
+    def searcher(self):
+        """WebSearcher whose query LLM returns a fixed query."""
+        searcher = WebSearcher()
+        searcher.llm = Mock()
+        searcher.llm.invoke.return_value = Mock(content="LangGraph overview")
+        return searcher
+
+    def test_paraphrase_reuses_query(self, searcher):
+        """Test a near-identical question skips the LLM."""
+        assert searcher._optimize_search_query("What is LangGraph?") == "LangGraph overview"
+        assert searcher._optimize_search_query("what is langgraph") == "LangGraph overview"
+
+        searcher.llm.invoke.assert_called_once()
+        assert searcher.cache_stats["hits"] == 1
+
+    def test_different_question_misses(self, searcher):
+        """Test an unrelated question gets its own query."""
+        searcher._optimize_search_query("What is LangGraph?")
+        searcher._optimize_search_query("How do I bake bread?")
+
+        assert searcher.llm.invoke.call_count == 2
+
+    def test_disabled(self, searcher, monkeypatch):
+        """Test WEB_QUERY_CACHE=false calls the LLM for paraphrases."""
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", False)
+
+        searcher._optimize_search_query("What is LangGraph?")
+        searcher._optimize_search_query("what is langgraph")
+
+        assert searcher.llm.invoke.call_count == 2
+
+    def test_identical_question_skips_embedding(self, searcher, monkeypatch):
+        """Test a repeated question is served before any embedding request."""
+        embed = Mock(side_effect=lambda q: np.asarray(self.VECTORS[q], dtype=np.float32))
+        monkeypatch.setattr(web_searcher, "_embed_question", embed)
+
+        searcher._optimize_search_query("What is LangGraph?")
+        assert searcher._optimize_search_query("What is LangGraph?") == "LangGraph overview"
+
+        searcher.llm.invoke.assert_called_once()
+        embed.assert_called_once()
+
+    def test_exact_cache_without_semantic_cache(self, searcher, monkeypatch):
+        """Test identical questions are cached even with WEB_QUERY_CACHE=false."""
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", False)
+
+        searcher._optimize_search_query("What is LangGraph?")
+        searcher._optimize_search_query("What is LangGraph?")
+
+        searcher.llm.invoke.assert_called_once()
+
+
+class TestWebSearchHelper:
+    """Test the module-level web_search convenience function."""
+
+    def test_reuses_one_searcher(self, monkeypatch):
+        """Test repeated calls share a single WebSearcher."""
+        searcher_class = Mock()
+        monkeypatch.setattr(web_searcher, "WebSearcher", searcher_class)
+        web_searcher._get_web_searcher.cache_clear()
+        try:
+            web_searcher.web_search("What is LangGraph?")
+            web_searcher.web_search("What is ChromaDB?", max_results=2)
+        finally:
+            web_searcher._get_web_searcher.cache_clear()
+
+        searcher_class.assert_called_once_with()
+        assert searcher_class.return_value.search.call_count == 2
+
+
+class TestSearchCoalescing:
+    """Test sharing provider calls between identical searches."""
+
+    def test_concurrent_identical_searches_share_one_call(self, searcher):
+        """Test searches started while one is running wait for its results."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_tavily(query, max_results):
+            started.set()
+            release.wait(5)
+            return make_docs("tavily")
+
+        searcher._search_tavily = Mock(side_effect=slow_tavily)
+        searcher.ddg_available = False
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(searcher.search("LangGraph")))
+        leader.start()
+        assert started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(searcher.search("LangGraph")))
+            for _ in range(3)
+        ]
+        for thread in followers:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert searcher._search_tavily.call_count == 1
+        assert len(results) == 4
+        assert all(r == make_docs("tavily") for r in results)
+
+    def test_results_reused_within_ttl(self, searcher):
+        """Test a repeated query is served from the result cache."""
+        searcher._search_tavily = Mock(return_value=make_docs("tavily"))
+        searcher.ddg_available = False
+
+        first = searcher.search("LangGraph")
+        first.append(Document(page_content="caller's own addition"))
+
+        assert searcher.search("LangGraph") == make_docs("tavily")
+        assert searcher._search_tavily.call_count == 1
+
+    def test_result_cache_disabled(self, searcher, monkeypatch):
+        """Test a zero TTL queries the providers every time."""
+        monkeypatch.setattr(web_searcher.settings, "WEB_RESULT_CACHE_TTL_SECONDS", 0.0)
+        searcher._search_tavily = Mock(return_value=make_docs("tavily"))
+        searcher.ddg_available = False
+
+        searcher.search("LangGraph")
+        searcher.search("LangGraph")
+
+        assert searcher._search_tavily.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_asearch_shares_search_path(self, searcher):
+        """Test asearch runs the regular search off the event loop."""
+        searcher._search_tavily = Mock(return_value=make_docs("tavily"))
+        searcher.ddg_available = False
+
+        assert await searcher.asearch("LangGraph") == make_docs("tavily")
+        assert searcher.search("LangGraph") == make_docs("tavily")
+        searcher._search_tavily.assert_called_once()
+
+    def test_failure_propagates_to_waiters(self, searcher):
+        """Test a failed search is not cached and does not block later searches."""
+        searcher._search_tavily = Mock(side_effect=Exception("down"))
+        searcher.ddg_available = False
+
+        with pytest.raises(Exception, match="all searches failed"):
+            searcher.search("LangGraph")
+
+        searcher._search_tavily = Mock(return_value=make_docs("tavily"))
+        assert searcher.search("LangGraph") == make_docs("tavily")
+        assert not web_searcher._inflight_searches
+
+
+class TestFastQueryOptimization:
+    """Test building search queries for short questions without the LLM."""
+
+    @pytest.fixture
+    def searcher(self, monkeypatch):
+        """WebSearcher with the keyword fast path enabled and no query cache."""
+        monkeypatch.setattr(web_searcher.settings, "FAST_QUERY_OPT", True)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", False)
+        web_searcher._get_exact_query_cache.cache_clear()
+        searcher = WebSearcher()
+        searcher.llm = Mock()
+        searcher.llm.invoke.return_value = Mock(content="LLM query")
+        yield searcher
+        web_searcher._get_exact_query_cache.cache_clear()
+
+    @pytest.mark.parametrize("question, expected", [
+        ("What is LangGraph?", "LangGraph"),
+        ("How does ChromaDB store embeddings?", "ChromaDB store embeddings"),
+        ("What's new in Python 3.12?", "new Python 3.12"),
+        ("Is C++ faster than Go for HTTP servers?", "C++ faster Go HTTP servers"),
+    ])
+    def test_short_question_uses_keywords(self, searcher, question, expected):
+        """Test short questions skip the LLM."""
+        assert searcher._optimize_search_query(question) == expected
+        searcher.llm.invoke.assert_not_called()
+
+    def test_long_question_uses_llm(self, searcher):
+        """Test questions over the word limit still go to the LLM."""
+        question = "How should I structure a LangGraph workflow that retries failed tool calls?"
+
+        assert searcher._optimize_search_query(question) == "LLM query"
+        searcher.llm.invoke.assert_called_once()
+
+    def test_keywords_capped(self):
+        """Test at most six keywords are kept."""
+        assert web_searcher._fast_optimize("alpha beta gamma delta epsilon zeta eta theta") == (
+            "alpha beta gamma delta epsilon zeta"
+        )
+
+    def test_disabled(self, searcher, monkeypatch):
+        """Test FAST_QUERY_OPT=false sends short questions to the LLM."""
+        monkeypatch.setattr(web_searcher.settings, "FAST_QUERY_OPT", False)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", False)
+        web_searcher._get_exact_query_cache.cache_clear()
+
+        assert searcher._optimize_search_query("What is LangGraph?") == "LLM query"
+
+
+class TestAdaptiveOptimization:
+    """Test bypassing the query LLM when it does not change queries."""
+
+    @pytest.fixture
+    def searcher(self, monkeypatch):
+        """WebSearcher with only the adaptive bypass in front of the LLM."""
+        monkeypatch.setattr(web_searcher.settings, "FAST_QUERY_OPT", False)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", False)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_OPT_ADAPTIVE", True)
+        web_searcher._get_exact_query_cache.cache_clear()
+        yield WebSearcher()
+        web_searcher._get_exact_query_cache.cache_clear()
+
+    @staticmethod
+    def question(i):
+        """A distinct question whose keywords are 'LangGraph feature<i>'."""
+        return f"What is the LangGraph feature{i}?"
+
+    def test_unhelpful_llm_is_bypassed(self, searcher):
+        """Test the LLM is skipped once its queries just echo the keywords."""
+        searcher.llm = Mock()
+        searcher.llm.invoke.side_effect = lambda prompt: Mock(
+            content=f"LangGraph feature{searcher.llm.invoke.call_count - 1}"
+        )
+
+        for i in range(20):
+            searcher._optimize_search_query(self.question(i))
+
+        assert searcher._optimize_search_query(self.question(20)) == "LangGraph feature20"
+        assert searcher.llm.invoke.call_count == 20
+
+    def test_helpful_llm_kept(self, searcher):
+        """Test the LLM stays on while it rewrites queries."""
+        searcher.llm = Mock()
+        searcher.llm.invoke.return_value = Mock(content="graph agent framework tutorial")
+
+        for i in range(25):
+            searcher._optimize_search_query(self.question(i))
+
+        assert searcher.llm.invoke.call_count == 25
+
+    def test_llm_probed_again(self, searcher, monkeypatch):
+        """Test the LLM is re-evaluated after the probe interval."""
+        monkeypatch.setattr(web_searcher, "_OPT_PROBE_INTERVAL", 2)
+        searcher._skip_opt = True
+        searcher.llm = Mock()
+        searcher.llm.invoke.return_value = Mock(content="graph agent framework tutorial")
+
+        for i in range(3):
+            searcher._optimize_search_query(self.question(i))
+
+        searcher.llm.invoke.assert_called_once()
+        assert not searcher._skip_opt
+
+
+class TestPersistentQueryCache:
+    """Test optimized queries persisted in a ChromaDB collection."""
+
+    @pytest.fixture(autouse=True)
+    def persist_dir(self, tmp_path, monkeypatch):
+        """Fresh in-memory caches and a query cache collection in a temporary directory."""
+        from src.vectorstore import chroma_store
+
+        monkeypatch.setattr(chroma_store.settings, "CHROMA_PERSIST_DIR", str(tmp_path))
+        monkeypatch.setattr(chroma_store, "_query_cache_collection", None)
+        monkeypatch.setattr(web_searcher.settings, "FAST_QUERY_OPT", False)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_OPT_ADAPTIVE", False)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE", True)
+        monkeypatch.setattr(web_searcher.settings, "WEB_QUERY_CACHE_PERSIST", True)
+        monkeypatch.setattr(
+            web_searcher, "_embed_question",
+            lambda q: np.asarray(TestQueryCache.VECTORS[q], dtype=np.float32)
+            / np.linalg.norm(TestQueryCache.VECTORS[q]),
+        )
+        self.clear_memory()
+        yield
+        self.clear_memory()
+
+    @staticmethod
+    def clear_memory():
+        """Drop the in-memory query caches, as after a restart."""
+        web_searcher._get_query_cache.cache_clear()
+        web_searcher._get_exact_query_cache.cache_clear()
+
+    @pytest.fixture
+    def searcher(self):
+        """WebSearcher whose query LLM returns a fixed query."""
+        searcher = WebSearcher()
+        searcher.llm = Mock()
+        searcher.llm.invoke.return_value = Mock(content="LangGraph overview")
+        return searcher
+
+    def test_query_survives_restart(self, searcher):
+        """Test a near-identical question after a restart skips the LLM."""
+        searcher._optimize_search_query("What is LangGraph?")
+        self.clear_memory()
+
+        assert searcher._optimize_search_query("what is langgraph") == "LangGraph overview"
+        searcher.llm.invoke.assert_called_once()
+
+    def test_different_question_misses(self, searcher):
+        """Test an unrelated question is not served from the collection."""
+        searcher._optimize_search_query("What is LangGraph?")
+        self.clear_memory()
+
+        searcher._optimize_search_query("How do I bake bread?")
+        assert searcher.llm.invoke.call_count == 2
+
+    def test_expired_entries_ignored(self, searcher, monkeypatch):
+        """Test a query older than the TTL is not reused."""
+        searcher._optimize_search_query("What is LangGraph?")
+        self.clear_memory()
+        later = time.time() + web_searcher.settings.WEB_QUERY_CACHE_PERSIST_TTL_SECONDS + 1
+        monkeypatch.setattr(web_searcher.time, "time", lambda: later)
+
+        searcher._optimize_search_query("what is langgraph")
+        assert searcher.llm.invoke.call_count == 2
+
+    def test_other_query_model_ignored(self, searcher, monkeypatch):
+        """Test queries written by another generation model are not reused."""
+        searcher._optimize_search_query("What is LangGraph?")
+        self.clear_memory()
+        monkeypatch.setattr(web_searcher.settings, "GENERATION_MODEL", "other-model")
+
+        searcher._optimize_search_query("what is langgraph")
+        assert searcher.llm.invoke.call_count == 2
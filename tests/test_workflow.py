@@ -12,6 +12,8 @@ Tests cover:
 import pytest
 from unittest.mock import Mock, patch
 from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
 
 from src.graph.workflow import AgenticRAGWorkflow
 from src.graph.state import GraphState
@@ -48,6 +50,14 @@ class TestWorkflowInitialization:
         for node in expected_nodes:
             assert node in info["nodes"]
 
+    def test_describe_graph_without_instance(self):
+        """Test graph description is available without building the workflow."""
+        with patch.object(AgenticRAGWorkflow, "_build_workflow") as mock_build:
+            info = AgenticRAGWorkflow.describe_graph()
+
+        mock_build.assert_not_called()
+        assert info == AgenticRAGWorkflow().get_graph_info()
+
 
 class TestHappyPath:
     """Test the happy path workflow."""
@@ -399,3 +409,48 @@ class TestSelfCorrectionMechanisms:
 
         mechanisms = info["self_correction_mechanisms"]
         assert any("Answer usefulness verification" in m for m in mechanisms)
+
+
+class TestStreamAnswer:
+    """Test token streaming of the generated answer."""
+
+    @patch('src.graph.nodes.similarity_search')
+    @patch('src.agents.graders.DocumentGrader')
+    @patch('src.graph.nodes.AnswerGenerator')
+    @patch('src.agents.graders.HallucinationGrader')
+    @patch('src.agents.graders.AnswerGrader')
+    def test_streams_generate_tokens(
+        self,
+        mock_answer_grader_class,
+        mock_hallucination_grader_class,
+        mock_generator_class,
+        mock_doc_grader_class,
+        mock_similarity_search
+    ):
+        """Test answer tokens arrive before the generate node completes."""
+        mock_similarity_search.return_value = [
+            Document(page_content="LangGraph content", metadata={"source": "test1"})
+        ]
+        mock_doc_grader_class.return_value.grade_batch.return_value = ["yes"]
+        mock_hallucination_grader_class.return_value.grade.return_value = "yes"
+        mock_answer_grader_class.return_value.grade.return_value = "yes"
+
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="LangGraph builds agents")]))
+        mock_generator_class.return_value.generate_stream.side_effect = (
+            lambda **kwargs: (chunk.content for chunk in llm.stream("prompt"))
+        )
+
+        events = list(AgenticRAGWorkflow().stream_answer("What is LangGraph?"))
+
+        tokens = [payload for kind, payload in events if kind == "token"]
+        assert "".join(tokens) == "LangGraph builds agents"
+        assert len(tokens) > 1
+
+        nodes = [next(iter(payload)) for kind, payload in events if kind == "node"]
+        assert nodes[-1] == "check_usefulness"
+        generate_index = next(
+            i for i, (kind, payload) in enumerate(events) if kind == "node" and "generate" in payload
+        )
+        first_token = next(i for i, (kind, _) in enumerate(events) if kind == "token")
+        assert first_token < generate_index
+        assert events[generate_index][1]["generate"]["generation"] == "LangGraph builds agents"